@@ -10,6 +10,7 @@ MIGRATE_ON_STARTUP=${MIGRATE_ON_STARTUP:-true}
 COLLECT_STATICFILES_ON_STARTUP=${COLLECT_STATICFILES_ON_STARTUP:-true}
 WATCH_GEOMANAGER_DATA_DIR=${WATCH_GEOMANAGER_DATA_DIR:-true}
 GEOMANAGER_AUTO_INGEST_RASTER_DATA_DIR=${GEOMANAGER_AUTO_INGEST_RASTER_DATA_DIR:-/climweb/geomanager/data}
+PRODUCT_INGESTION_WATCHER_ENABLED=${PRODUCT_INGESTION_WATCHER_ENABLED:-false}
 
 CLIMWEB_LOG_LEVEL=${CLIMWEB_LOG_LEVEL:-INFO}
 CLIMWEB_NUM_OF_CELERY_WORKERS=${CLIMWEB_NUM_OF_CELERY_WORKERS:-}
@@ -40,7 +41,12 @@ gunicorn            : Start ClimWeb using a prod ready gunicorn server:
                          * Binds to 0.0.0.0
 gunicorn-wsgi       : Same as gunicorn but runs a wsgi server
 celery-worker       : Start the celery worker queue which runs async tasks
+celery-thumbnails-worker : Start a single process celery worker for the
+                      DOCUMENT_THUMBNAIL_QUEUE queue (default: thumbnails)
 celery-beat         : Start the celery beat service used to schedule periodic jobs
+watch-product-files : Watch the product ingestion folders and publish new files as
+                      they land. Run a single instance, with
+                      PRODUCT_INGESTION_WATCHER_ENABLED=true.
 
 DEV COMMANDS:
 django-dev      : Start a normal Climweb backend django development server, performs
@@ -224,11 +230,27 @@ celery-worker)
     export OTEL_SERVICE_NAME="climweb-celery-worker"
     start_celery_worker -Q celery -n default-worker@%h "${@:2}"
     ;;
+celery-thumbnails-worker)
+    # PDF thumbnails are rendered by their own single process worker when
+    # DOCUMENT_THUMBNAIL_QUEUE is set, so slow renders never take a slot from
+    # the tasks of the default worker
+    startup_plugin_setup
+    export OTEL_SERVICE_NAME="climweb-celery-thumbnails-worker"
+    exec celery -A climweb worker -Q "${DOCUMENT_THUMBNAIL_QUEUE:-thumbnails}" --concurrency 1 -n thumbnails-worker@%h -l INFO "${@:2}"
+    ;;
 celery-beat)
     startup_plugin_setup
     export OTEL_SERVICE_NAME="climweb-celery-beat"
     exec celery -A climweb beat -l "${CLIMWEB_CELERY_BEAT_DEBUG_LEVEL}" -S django_celery_beat.schedulers:DatabaseScheduler "${@:2}"
     ;;
+watch-product-files)
+    startup_plugin_setup
+    if [ "${PRODUCT_INGESTION_WATCHER_ENABLED,,}" != "true" ]; then
+      echo "PRODUCT_INGESTION_WATCHER_ENABLED is not true, so the full product scan still runs every 5 minutes" >&2
+    fi
+    export OTEL_SERVICE_NAME="climweb-product-watcher"
+    exec climweb watch_product_files "${@:2}"
+    ;;
 install-plugin)
     exec /climweb/plugins/install_plugin.sh --runtime "${@:2}"
     ;;
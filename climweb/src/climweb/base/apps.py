@@ -14,3 +14,8 @@ class BaseConfig(AppConfig):
         # both the admin viewset hook and the StreamField block widget.
         _wmc_viewsets.viewset_factory = searchable_viewset_factory
         _wmc_blocks.viewset_factory = searchable_viewset_factory
+
+        # Serve site settings from a process-local cache, invalidated when any
+        # setting is saved. Importing the modules also connects their receivers.
+        from . import site_settings_cache, theme  # noqa
+        site_settings_cache.install()
@@ -1,5 +1,402 @@
-from django.core.cache import caches
+import hashlib
+import time
+from functools import wraps
 
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.template.response import SimpleTemplateResponse
+from django.utils.cache import get_cache_key, get_max_age
+from loguru import logger
+from wagtailcache.cache import FetchFromCacheMiddleware, UpdateCacheMiddleware
 from wagtailcache.settings import wagtailcache_settings
 
 wagcache = caches[wagtailcache_settings.WAGTAIL_CACHE_BACKEND]
+
+# Redis sets of the wagtail-cache keys that depend on a tag, e.g. 'page:12'.
+# Every tracked key is also added to the 'all' tag. Keys are added to the set
+# of the current time bucket, so sets stop growing once their bucket is over
+# and expire with the responses they point to, even for tags never purged.
+CACHE_TAG_KEY = "climweb:cache_tags:{tag}:{bucket}"
+ALL_PAGES_TAG = "all"
+# bucket length when the cache has no default timeout
+CACHE_TAG_TIMEOUT = 60 * 60 * 24
+
+# A copy of each cached value is kept for CACHE_STALE_TTL seconds after it
+# expires, and served while the single caller holding the lock renders it again
+CACHE_STALE_KEY = "climweb:stale:{key}"
+CACHE_LOCK_KEY = "climweb:cache_lock:{key}"
+# set in the WSGI environ of the background requests that render an expired page
+# again, where request headers cannot set it
+CACHE_REFRESH_ENVIRON_KEY = "climweb.cache_refresh"
+# how often requests waiting on another one's render check the cache
+CACHE_LOCK_POLL_INTERVAL = 0.1
+
+
+def new_cache_version():
+    # time based, so a version is never reused, even if its key has been evicted
+    # from Redis while data cached under it is still around
+    return time.time_ns()
+
+
+def get_cache_version(key):
+    """The current value of a version key, which the keys of versioned cached data include"""
+    return cache.get_or_set(key, new_cache_version, timeout=None)
+
+
+def bump_cache_version(key):
+    """Change a version key, so the data cached under its previous value is no longer read"""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = new_cache_version()
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def bump_cache_version_on_commit(key):
+    """
+    Bump a version key now, and again once the current transaction commits, in
+    case another process cached the old data under the new version in between.
+    """
+
+    def bump():
+        try:
+            bump_cache_version(key)
+        except Exception as e:
+            logger.warning(f"[CACHE] Could not bump the cache version {key}: {e}")
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def _redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection(wagtailcache_settings.WAGTAIL_CACHE_BACKEND)
+
+
+def page_cache_tag(page_id):
+    return f"page:{page_id}"
+
+
+def model_cache_tag(model):
+    """
+    Tag of the responses that list objects of a model, given as a model class
+    or an 'app_label.ModelName' label, e.g. 'model:partners.partner'
+    """
+    label = model if isinstance(model, str) else model._meta.label
+    return f"model:{label.lower()}"
+
+
+def _tag_bucket_seconds():
+    # a tracked response, and its stale copy, never outlive the next bucket
+    return (wagcache.default_timeout or CACHE_TAG_TIMEOUT) + settings.CACHE_STALE_TTL
+
+
+def _tag_keys(tag):
+    """The sets of the current and previous buckets, which hold every live key of the tag"""
+    bucket = int(time.time() // _tag_bucket_seconds())
+    return [CACHE_TAG_KEY.format(tag=tag, bucket=bucket), CACHE_TAG_KEY.format(tag=tag, bucket=bucket - 1)]
+
+
+def add_cache_tags(request, *tags):
+    """Declare what the response being rendered for this request depends on"""
+    if not hasattr(request, "_cache_tags"):
+        request._cache_tags = set()
+    request._cache_tags.update(tags)
+
+
+def _track_cache_key(request):
+    # wagtail-cache has already stripped the ignored query strings and cookies
+    # from the request, so this is the key it stored the response under
+    cache_key = get_cache_key(request, None, request.method, wagcache)
+    if cache_key is None:
+        return
+
+    tags = getattr(request, "_cache_tags", set()) | {ALL_PAGES_TAG}
+    bucket_seconds = _tag_bucket_seconds()
+    pipe = _redis().pipeline()
+    for tag in tags:
+        tag_key = _tag_keys(tag)[0]
+        pipe.sadd(tag_key, cache_key)
+        pipe.expire(tag_key, 2 * bucket_seconds)
+    pipe.execute()
+
+
+def _acquire_lock(key):
+    try:
+        return wagcache.add(CACHE_LOCK_KEY.format(key=key), 1, settings.CACHE_LOCK_TIMEOUT)
+    except Exception as e:
+        # without the cache there is nothing to coalesce on, so render anyway
+        logger.warning(f"[WAGTAIL_CACHE] Could not acquire cache lock for {key}: {e}")
+        return True
+
+
+def _release_lock(key):
+    try:
+        wagcache.delete(CACHE_LOCK_KEY.format(key=key))
+    except Exception as e:
+        logger.warning(f"[WAGTAIL_CACHE] Could not release cache lock for {key}: {e}")
+
+
+def _wait_for(get_value):
+    """Poll for the value another request is rendering, for up to CACHE_LOCK_WAIT seconds"""
+    deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        value = get_value()
+        if value is not None:
+            return value
+    return None
+
+
+def _set_stale(key, value, timeout):
+    if not settings.CACHE_STALE_TTL or timeout is None:
+        return
+    try:
+        wagcache.set(CACHE_STALE_KEY.format(key=key), value, timeout + settings.CACHE_STALE_TTL)
+    except Exception as e:
+        logger.warning(f"[WAGTAIL_CACHE] Could not store stale copy of {key}: {e}")
+
+
+def _get_stale(key):
+    if not settings.CACHE_STALE_TTL:
+        return None
+    try:
+        return wagcache.get(CACHE_STALE_KEY.format(key=key))
+    except Exception:
+        return None
+
+
+def cache_get_or_set(key, render, timeout):
+    """
+    Like cache.get_or_set, but only one caller at a time runs render on a miss.
+    The others get the stale copy of the expired value if there is one, or wait
+    for the render to finish, and only render themselves if it takes too long.
+
+    Unlike cache_page, the caller holding the lock renders in the foreground, as
+    render is a closure that cannot be handed to a background task. Values cached
+    this way are cheap to render or, like forecast widgets, rendered ahead of time.
+    """
+    value = wagcache.get(key)
+    if value is not None:
+        return value
+
+    if not _acquire_lock(key):
+        value = _get_stale(key)
+        if value is None:
+            value = _wait_for(lambda: wagcache.get(key))
+        if value is not None:
+            return value
+        return render()
+
+    try:
+        value = render()
+        wagcache.set(key, value, timeout)
+        _set_stale(key, value, timeout)
+    finally:
+        _release_lock(key)
+
+    return value
+
+
+def _after_render(response, callback):
+    # wagtail-cache stores template responses once they are rendered, which
+    # happens after the view returns
+    if isinstance(response, SimpleTemplateResponse) and not response.is_rendered:
+        response.add_post_render_callback(lambda r: callback())
+    else:
+        callback()
+
+
+def _schedule_refresh(request, lock_key):
+    """Render a page again in a background task, which releases the lock once done"""
+    from climweb.base.tasks import refresh_cached_page
+
+    try:
+        refresh_cached_page.delay(request.get_full_path(), request.get_host(), request.is_secure())
+    except Exception as e:
+        logger.warning(f"[WAGTAIL_CACHE] Could not schedule a refresh of {request.path}: {e}")
+        _release_lock(lock_key)
+
+
+def cache_page(view_func):
+    """
+    wagtail-cache's cache_page, with two additions:
+
+    - records which tags each cached response depends on, so it can be purged on
+      its own with purge_cache_tags.
+    - serves expired pages stale while they are revalidated: every request gets
+      the stale copy, and the first one schedules a background task to render
+      the page again. Without a stale copy (e.g. after a purge) a single request
+      renders the page while the others wait for it to be cached.
+    """
+
+    @wraps(view_func)
+    def _wrapped_view_func(request, *args, **kwargs):
+        response = FetchFromCacheMiddleware(view_func).process_request(request)
+
+        lock_key = None
+        is_stale = False
+        if response is None and getattr(request, "_wagtailcache_update", False):
+            # the query strings and cookies wagtail-cache ignores have been
+            # stripped from the request by now
+            lock_key = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+            cache_key = get_cache_key(request, None, request.method, wagcache)
+
+            # background refreshes render, under the lock taken when they were scheduled
+            if not request.META.get(CACHE_REFRESH_ENVIRON_KEY):
+                response = _get_stale(cache_key) if cache_key else None
+                is_stale = response is not None
+                if is_stale:
+                    if _acquire_lock(lock_key):
+                        _schedule_refresh(request, lock_key)
+                    lock_key = None
+                elif not _acquire_lock(lock_key):
+                    lock_key = None
+                    if cache_key:
+                        response = _wait_for(lambda: wagcache.get(cache_key))
+                if response is not None:
+                    # serve it as a hit, rather than storing it again
+                    request._wagtailcache_update = False
+
+        try:
+            if response is None:
+                response = view_func(request, *args, **kwargs)
+            response = UpdateCacheMiddleware(view_func).process_response(request, response)
+        except Exception:
+            if lock_key:
+                _release_lock(lock_key)
+            raise
+
+        if is_stale and wagtailcache_settings.WAGTAIL_CACHE_HEADER:
+            response[wagtailcache_settings.WAGTAIL_CACHE_HEADER] = "stale"
+
+        if response.get(wagtailcache_settings.WAGTAIL_CACHE_HEADER) == "miss":
+            def on_cached():
+                try:
+                    _track_cache_key(request)
+                    cache_key = get_cache_key(request, None, request.method, wagcache)
+                    if cache_key:
+                        _set_stale(cache_key, response, get_max_age(response) or wagcache.default_timeout)
+                except Exception as e:
+                    logger.warning(f"[WAGTAIL_CACHE] Could not track cache key for {request.path}: {e}")
+
+            _after_render(response, on_cached)
+
+        if lock_key:
+            _after_render(response, lambda: _release_lock(lock_key))
+
+        return response
+
+    return _wrapped_view_func
+
+
+def schedule_cache_warmer():
+    """
+    Queue a cache warmer run after a short delay, once the current transaction
+    commits. The singleton lock is held while the run is queued, so a burst of
+    purges (e.g. several pages published together) results in a single run.
+    """
+    from django.conf import settings
+    from django.db import transaction
+
+    if not settings.CACHE_WARMER_ENABLED:
+        return
+
+    def schedule():
+        from climweb.base.tasks import warm_page_cache
+        try:
+            warm_page_cache.apply_async(countdown=settings.CACHE_WARMER_DELAY)
+        except Exception as e:
+            logger.warning(f"[WAGTAIL_CACHE] Could not schedule the cache warmer: {e}")
+
+    transaction.on_commit(schedule)
+
+
+def purge_cache_tags(tags):
+    """Delete the cached responses that depend on any of the given tags"""
+    if not wagtailcache_settings.WAGTAIL_CACHE or not tags:
+        return 0
+
+    try:
+        redis = _redis()
+        tag_keys = [tag_key for tag in tags for tag_key in _tag_keys(tag)]
+        cache_keys = [key.decode() for key in redis.sunion(tag_keys)]
+        if cache_keys:
+            # stale copies are dropped too, as purged pages have changed
+            wagcache.delete_many(cache_keys + [CACHE_STALE_KEY.format(key=key) for key in cache_keys])
+        redis.delete(*tag_keys)
+    except Exception as e:
+        logger.warning(f"[WAGTAIL_CACHE] Could not purge cache tags {sorted(tags)}: {e}")
+        return 0
+
+    logger.debug(f"[WAGTAIL_CACHE] Purged {len(cache_keys)} cached response(s) for {len(tags)} tag(s)")
+    if cache_keys:
+        schedule_cache_warmer()
+    return len(cache_keys)
+
+
+def purge_all_pages():
+    """
+    Delete every tracked cached response, for changes that affect the whole site,
+    such as navigation or theme settings. Other entries in the shared cache, like
+    rate-limit counters or buffered page views, are left alone.
+    """
+    return purge_cache_tags([ALL_PAGES_TAG])
+
+
+def _referencing_page_ids(obj):
+    """Ids of the pages that reference obj through a field, chooser or rich text link"""
+    from django.contrib.contenttypes.models import ContentType
+    from wagtail.models import Page, ReferenceIndex
+
+    page_content_type = ContentType.objects.get_for_model(Page)
+    return {
+        int(object_id) for object_id in ReferenceIndex.get_references_to(obj)
+        .filter(base_content_type=page_content_type)
+        .values_list("object_id", flat=True)
+    }
+
+
+def _with_ancestors(page_ids):
+    """The given pages and all their ancestors, which list them, up to the homepage"""
+    from wagtail.models import Page
+
+    paths = Page.objects.filter(pk__in=page_ids).values_list("path", flat=True)
+    ancestor_paths = {path[:i] for path in paths for i in range(Page.steplen, len(path) + 1, Page.steplen)}
+
+    return set(page_ids) | set(Page.objects.filter(path__in=ancestor_paths).values_list("pk", flat=True))
+
+
+def purge_page(page):
+    """
+    Purge the cached responses of a page and of the pages that link to it, along
+    with their ancestors, and of the pages that list pages of its type (see
+    listed_page_models). Pages shown in menus appear on every page, so changing
+    one purges the whole site.
+    """
+    if not wagtailcache_settings.WAGTAIL_CACHE:
+        return 0
+
+    if page.show_in_menus:
+        return purge_all_pages()
+
+    page_ids = _with_ancestors({page.pk} | _referencing_page_ids(page))
+    tags = {page_cache_tag(page_id) for page_id in page_ids}
+    if page.specific_class:
+        tags.add(model_cache_tag(page.specific_class))
+    return purge_cache_tags(tags)
+
+
+def purge_object(obj):
+    """
+    Purge the cached responses of the pages that reference a snippet or other
+    object, and of the pages that list objects of its model (see
+    listed_snippet_models), which new objects do not reference yet.
+    """
+    if not wagtailcache_settings.WAGTAIL_CACHE:
+        return 0
+
+    page_ids = _with_ancestors(_referencing_page_ids(obj))
+    return purge_cache_tags({page_cache_tag(page_id) for page_id in page_ids} | {model_cache_tag(type(obj))})
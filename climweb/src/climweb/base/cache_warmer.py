@@ -0,0 +1,149 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Sum
+from django.test import Client
+from django.utils import timezone
+from loguru import logger
+
+from climweb.base.cache import CACHE_REFRESH_ENVIRON_KEY
+
+# contains 'bot', so the warmer's requests are not recorded as page views
+CACHE_WARMER_USER_AGENT = "ClimWeb-CacheWarmer-bot"
+# how many days of page view rollups rank the most viewed pages
+CACHE_WARMER_TOP_PAGES_DAYS = 7
+
+
+def _get_default_site():
+    from wagtail.models import Site
+    return Site.objects.filter(is_default_site=True).select_related("root_page").first()
+
+
+def _page_paths(pages, site):
+    for page in pages:
+        url_parts = page.get_url_parts()
+        if url_parts and url_parts[0] == site.pk:
+            yield url_parts[2]
+
+
+def get_cache_warmer_paths(site, limit):
+    """
+    Paths to warm, most important first: the configured always-warm paths, the
+    most viewed pages of the last week according to the daily rollups, then
+    the pages listed in the sitemap, shallowest and most recently published first.
+    """
+    from wagtail.models import Page
+    from climweb.pages.publications.models import PageViewDaily
+
+    paths = list(settings.CACHE_WARMER_ALWAYS_WARM_PATHS)
+
+    since = timezone.localdate() - timedelta(days=CACHE_WARMER_TOP_PAGES_DAYS)
+    top_page_ids = list(
+        PageViewDaily.objects.filter(day__gte=since)
+        .values("object_id")
+        .annotate(total=Sum("views"))
+        .order_by("-total")
+        .values_list("object_id", flat=True)[:limit]
+    )
+    site_pages = Page.objects.live().public().descendant_of(site.root_page, inclusive=True)
+    top_pages = {page.pk: page for page in site_pages.filter(pk__in=top_page_ids)}
+    paths += _page_paths((top_pages[pk] for pk in top_page_ids if pk in top_pages), site)
+
+    if len(set(paths)) < limit:
+        sitemap_pages = site_pages.order_by("depth", "-last_published_at")[:limit]
+        paths += _page_paths(sitemap_pages, site)
+
+    # de-duplicate, keeping the first (highest priority) occurrence
+    return list(dict.fromkeys(paths))[:limit]
+
+
+def get_site_public_host(site):
+    """
+    The host and whether it is served over https, as visitors reach ``site``.
+    Behind a reverse proxy the default site's hostname is often 'localhost' or
+    an internal name, so WAGTAILADMIN_BASE_URL is preferred for it.
+    """
+    base_url = urlsplit(settings.WAGTAILADMIN_BASE_URL) if settings.WAGTAILADMIN_BASE_URL else None
+    if site.is_default_site and base_url and base_url.netloc:
+        return base_url.netloc.lower(), base_url.scheme == "https"
+
+    host = site.hostname if site.port in (80, 443) else f"{site.hostname}:{site.port}"
+    return host.lower(), site.port == 443
+
+
+def _request_kwargs(site):
+    host, secure = get_site_public_host(site)
+
+    # requests must carry the same host and scheme as real visitors, since both
+    # are part of the cache key
+    kwargs = {"HTTP_HOST": host, "HTTP_USER_AGENT": CACHE_WARMER_USER_AGENT, "secure": secure}
+    if secure:
+        kwargs["HTTP_X_FORWARDED_PROTO"] = "https"
+    return kwargs
+
+
+def _warm_path(path, request_kwargs):
+    start = time.perf_counter()
+    try:
+        response = Client().get(path, **request_kwargs)
+        return path, response.status_code, time.perf_counter() - start
+    except Exception as e:
+        logger.warning(f"[CACHE_WARMER] Could not render {path}: {e}")
+        return path, None, time.perf_counter() - start
+    finally:
+        # each worker thread has its own database connections
+        connections.close_all()
+
+
+def refresh_page(path, host, secure):
+    """Render an expired page again, for the visitors being served its stale copy"""
+    request_kwargs = {
+        "HTTP_HOST": host,
+        "HTTP_USER_AGENT": CACHE_WARMER_USER_AGENT,
+        "secure": secure,
+        CACHE_REFRESH_ENVIRON_KEY: True,
+    }
+    if secure:
+        request_kwargs["HTTP_X_FORWARDED_PROTO"] = "https"
+
+    path, status_code, elapsed = _warm_path(path, request_kwargs)
+    logger.debug(f"[CACHE_WARMER] Refreshed {host}{path} -> {status_code} in {elapsed:.2f}s")
+    return status_code
+
+
+def warm_page_cache():
+    """Re-request the most important pages, a few at a time, so they are cached again"""
+    from wagtailcache.settings import wagtailcache_settings
+
+    if not wagtailcache_settings.WAGTAIL_CACHE:
+        return 0
+
+    site = _get_default_site()
+    if site is None:
+        return 0
+
+    start = time.perf_counter()
+    paths = get_cache_warmer_paths(site, settings.CACHE_WARMER_MAX_URLS)
+    request_kwargs = _request_kwargs(site)
+    logger.info(f"[CACHE_WARMER] Warming {len(paths)} URL(s) with {settings.CACHE_WARMER_CONCURRENCY} worker(s)")
+
+    warmed = failed = 0
+    with ThreadPoolExecutor(max_workers=settings.CACHE_WARMER_CONCURRENCY) as executor:
+        futures = [executor.submit(_warm_path, path, request_kwargs) for path in paths]
+        for done, future in enumerate(as_completed(futures), start=1):
+            path, status_code, elapsed = future.result()
+            if status_code == 200:
+                warmed += 1
+            else:
+                failed += 1
+            logger.debug(f"[CACHE_WARMER] ({done}/{len(paths)}) {path} -> {status_code} in {elapsed:.2f}s")
+
+    logger.info(
+        f"[CACHE_WARMER] Warmed {warmed}/{len(paths)} URL(s) in {time.perf_counter() - start:.2f}s"
+        + (f", {failed} failed" if failed else "")
+    )
+    return warmed
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0054_alter_navigationsettings_footer_menu_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customdocumentmodel',
+            name='thumbnail_pending',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
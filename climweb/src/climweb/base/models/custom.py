@@ -1,11 +1,17 @@
-from django.db import models
+from django.db import models, transaction
+from django.dispatch import Signal
 from django.utils import timezone
 from django.utils.text import slugify
+from loguru import logger
 from wagtail.documents.models import Document, document_served
 from wagtail.images import get_image_model_string
 
 from climweb.base.utils import get_first_page_of_pdf_as_image
 
+# Sent with `document` and `thumbnail` once a thumbnail has been generated in the
+# background, so pages that display the document's thumbnail can pick it up.
+document_thumbnail_generated = Signal()
+
 
 class CustomDocumentModel(Document):
     # Custom field
@@ -17,26 +23,54 @@ class CustomDocumentModel(Document):
         on_delete=models.SET_NULL,
         related_name='+',
     )
+    thumbnail_pending = models.BooleanField(default=False, editable=False)
+    
+    @property
+    def supports_thumbnail(self):
+        # Currently, we only generate a thumbnail for PDF files
+        return self.file_extension.endswith('pdf')
     
-    def get_thumbnail(self):
+    def generate_thumbnail(self):
         """
-        Create a thumbnail for the document if it doesn't exist.
-        Currently, we only generate a thumbnail for PDF files
+        Render the first page of the document as its thumbnail.
+        Always clears thumbnail_pending, even if rendering fails.
         """
-        if not self.thumbnail and self.file_extension.endswith('pdf'):
+        thumbnail = None
+        if self.supports_thumbnail:
             document_title = self.title
             try:
                 current_time = timezone.localtime(timezone.now()).strftime("%Y-%m-%d-%H-%M-%S")
                 file_name = f"f{slugify(document_title)}-{current_time}-thumbnail.jpg"
                 thumbnail = get_first_page_of_pdf_as_image(self.file.path, title=document_title, file_name=file_name)
-                if thumbnail:
-                    self.thumbnail = thumbnail
-                    self.save()
-            except:
-                # do nothing if thumbnail generation fails
-                pass
+            except Exception as e:
+                logger.warning(f"[THUMBNAIL] Could not generate thumbnail for document {self.pk}: {e}")
+        
+        if thumbnail:
+            self.thumbnail = thumbnail
+        self.thumbnail_pending = False
+        self.save(update_fields=["thumbnail", "thumbnail_pending"])
+        
+        if thumbnail:
+            document_thumbnail_generated.send(sender=self.__class__, document=self, thumbnail=thumbnail)
         
         return self.thumbnail
+    
+    def request_thumbnail(self):
+        """
+        Return the thumbnail if it exists, otherwise queue it for background
+        generation and return None. Pages show a placeholder until it is ready.
+        """
+        if self.thumbnail or not self.supports_thumbnail or not self.pk:
+            return self.thumbnail
+        
+        if not self.thumbnail_pending:
+            CustomDocumentModel.objects.filter(pk=self.pk).update(thumbnail_pending=True)
+            self.thumbnail_pending = True
+        
+        from climweb.base.tasks import generate_document_thumbnails
+        transaction.on_commit(lambda: generate_document_thumbnails.delay())
+        
+        return None
 
 
 def increment_document_download_count(instance, **kwargs):
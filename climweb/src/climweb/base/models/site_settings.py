@@ -20,7 +20,6 @@ from wagtail.contrib.settings.registry import register_setting
 from wagtail.fields import RichTextField, StreamField
 from wagtail_color_panel.edit_handlers import NativeColorPanel
 from wagtail_color_panel.fields import ColorField
-from wagtailcache.cache import clear_cache
 
 from climweb.base.blocks import NavigationItemBlock, FooterNavigationItemBlock, LanguageItemBlock, SocialMediaBlock
 from climweb.base.constants import LANGUAGE_CHOICES, LANGUAGE_CHOICES_DICT, COUNTRY_CHOICES
@@ -375,5 +374,8 @@ class ImportantPages(BaseSiteSetting):
 @receiver(post_save, sender=NavigationSettings)
 @receiver(post_save, sender=ImportantPages)
 def handle_clear_wagtail_cache(sender, **kwargs):
-    logger.debug("[WAGTAIL_CACHE]: Clearing cache")
-    clear_cache()
+    from climweb.base.cache import purge_all_pages
+
+    # these settings are rendered on every page
+    logger.debug("[WAGTAIL_CACHE]: Purging cached pages")
+    purge_all_pages()
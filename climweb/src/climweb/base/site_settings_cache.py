@@ -0,0 +1,107 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from loguru import logger
+from wagtail.contrib.settings.models import BaseSiteSetting
+from wagtail.fields import StreamField
+
+from climweb.base.cache import bump_cache_version, bump_cache_version_on_commit, get_cache_version
+
+SITE_SETTINGS_VERSION_KEY = "site_settings:version"
+
+_original_for_site = BaseSiteSetting.for_site.__func__
+
+_local_cache = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+
+def get_site_settings_version():
+    return get_cache_version(SITE_SETTINGS_VERSION_KEY)
+
+
+def bump_site_settings_version():
+    """Invalidate the site settings cached by every process"""
+    return bump_cache_version(SITE_SETTINGS_VERSION_KEY)
+
+
+def _snapshot(instance):
+    """
+    The field values of a settings row, as plain data. Related objects (pages,
+    cities, images...) are loaded again for each lookup, so only the row is kept.
+    """
+    values = {}
+    for field in instance._meta.concrete_fields:
+        value = getattr(instance, field.attname)
+        if isinstance(field, StreamField):
+            value = field.get_prep_value(value)
+        values[field.attname] = value
+    return instance._state.db, values
+
+
+def _from_snapshot(cls, snapshot):
+    # every lookup gets its own copy of the values, StreamField and JSON data
+    # included, so changes made while handling one request never leak into others
+    db, values = snapshot
+    instance = cls(**copy.deepcopy(values))
+    instance._state.adding = False
+    instance._state.db = db
+    return instance
+
+
+def cached_for_site(cls, site):
+    """
+    BaseSiteSetting.for_site, served from a process-local LRU while the site
+    settings version in Redis is unchanged. Any setting being saved or deleted
+    bumps the version, so every process reloads its settings on the next lookup.
+    """
+    if site is None or not settings.SITE_SETTINGS_CACHE_SIZE:
+        return _original_for_site(cls, site)
+
+    try:
+        version = get_site_settings_version()
+    except Exception as e:
+        logger.warning(f"[SITE_SETTINGS] Could not read the site settings version: {e}")
+        return _original_for_site(cls, site)
+
+    key = (cls._meta.label, site.pk, version)
+    with _local_cache_lock:
+        snapshot = _local_cache.get(key)
+        if snapshot is not None:
+            _local_cache.move_to_end(key)
+
+    if snapshot is None:
+        instance = _original_for_site(cls, site)
+        with _local_cache_lock:
+            _local_cache[key] = _snapshot(instance)
+            while len(_local_cache) > settings.SITE_SETTINGS_CACHE_SIZE:
+                _local_cache.popitem(last=False)
+        return instance
+
+    return _from_snapshot(cls, snapshot)
+
+
+def install():
+    """
+    Cache the site settings defined by climweb and those listed in
+    SITE_SETTINGS_CACHE_EXTRA_MODELS, leaving those of other apps alone
+    """
+    extra_models = set(settings.SITE_SETTINGS_CACHE_EXTRA_MODELS)
+    for model in apps.get_models():
+        if not issubclass(model, BaseSiteSetting):
+            continue
+        if model._meta.app_config.name.startswith("climweb.") or model._meta.label in extra_models:
+            model.for_site = classmethod(cached_for_site)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_site_settings(sender, **kwargs):
+    if not issubclass(sender, BaseSiteSetting):
+        return
+
+    bump_cache_version_on_commit(SITE_SETTINGS_VERSION_KEY)
@@ -116,6 +116,38 @@ def upload_cloud_backups():
             ])
 
 
+# generating a thumbnail can take a few seconds per PDF, so allow for a large backlog
+_THUMBNAIL_LOCK_EXPIRY = 1800  # 30 minutes
+
+
+@app.task(
+    base=Singleton,
+    bind=True,
+    lock_expiry=_THUMBNAIL_LOCK_EXPIRY,
+)
+def generate_document_thumbnails(self):
+    """
+    Generate thumbnails for every document queued by request_thumbnail(), in
+    batches, until none are left. Runs on DOCUMENT_THUMBNAIL_QUEUE when it is
+    set, so slow PDF rendering never holds up other tasks.
+    """
+    from climweb.base.models import CustomDocumentModel
+
+    batch_size = settings.DOCUMENT_THUMBNAIL_BATCH_SIZE
+    generated = 0
+
+    while True:
+        batch = list(CustomDocumentModel.objects.filter(thumbnail_pending=True).order_by("pk")[:batch_size])
+        if not batch:
+            break
+        for document in batch:
+            if document.generate_thumbnail():
+                generated += 1
+
+    if generated:
+        logger.info(f"[THUMBNAIL] Generated {generated} document thumbnail(s)")
+
+
 if "forecastmanager" in settings.INSTALLED_APPS:
     # lock_expiry prevents the singleton lock from persisting indefinitely if the
     # worker is killed (e.g. by CELERY_WORKER_MAX_MEMORY_PER_CHILD) before the
@@ -163,6 +195,22 @@ if "climweb_wdqms" in settings.INSTALLED_APPS:
         call_command('wdqms_stats', '-var', variable)
 
 
+@app.task(base=Singleton, bind=True)
+def warm_page_cache(self):
+    """Re-render the most visited pages after cached pages have been purged"""
+    from climweb.base.cache_warmer import warm_page_cache as warm
+
+    return warm()
+
+
+@app.task(base=Singleton, bind=True)
+def refresh_cached_page(self, path, host, secure):
+    """Render an expired page again, while its stale copy is served"""
+    from climweb.base.cache_warmer import refresh_page
+
+    return refresh_page(path, host, secure)
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     # run_backup every day at midnight
@@ -172,6 +220,14 @@ def setup_periodic_tasks(sender, **kwargs):
         name="run-backup-every-day-midnight",
     )
 
+    # pick up any document thumbnails whose queued task was skipped by the
+    # singleton lock while a previous batch was finishing
+    sender.add_periodic_task(
+        crontab(minute="*/10"),
+        generate_document_thumbnails.s(),
+        name="generate-document-thumbnails-every-10-minutes",
+    )
+
     if "forecastmanager" in settings.INSTALLED_APPS:
         # download_forecast every hour
         sender.add_periodic_task(
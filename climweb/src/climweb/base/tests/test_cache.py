@@ -0,0 +1,170 @@
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from climweb.base import cache as page_cache
+
+
+class FakeRedis:
+    """Set commands used to track cache tags"""
+
+    def __init__(self):
+        self.sets = {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+    def sadd(self, key, value):
+        self.sets.setdefault(key, set()).add(value.encode())
+
+    def expire(self, key, seconds):
+        return True
+
+    def sunion(self, keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.sets.pop(key, None)
+
+
+@override_settings(WAGTAIL_CACHE=True, CACHE_WARMER_ENABLED=False)
+class TestTaggedPageCache(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.cache = LocMemCache("test-page-cache", {})
+        self.addCleanup(self.cache.clear)
+
+        for target, value in [("_redis", lambda: self.redis), ("wagcache", self.cache)]:
+            patcher = mock.patch.object(page_cache, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.renders = 0
+
+    def view(self, request, page_id, *tags):
+        self.renders += 1
+        page_cache.add_cache_tags(request, page_cache.page_cache_tag(page_id), *tags)
+        return HttpResponse(f"page {page_id}")
+
+    def get(self, path, page_id, *tags):
+        with mock.patch("wagtailcache.cache.caches", {"default": self.cache}):
+            return page_cache.cache_page(self.view)(RequestFactory().get(path), page_id, *tags)
+
+    def test_purge_only_affected_pages(self):
+        self.get("/a/", 1)
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 2)
+
+        # both are served from the cache
+        self.get("/a/", 1)
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 2)
+
+        self.assertEqual(page_cache.purge_cache_tags({page_cache.page_cache_tag(1)}), 1)
+        self.get("/a/", 1)
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 3)
+
+        page_cache.purge_all_pages()
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 4)
+
+    def test_purge_new_object_purges_listing_pages(self):
+        # the listing page queries groups, so nothing references a new one yet
+        self.get("/groups/", 1, page_cache.model_cache_tag(Group))
+        self.get("/b/", 2)
+
+        with mock.patch.object(page_cache, "_referencing_page_ids", return_value=set()), \
+                mock.patch.object(page_cache, "_with_ancestors", return_value=set()):
+            self.assertEqual(page_cache.purge_object(Group(name="new")), 1)
+
+        self.get("/groups/", 1, page_cache.model_cache_tag(Group))
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 3)
+
+    def test_purge_page_purges_pages_listing_its_type(self):
+        # a sibling lists related publications by query, without referencing them
+        self.get("/publications/a/", 1, page_cache.model_cache_tag("publications.PublicationPage"))
+        self.get("/b/", 2)
+
+        page = mock.Mock(pk=3, show_in_menus=False)
+        page.specific_class._meta.label = "publications.PublicationPage"
+        with mock.patch.object(page_cache, "_referencing_page_ids", return_value=set()), \
+                mock.patch.object(page_cache, "_with_ancestors", return_value={3}):
+            self.assertEqual(page_cache.purge_page(page), 1)
+
+        self.get("/publications/a/", 1)
+        self.get("/b/", 2)
+        self.assertEqual(self.renders, 3)
+
+    def test_tag_sets_rotate(self):
+        self.get("/a/", 1)
+        bucket_seconds = page_cache._tag_bucket_seconds()
+
+        # keys tracked in the previous bucket are still purged
+        with mock.patch.object(page_cache.time, "time", return_value=page_cache.time.time() + bucket_seconds):
+            self.assertEqual(page_cache.purge_cache_tags({page_cache.page_cache_tag(1)}), 1)
+
+    def test_purge_schedules_cache_warmer(self):
+        self.get("/a/", 1)
+
+        with mock.patch.object(page_cache, "schedule_cache_warmer") as schedule_cache_warmer:
+            # nothing cached depends on this page
+            page_cache.purge_cache_tags({page_cache.page_cache_tag(2)})
+            schedule_cache_warmer.assert_not_called()
+
+            page_cache.purge_cache_tags({page_cache.page_cache_tag(1)})
+            schedule_cache_warmer.assert_called_once()
+
+    def test_concurrent_miss_served_stale(self):
+        self.get("/a/", 1)
+        # the fresh copy expires, while another request is already rendering it
+        # (locmem keys are prefixed with ':<version>:')
+        page_keys = [key.split(":", 2)[2] for key in list(self.cache._cache) if "cache_page" in key]
+        self.cache.delete_many([key for key in page_keys if not key.startswith("climweb:")])
+
+        with mock.patch.object(page_cache, "_acquire_lock", return_value=False):
+            response = self.get("/a/", 1)
+
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(response["X-Wagtail-Cache"], "stale")
+        self.assertEqual(response.content, b"page 1")
+
+    def test_expired_page_refreshed_in_background(self):
+        self.get("/a/", 1)
+        page_keys = [key.split(":", 2)[2] for key in list(self.cache._cache) if "cache_page" in key]
+        self.cache.delete_many([key for key in page_keys if not key.startswith("climweb:")])
+
+        # the request that takes the lock is served the stale copy too
+        with mock.patch.object(page_cache, "_schedule_refresh") as schedule_refresh:
+            response = self.get("/a/", 1)
+
+        schedule_refresh.assert_called_once()
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(response["X-Wagtail-Cache"], "stale")
+
+        # the background refresh renders the page, and releases the lock
+        request = RequestFactory().get("/a/", **{page_cache.CACHE_REFRESH_ENVIRON_KEY: True})
+        with mock.patch("wagtailcache.cache.caches", {"default": self.cache}), \
+                mock.patch.object(page_cache, "_release_lock") as release_lock:
+            page_cache.cache_page(self.view)(request, 1)
+
+        self.assertEqual(self.renders, 2)
+        release_lock.assert_called_once()
+
+    def test_cache_get_or_set_single_flight(self):
+        render = mock.Mock(return_value="widget")
+        self.assertEqual(page_cache.cache_get_or_set("widget", render, 60), "widget")
+        self.cache.delete("widget")
+
+        with mock.patch.object(page_cache, "_acquire_lock", return_value=False):
+            self.assertEqual(page_cache.cache_get_or_set("widget", render, 60), "widget")
+
+        render.assert_called_once()
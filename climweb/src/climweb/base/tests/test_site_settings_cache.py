@@ -0,0 +1,39 @@
+from django.test import TestCase, override_settings
+from forecastmanager.forecast_settings import ForecastSetting
+from wagtail.models import Site
+
+from climweb.base.models import IntegrationSettings
+from climweb.pages.home.models import HomeMapSettings
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestSiteSettingsCache(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+
+    def test_served_from_memory_until_saved(self):
+        setting = IntegrationSettings.for_site(self.site)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(IntegrationSettings.for_site(self.site).pk, setting.pk)
+
+        setting.save()
+
+        with self.assertNumQueries(1):
+            IntegrationSettings.for_site(self.site)
+
+    def test_lookups_do_not_share_mutable_values(self):
+        HomeMapSettings.for_site(self.site)
+
+        with self.assertNumQueries(0):
+            first = HomeMapSettings.for_site(self.site)
+            second = HomeMapSettings.for_site(self.site)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first.zoom_locations, second.zoom_locations)
+
+    def test_forecast_setting_is_cached(self):
+        setting = ForecastSetting.for_site(self.site)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(ForecastSetting.for_site(self.site).pk, setting.pk)
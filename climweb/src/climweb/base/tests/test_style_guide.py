@@ -1,7 +1,8 @@
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
 from climweb.base.models import Theme
+from climweb.base.theme import get_theme
 from climweb.base.utils import mix_with_white
 
 
@@ -59,3 +60,17 @@ class TestStyleGuideView(TestCase):
         content = response.content.decode()
         for anchor in ["colors", "typography", "components", "for-developers"]:
             self.assertIn(f'id="{anchor}"', content, msg=f'Missing section anchor: id="{anchor}"')
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestThemeCache(TestCase):
+    def test_theme_computed_once_per_version(self):
+        theme = Theme.objects.create(name="Test Theme", primary_hover_color="#1a6b3c", is_default=True)
+        self.assertEqual(get_theme()["context"]["primary_color"], "#1a6b3c")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_theme()["context"]["background_color"], mix_with_white("#1a6b3c", 0.8))
+
+        theme.primary_hover_color = "#222222"
+        theme.save()
+        self.assertEqual(get_theme()["tokens"]["primary"], "#222222")
@@ -0,0 +1,102 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from loguru import logger
+
+from climweb.base.cache import bump_cache_version, bump_cache_version_on_commit, get_cache_version
+from climweb.base.models import Theme
+from climweb.base.utils import mix_with_white
+
+THEME_VERSION_KEY = "theme:version"
+
+DEFAULT_PRIMARY_COLOR = "#0C447C"
+
+default_theme = {
+    'text_color': '#363636',
+    'primary_color': DEFAULT_PRIMARY_COLOR,
+    'background_color': '#E6F1FB',
+    'border_radius': '12px',
+    'box_shadow': 'elevation-1',
+}
+
+default_tokens = {
+    "primary": DEFAULT_PRIMARY_COLOR,
+    "primary-light": mix_with_white(DEFAULT_PRIMARY_COLOR, 0.75),
+    "primary-medium": mix_with_white(DEFAULT_PRIMARY_COLOR, 0.50),
+    "background": mix_with_white(DEFAULT_PRIMARY_COLOR, 0.80),
+    "text": "#363636",
+    "border-radius": "0.72em",
+    "box-shadow-elevation": "6",
+}
+
+# (theme version, computed theme) of this process
+_cached_theme = (None, None)
+
+
+def get_theme_version():
+    return get_cache_version(THEME_VERSION_KEY)
+
+
+def bump_theme_version():
+    return bump_cache_version(THEME_VERSION_KEY)
+
+
+def _compute_theme():
+    """The template context and style guide tokens of the default theme, with its derived colours"""
+    d_theme = Theme.objects.filter(is_default=True).first()
+    if d_theme is None:
+        return {"context": default_theme, "tokens": default_tokens}
+
+    primary = d_theme.primary_hover_color
+    background = mix_with_white(primary, 0.80)
+    return {
+        "context": {
+            'primary_color': primary,
+            'text_color': d_theme.primary_color,
+            'background_color': background,
+            'border_radius': f"{d_theme.border_radius * 0.06}em",
+            'box_shadow': f"elevation-{d_theme.box_shadow}",
+        },
+        "tokens": {
+            "primary": primary,
+            "primary-light": mix_with_white(primary, 0.75),
+            "primary-medium": mix_with_white(primary, 0.50),
+            "background": background,
+            "text": d_theme.primary_color,
+            "border-radius": f"{d_theme.border_radius * 0.06}em",
+            "box-shadow-elevation": str(d_theme.box_shadow),
+        },
+    }
+
+
+def get_theme(request=None):
+    """
+    The computed default theme. It is kept in memory until the theme version in
+    Redis changes, and the version is checked once per request.
+    """
+    global _cached_theme
+
+    if request is not None and hasattr(request, "_climweb_theme"):
+        return request._climweb_theme
+
+    try:
+        version = get_theme_version()
+    except Exception as e:
+        logger.warning(f"[THEME] Could not read the theme version: {e}")
+        version = None
+
+    cached_version, computed = _cached_theme
+    if version is None or computed is None or cached_version != version:
+        computed = _compute_theme()
+        if version is not None:
+            _cached_theme = (version, computed)
+
+    if request is not None:
+        request._climweb_theme = computed
+
+    return computed
+
+
+@receiver(post_save, sender=Theme)
+@receiver(post_delete, sender=Theme)
+def invalidate_theme(sender, **kwargs):
+    bump_cache_version_on_commit(THEME_VERSION_KEY)
@@ -261,7 +261,15 @@ def get_installed_plugins():
 
 def get_first_page_of_pdf_as_image(file_path, title, file_name):
     with tempfile.TemporaryDirectory() as path:
-        images = convert_from_path(file_path, output_folder=path, single_file=True)
+        # render at a bounded resolution, scaling the longest side down to
+        # DOCUMENT_THUMBNAIL_MAX_SIZE, so large-format maps stay cheap to render
+        images = convert_from_path(
+            file_path,
+            output_folder=path,
+            single_file=True,
+            dpi=settings.DOCUMENT_THUMBNAIL_DPI,
+            size=settings.DOCUMENT_THUMBNAIL_MAX_SIZE,
+        )
         if images:
             buffer = io.BytesIO()
             images[0].save(buffer, format='JPEG')
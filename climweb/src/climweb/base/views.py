@@ -8,14 +8,12 @@ from django.shortcuts import render, redirect
 from django.utils.translation import gettext as _
 from wagtail.admin import messages
 
-from django.core.exceptions import ObjectDoesNotExist
-
 from climweb import __version__
-from climweb.base.utils import get_latest_cms_release, send_upgrade_command, send_plugin_remove, get_installed_plugins, \
-    mix_with_white
+from climweb.base.theme import get_theme
+from climweb.base.utils import get_latest_cms_release, send_upgrade_command, send_plugin_remove, get_installed_plugins
 from climweb.utils.version import check_version_greater_than_current, get_main_version
 from .forms import CMSUpgradeForm
-from .models import Theme, OrganisationSetting
+from .models import OrganisationSetting
 
 
 def handler500(request):
@@ -151,40 +149,12 @@ def plugin_manager_view(request):
     })
 
 
-_DEFAULT_TOKENS = {
-    "primary": "#0C447C",
-    "primary-light": mix_with_white("#0C447C", 0.75),
-    "primary-medium": mix_with_white("#0C447C", 0.50),
-    "background": mix_with_white("#0C447C", 0.80),
-    "text": "#363636",
-    "border-radius": "0.72em",
-    "box-shadow-elevation": "6",
-}
-
-
-def _build_tokens():
-    try:
-        theme = Theme.objects.get(is_default=True)
-        primary = theme.primary_hover_color
-        return {
-            "primary": primary,
-            "primary-light": mix_with_white(primary, 0.75),
-            "primary-medium": mix_with_white(primary, 0.50),
-            "background": mix_with_white(primary, 0.80),
-            "text": theme.primary_color,
-            "border-radius": f"{theme.border_radius * 0.06}em",
-            "box-shadow-elevation": str(theme.box_shadow),
-        }
-    except ObjectDoesNotExist:
-        return _DEFAULT_TOKENS
-
-
 def style_guide(request):
     try:
         org_setting = OrganisationSetting.for_request(request)
     except Exception:
         org_setting = None
-    tokens = _build_tokens()
+    tokens = get_theme(request)["tokens"]
     context = {
         "tokens": tokens,
         # Flattened aliases so the template avoids hyphenated key access
@@ -201,7 +171,7 @@ def style_guide(request):
 
 
 def style_guide_tokens(request):
-    return JsonResponse(_build_tokens())
+    return JsonResponse(get_theme(request)["tokens"])
 
 
 def public_health_check(request):
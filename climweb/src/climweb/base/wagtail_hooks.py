@@ -6,8 +6,9 @@ if "capcomposer.cap" in settings.INSTALLED_APPS:
     from capcomposer.cap.utils import get_currently_active_alerts
 from django.contrib import messages
 from django.contrib.auth.models import Permission
-from django.core.cache import cache
+from django.db import transaction
 from django.db.models import CharField, TextField
+from django.dispatch import receiver
 from django.http import HttpResponseRedirect
 from django.templatetags.static import static
 from django.urls import path, reverse
@@ -19,14 +20,15 @@ from wagtail.fields import RichTextField, StreamField
 from wagtail.rich_text import RichText
 from wagtail.admin.ui.components import Component
 from wagtail.snippets.models import register_snippet
+from wagtail.signals import page_published, page_unpublished
 from wagtail.snippets.views.snippets import SnippetViewSet
 from wagtail_modeladmin.options import (
     ModelAdmin,
     modeladmin_register, ModelAdminGroup,
 )
-from wagtailcache.cache import clear_cache
 
 from climweb.utils.version import get_main_version, check_version_greater_than_current
+from .cache import add_cache_tags, model_cache_tag, page_cache_tag, purge_object, purge_page
 from .cap import create_cap_geomanager_dataset
 from .models import Theme, ServiceCategory, CAPGeomanagerSettings
 from .utils import get_latest_cms_release
@@ -163,21 +165,45 @@ class ThemeSettings(ModelAdmin):
 modeladmin_register(ThemeSettings)
 
 
-@hooks.register('after_create_page')
-@hooks.register('after_edit_page')
-@hooks.register('after_delete_page')
-def clear_wagtailcache(request, page):
+@hooks.register('before_serve_page')
+def tag_page_cache(page, request, serve_args, serve_kwargs):
+    # cached responses are purged per page when it, or a page it lists, changes,
+    # and per model when the page lists snippets or other pages through a query
+    listed_models = (*getattr(page, "listed_snippet_models", ()), *getattr(page, "listed_page_models", ()))
+    add_cache_tags(request, page_cache_tag(page.pk), *(model_cache_tag(model) for model in listed_models))
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def purge_page_cache_on_publish(sender, instance, **kwargs):
+    # after the commit, so a request in between cannot cache the old revision again
+    transaction.on_commit(lambda: purge_page(instance))
+
+
+# purge before the page is deleted or moved, while its ancestors can still be found
+@hooks.register('before_delete_page')
+@hooks.register('before_move_page')
+def purge_page_cache_before_change(request, page, *args):
     if page.live:
-        clear_cache()
-        cache.clear()
+        purge_page(page)
+
+
+@hooks.register('after_move_page')
+def purge_page_cache_after_move(request, page):
+    if page.live:
+        purge_page(page)
 
 
 @hooks.register('after_create_snippet')
-@hooks.register('after_create_snippet')
-@hooks.register('after_delete_snippet')
-def clear_cache_after_snippet_edit(request, snippet):
-    clear_cache()
-    cache.clear()
+@hooks.register('after_edit_snippet')
+def purge_cache_after_snippet_edit(request, snippet):
+    purge_object(snippet)
+
+
+@hooks.register('before_delete_snippet')
+def purge_cache_before_snippet_delete(request, instances):
+    for instance in instances:
+        purge_object(instance)
 
 
 # Optional extra terms for this platform (e.g. domain-specific abuse).
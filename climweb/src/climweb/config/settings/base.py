@@ -696,6 +696,86 @@ CELERY_WORKER_MAX_MEMORY_PER_CHILD = env.int("CELERY_WORKER_MAX_MEMORY_PER_CHILD
 
 CELERY_APP = 'climweb.config.celery:app'
 
+# Image renditions generated in the background when a product item page is
+# published, matching the filters used by products/product_detail.html
+PRODUCT_WARM_RENDITION_SPECS = env.list("PRODUCT_WARM_RENDITION_SPECS", default=["height-600|width-600"])
+
+# PDF thumbnail generation runs on the default queue, unless
+# DOCUMENT_THUMBNAIL_QUEUE routes it to a queue of its own. A worker must then
+# consume that queue, such as the celery-thumbnails-worker entrypoint command.
+DOCUMENT_THUMBNAIL_QUEUE = env.str("DOCUMENT_THUMBNAIL_QUEUE", default="")
+CELERY_TASK_ROUTES = {}
+if DOCUMENT_THUMBNAIL_QUEUE:
+    CELERY_TASK_ROUTES["climweb.base.tasks.generate_document_thumbnails"] = {"queue": DOCUMENT_THUMBNAIL_QUEUE}
+
+# Document thumbnails are rendered in the background, a batch at a time, at a
+# bounded resolution. DOCUMENT_THUMBNAIL_MAX_SIZE is the longest side in pixels.
+DOCUMENT_THUMBNAIL_BATCH_SIZE = env.int("DOCUMENT_THUMBNAIL_BATCH_SIZE", default=10)
+DOCUMENT_THUMBNAIL_DPI = env.int("DOCUMENT_THUMBNAIL_DPI", default=72)
+DOCUMENT_THUMBNAIL_MAX_SIZE = env.int("DOCUMENT_THUMBNAIL_MAX_SIZE", default=1200)
+
+# Product auto-ingestion.
+#
+# By default the watch folders of every ingestion-enabled Product are fully
+# scanned every 5 minutes. With the watcher enabled, the `watch_product_files`
+# command (run once, as the `watch-product-files` docker service) publishes files as
+# they land and the full scan only runs every PRODUCT_INGESTION_RECONCILE_INTERVAL
+# seconds.
+PRODUCT_INGESTION_WATCHER_ENABLED = env.bool("PRODUCT_INGESTION_WATCHER_ENABLED", default=False)
+PRODUCT_INGESTION_RECONCILE_INTERVAL = env.int("PRODUCT_INGESTION_RECONCILE_INTERVAL", default=60 * 60)
+# How ingested files are placed into media storage: 'copy' (the default) always
+# copies them. As opt-ins, 'link' hard-links them and 'move' renames them into the
+# upload path when the watch root is on the same filesystem as MEDIA_ROOT, falling
+# back to a copy otherwise. With 'link', tools that overwrite files in place (rather
+# than writing a new file and renaming it, as rsync does) will also change the
+# already-published copy.
+PRODUCT_INGESTION_FILE_PLACEMENT = env.str("PRODUCT_INGESTION_FILE_PLACEMENT", default="copy")
+
+# Page views are buffered in Redis on the request path and written to the
+# database in bulk every PAGE_VIEWS_FLUSH_INTERVAL seconds. When the buffer is
+# not flushed, only the newest PAGE_VIEWS_BUFFER_MAX_LENGTH views are kept.
+PAGE_VIEWS_BUFFERED = env.bool("PAGE_VIEWS_BUFFERED", default=True)
+PAGE_VIEWS_FLUSH_INTERVAL = env.int("PAGE_VIEWS_FLUSH_INTERVAL", default=60)
+PAGE_VIEWS_FLUSH_BATCH_SIZE = env.int("PAGE_VIEWS_FLUSH_BATCH_SIZE", default=1000)
+PAGE_VIEWS_BUFFER_MAX_LENGTH = env.int("PAGE_VIEWS_BUFFER_MAX_LENGTH", default=100000)
+# Raw page views are rolled up into daily counts every PAGE_VIEWS_ROLLUP_INTERVAL
+# seconds. Set PAGE_VIEWS_RETENTION_DAYS to delete them once older than that many
+# days; the default, 0, keeps them all.
+PAGE_VIEWS_ROLLUP_INTERVAL = env.int("PAGE_VIEWS_ROLLUP_INTERVAL", default=60 * 15)
+PAGE_VIEWS_RETENTION_DAYS = env.int("PAGE_VIEWS_RETENTION_DAYS", default=0)
+# Unique visitors are counted per page and day with Redis HyperLogLogs, kept for
+# this many days. Their counts are copied into the daily rollups before expiring.
+PAGE_VIEWS_UNIQUE_VISITORS_TTL_DAYS = env.int("PAGE_VIEWS_UNIQUE_VISITORS_TTL_DAYS", default=31)
+
+# After cached pages are purged, the cache warmer re-requests up to
+# CACHE_WARMER_MAX_URLS pages: the always-warm paths, the most viewed pages and
+# then the sitemap, CACHE_WARMER_CONCURRENCY at a time. It waits
+# CACHE_WARMER_DELAY seconds so a burst of edits is warmed once.
+CACHE_WARMER_ENABLED = env.bool("CACHE_WARMER_ENABLED", default=True)
+CACHE_WARMER_ALWAYS_WARM_PATHS = env.list("CACHE_WARMER_ALWAYS_WARM_PATHS", default=["/"])
+CACHE_WARMER_MAX_URLS = env.int("CACHE_WARMER_MAX_URLS", default=50)
+CACHE_WARMER_CONCURRENCY = env.int("CACHE_WARMER_CONCURRENCY", default=4)
+CACHE_WARMER_DELAY = env.int("CACHE_WARMER_DELAY", default=30)
+
+# An expired page is served from the copy kept for another CACHE_STALE_TTL
+# seconds (0 disables) while a background task renders it again, for up to
+# CACHE_LOCK_TIMEOUT seconds. Without that copy, and for forecast widgets, a
+# single request renders it and concurrent ones get the stale copy or wait up to
+# CACHE_LOCK_WAIT seconds for the new one before rendering it themselves.
+CACHE_STALE_TTL = env.int("CACHE_STALE_TTL", default=60 * 60)
+CACHE_LOCK_TIMEOUT = env.int("CACHE_LOCK_TIMEOUT", default=30)
+CACHE_LOCK_WAIT = env.float("CACHE_LOCK_WAIT", default=5)
+
+# Site settings are kept in a process-local LRU of SITE_SETTINGS_CACHE_SIZE
+# entries (0 disables), keyed by a version in Redis that is bumped whenever
+# any setting is saved. The settings of climweb apps are cached, along with
+# those of the third-party apps listed in SITE_SETTINGS_CACHE_EXTRA_MODELS.
+SITE_SETTINGS_CACHE_SIZE = env.int("SITE_SETTINGS_CACHE_SIZE", default=256)
+SITE_SETTINGS_CACHE_EXTRA_MODELS = [
+    "forecastmanager.ForecastSetting",
+    "adminboundarymanager.AdminBoundarySettings",
+]
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
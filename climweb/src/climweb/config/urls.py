@@ -14,9 +14,9 @@ from wagtail.admin import urls as wagtailadmin_urls
 from wagtail.contrib.sitemaps.views import sitemap
 from wagtail.documents import urls as wagtaildocs_urls
 from wagtail.urls import WAGTAIL_FRONTEND_LOGIN_TEMPLATE, serve_pattern
-from wagtailcache.cache import cache_page
 
 from climweb.base.registries import plugin_registry
+from climweb.base.cache import cache_page
 from climweb.base.views import humans, public_health_check, style_guide, style_guide_tokens
 from climweb.pages.search import views as search_views
 from .api import api_router
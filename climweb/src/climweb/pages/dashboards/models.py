@@ -32,6 +32,9 @@ class DashboardGalleryPage(Page):
 class DashboardPage(MetadataPageMixin, Page):
     template = 'dashboards/dashboard_page.html'
     parent_page_types = ['dashboards.DashboardGalleryPage']
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('news.NewsPage', 'publications.PublicationPage')
+
     banner_title = models.CharField(max_length=255)
     banner_description = RichTextField(help_text=_("Banner description"))
     banner_background_color = models.CharField(
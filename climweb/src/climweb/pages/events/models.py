@@ -77,6 +77,10 @@ class EventIndexPage(MetadataPageMixin, Page):
     parent_page_types = ['home.HomePage']
     max_count = 1
     show_in_menus = True
+    # snippets listed by query, whose changes purge this page from the cache
+    listed_snippet_models = (EventType,)
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('events.EventPage',)
     
     events_per_page = models.PositiveIntegerField(default=6, validators=[
         MinValueValidator(6),
@@ -0,0 +1,42 @@
+// Expand the compact home map forecast feed into one GeoJSON FeatureCollection
+// per forecast period, in the same shape as the legacy forecast endpoint.
+export const forecastFeedToCollections = (feed) => {
+    const {multi_period, cities, conditions, parameters = [], periods = []} = feed
+
+    const data = periods.map(period => {
+        const features = []
+
+        cities.name.forEach((cityName, cityIndex) => {
+            const conditionIndex = period.condition[cityIndex]
+            if (conditionIndex === null || conditionIndex === undefined) return
+
+            const properties = {
+                date: period.datetime,
+                effective_period_time: period.effective_period_time,
+                effective_period_label: period.effective_period_label,
+                city: cityName,
+                city_slug: cities.slug[cityIndex],
+                condition: conditions.symbol[conditionIndex],
+                condition_label: conditions.label[conditionIndex],
+                condition_symbol_url: new URL(conditions.icon_url[conditionIndex], window.location.origin).href,
+            }
+
+            parameters.forEach(parameter => {
+                const values = period.values[parameter]
+                if (values && values[cityIndex] !== null) {
+                    properties[parameter] = values[cityIndex]
+                }
+            })
+
+            features.push({
+                type: "Feature",
+                geometry: {type: "Point", coordinates: cities.coordinates[cityIndex]},
+                properties,
+            })
+        })
+
+        return {type: "FeatureCollection", date: period.date, datetime: period.datetime, features}
+    })
+
+    return {multi_period, data}
+}
@@ -1744,4 +1744,4 @@ input.p-select-label {
     height: ${e("select.lg.font.size")};
 }
 `,WV={root:function(t){var i=t.instance,c=t.props,p=t.state;return["p-select p-component p-inputwrapper",{"p-disabled":c.disabled,"p-invalid":i.$invalid,"p-variant-filled":i.$variant==="filled","p-focus":p.focused,"p-inputwrapper-filled":i.$filled,"p-inputwrapper-focus":p.focused||p.overlayVisible,"p-select-open":p.overlayVisible,"p-select-fluid":i.$fluid,"p-select-sm p-inputfield-sm":c.size==="small","p-select-lg p-inputfield-lg":c.size==="large"}]},label:function(t){var i=t.instance,c=t.props;return["p-select-label",{"p-placeholder":!c.editable&&i.label===c.placeholder,"p-select-label-empty":!c.editable&&!i.$slots.value&&(i.label==="p-emptylabel"||i.label.length===0)}]},clearIcon:"p-select-clear-icon",dropdown:"p-select-dropdown",loadingicon:"p-select-loading-icon",dropdownIcon:"p-select-dropdown-icon",overlay:"p-select-overlay p-component",header:"p-select-header",pcFilter:"p-select-filter",listContainer:"p-select-list-container",list:"p-select-list",optionGroup:"p-select-option-group",optionGroupLabel:"p-select-option-group-label",option:function(t){var i=t.instance,c=t.props,p=t.state,g=t.option,m=t.focusedOption;return["p-select-option",{"p-select-option-selected":i.isSelected(g)&&c.highlightOnSelect,"p-focus":p.focusedOptionIndex===m,"p-disabled":i.isOptionDisabled(g)}]},optionLabel:"p-select-option-label",optionCheckIcon:"p-select-option-check-icon",optionBlankIcon:"p-select-option-blank-icon",emptyMessage:"p-select-empty-message"},HV=$r.extend({name:"select",style:ZV,classes:WV}),qV={name:"BaseSelect",extends:om,props:{options:Array,optionLabel:[String,Function],optionValue:[String,Function],optionDisabled:[String,Function],optionGroupLabel:[String,Function],optionGroupChildren:[String,Function],scrollHeight:{type:String,default:"14rem"},filter:Boolean,filterPlaceholder:String,filterLocale:String,filterMatchMode:{type:String,default:"contains"},filterFields:{type:Array,default:null},editable:Boolean,placeholder:{type:String,default:null},dataKey:null,showClear:{type:Boolean,default:!1},inputId:{type:String,default:null},inputClass:{type:[String,Object],default:null},inputStyle:{type:Object,default:null},labelId:{type:String,default:null},labelClass:{type:[String,Object],default:null},labelStyle:{type:Object,default:null},panelClass:{type:[String,Object],default:null},overlayStyle:{type:Object,default:null},overlayClass:{type:[String,Object],default:null},panelStyle:{type:Object,default:null},appendTo:{type:[String,Object],default:"body"},loading:{type:Boolean,default:!1},clearIcon:{type:String,default:void 0},dropdownIcon:{type:String,default:void 0},filterIcon:{type:String,default:void 0},loadingIcon:{type:String,default:void 0},resetFilterOnHide:{type:Boolean,default:!1},resetFilterOnClear:{type:Boolean,default:!1},virtualScrollerOptions:{type:Object,default:null},autoOptionFocus:{type:Boolean,default:!1},autoFilterFocus:{type:Boolean,default:!1},selectOnFocus:{type:Boolean,default:!1},focusOnHover:{type:Boolean,default:!0},highlightOnSelect:{type:Boolean,default:!0},checkmark:{type:Boolean,default:!1},filterMessage:{type:String,default:null},selectionMessage:{type:String,default:null},emptySelectionMessage:{type:String,default:null},emptyFilterMessage:{type:String,default:null},emptyMessage:{type:String,default:null},tabindex:{type:Number,default:0},ariaLabel:{type:String,default:null},ariaLabelledby:{type:String,default:null}},style:HV,provide:function(){return{$pcSelect:this,$parentInstance:this}}};function bh(e){"@babel/helpers - typeof";return bh=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},bh(e)}function KV(e){return QV(e)||JV(e)||XV(e)||YV()}function YV(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function XV(e,t){if(e){if(typeof e=="string")return Dy(e,t);var i={}.toString.call(e).slice(8,-1);return i==="Object"&&e.constructor&&(i=e.constructor.name),i==="Map"||i==="Set"?Array.from(e):i==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?Dy(e,t):void 0}}function JV(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function QV(e){if(Array.isArray(e))return Dy(e)}function Dy(e,t){(t==null||t>e.length)&&(t=e.length);for(var i=0,c=Array(t);i<t;i++)c[i]=e[i];return c}function Vx(e,t){var i=Object.keys(e);if(Object.getOwnPropertySymbols){var c=Object.getOwnPropertySymbols(e);t&&(c=c.filter(function(p){return Object.getOwnPropertyDescriptor(e,p).enumerable})),i.push.apply(i,c)}return i}function Ux(e){for(var t=1;t<arguments.length;t++){var i=arguments[t]!=null?arguments[t]:{};t%2?Vx(Object(i),!0).forEach(function(c){sC(e,c,i[c])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(i)):Vx(Object(i)).forEach(function(c){Object.defineProperty(e,c,Object.getOwnPropertyDescriptor(i,c))})}return e}function sC(e,t,i){return(t=e9(t))in e?Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}):e[t]=i,e}function e9(e){var t=t9(e,"string");return bh(t)=="symbol"?t:t+""}function t9(e,t){if(bh(e)!="object"||!e)return e;var i=e[Symbol.toPrimitive];if(i!==void 0){var c=i.call(e,t);if(bh(c)!="object")return c;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var aC={name:"Select",extends:qV,inheritAttrs:!1,emits:["change","focus","blur","before-show","before-hide","show","hide","filter"],outsideClickListener:null,scrollHandler:null,resizeListener:null,labelClickListener:null,matchMediaOrientationListener:null,overlay:null,list:null,virtualScroller:null,searchTimeout:null,searchValue:null,isModelValueChanged:!1,data:function(){return{clicked:!1,focused:!1,focusedOptionIndex:-1,filterValue:null,overlayVisible:!1,queryOrientation:null}},watch:{modelValue:function(){this.isModelValueChanged=!0},options:function(){this.autoUpdateModel()}},mounted:function(){this.autoUpdateModel(),this.bindLabelClickListener(),this.bindMatchMediaOrientationListener()},updated:function(){this.overlayVisible&&this.isModelValueChanged&&this.scrollInView(this.findSelectedOptionIndex()),this.isModelValueChanged=!1},beforeUnmount:function(){this.unbindOutsideClickListener(),this.unbindResizeListener(),this.unbindLabelClickListener(),this.unbindMatchMediaOrientationListener(),this.scrollHandler&&(this.scrollHandler.destroy(),this.scrollHandler=null),this.overlay&&(Zc.clear(this.overlay),this.overlay=null)},methods:{getOptionIndex:function(t,i){return this.virtualScrollerDisabled?t:i&&i(t).index},getOptionLabel:function(t){return this.optionLabel?As(t,this.optionLabel):t},getOptionValue:function(t){return this.optionValue?As(t,this.optionValue):t},getOptionRenderKey:function(t,i){return(this.dataKey?As(t,this.dataKey):this.getOptionLabel(t))+"_"+i},getPTItemOptions:function(t,i,c,p){return this.ptm(p,{context:{option:t,index:c,selected:this.isSelected(t),focused:this.focusedOptionIndex===this.getOptionIndex(c,i),disabled:this.isOptionDisabled(t)}})},isOptionDisabled:function(t){return this.optionDisabled?As(t,this.optionDisabled):!1},isOptionGroup:function(t){return this.optionGroupLabel&&t.optionGroup&&t.group},getOptionGroupLabel:function(t){return As(t,this.optionGroupLabel)},getOptionGroupChildren:function(t){return As(t,this.optionGroupChildren)},getAriaPosInset:function(t){var i=this;return(this.optionGroupLabel?t-this.visibleOptions.slice(0,t).filter(function(c){return i.isOptionGroup(c)}).length:t)+1},show:function(t){this.$emit("before-show"),this.overlayVisible=!0,this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),t&&io(this.$refs.focusInput)},hide:function(t){var i=this,c=function(){i.$emit("before-hide"),i.overlayVisible=!1,i.clicked=!1,i.focusedOptionIndex=-1,i.searchValue="",i.resetFilterOnHide&&(i.filterValue=null),t&&io(i.$refs.focusInput)};setTimeout(function(){c()},0)},onFocus:function(t){this.disabled||(this.focused=!0,this.overlayVisible&&(this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),this.scrollInView(this.focusedOptionIndex)),this.$emit("focus",t))},onBlur:function(t){var i,c;this.focused=!1,this.focusedOptionIndex=-1,this.searchValue="",this.$emit("blur",t),(i=(c=this.formField).onBlur)===null||i===void 0||i.call(c,t)},onKeyDown:function(t){if(this.disabled||rE()){t.preventDefault();return}var i=t.metaKey||t.ctrlKey;switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,this.editable);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,this.editable);break;case"Home":this.onHomeKey(t,this.editable);break;case"End":this.onEndKey(t,this.editable);break;case"PageDown":this.onPageDownKey(t);break;case"PageUp":this.onPageUpKey(t);break;case"Space":this.onSpaceKey(t,this.editable);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t);break;case"Backspace":this.onBackspaceKey(t,this.editable);break;case"ShiftLeft":case"ShiftRight":break;default:!i&&GM(t.key)&&(!this.overlayVisible&&this.show(),!this.editable&&this.searchOptions(t,t.key));break}this.clicked=!1},onEditableInput:function(t){var i=t.target.value;this.searchValue="";var c=this.searchOptions(t,i);!c&&(this.focusedOptionIndex=-1),this.updateModel(t,i),!this.overlayVisible&&Tr(i)&&this.show()},onContainerClick:function(t){this.disabled||this.loading||t.target.tagName==="INPUT"||t.target.getAttribute("data-pc-section")==="clearicon"||t.target.closest('[data-pc-section="clearicon"]')||((!this.overlay||!this.overlay.contains(t.target))&&(this.overlayVisible?this.hide(!0):this.show(!0)),this.clicked=!0)},onClearClick:function(t){this.updateModel(t,null),this.resetFilterOnClear&&(this.filterValue=null)},onFirstHiddenFocus:function(t){var i=t.relatedTarget===this.$refs.focusInput?zc(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;io(i)},onLastHiddenFocus:function(t){var i=t.relatedTarget===this.$refs.focusInput?jw(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;io(i)},onOptionSelect:function(t,i){var c=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,p=this.getOptionValue(i);this.updateModel(t,p),c&&this.hide(!0)},onOptionMouseMove:function(t,i){this.focusOnHover&&this.changeFocusedOptionIndex(t,i)},onFilterChange:function(t){var i=t.target.value;this.filterValue=i,this.focusedOptionIndex=-1,this.$emit("filter",{originalEvent:t,value:i}),!this.virtualScrollerDisabled&&this.virtualScroller.scrollToIndex(0)},onFilterKeyDown:function(t){if(!t.isComposing)switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,!0);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,!0);break;case"Home":this.onHomeKey(t,!0);break;case"End":this.onEndKey(t,!0);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t,!0);break}},onFilterBlur:function(){this.focusedOptionIndex=-1},onFilterUpdated:function(){this.overlayVisible&&this.alignOverlay()},onOverlayClick:function(t){Ed.emit("overlay-click",{originalEvent:t,target:this.$el})},onOverlayKeyDown:function(t){switch(t.code){case"Escape":this.onEscapeKey(t);break}},onArrowDownKey:function(t){if(!this.overlayVisible)this.show(),this.editable&&this.changeFocusedOptionIndex(t,this.findSelectedOptionIndex());else{var i=this.focusedOptionIndex!==-1?this.findNextOptionIndex(this.focusedOptionIndex):this.clicked?this.findFirstOptionIndex():this.findFirstFocusedOptionIndex();this.changeFocusedOptionIndex(t,i)}t.preventDefault()},onArrowUpKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(t.altKey&&!i)this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(),t.preventDefault();else{var c=this.focusedOptionIndex!==-1?this.findPrevOptionIndex(this.focusedOptionIndex):this.clicked?this.findLastOptionIndex():this.findLastFocusedOptionIndex();this.changeFocusedOptionIndex(t,c),!this.overlayVisible&&this.show(),t.preventDefault()}},onArrowLeftKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i&&(this.focusedOptionIndex=-1)},onHomeKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(i){var c=t.currentTarget;t.shiftKey?c.setSelectionRange(0,t.target.selectionStart):(c.setSelectionRange(0,0),this.focusedOptionIndex=-1)}else this.changeFocusedOptionIndex(t,this.findFirstOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onEndKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(i){var c=t.currentTarget;if(t.shiftKey)c.setSelectionRange(t.target.selectionStart,c.value.length);else{var p=c.value.length;c.setSelectionRange(p,p),this.focusedOptionIndex=-1}}else this.changeFocusedOptionIndex(t,this.findLastOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onPageUpKey:function(t){this.scrollInView(0),t.preventDefault()},onPageDownKey:function(t){this.scrollInView(this.visibleOptions.length-1),t.preventDefault()},onEnterKey:function(t){this.overlayVisible?(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.hide()):(this.focusedOptionIndex=-1,this.onArrowDownKey(t)),t.preventDefault()},onSpaceKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;!i&&this.onEnterKey(t)},onEscapeKey:function(t){this.overlayVisible&&this.hide(!0),t.preventDefault(),t.stopPropagation()},onTabKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i||(this.overlayVisible&&this.hasFocusableElements()?(io(this.$refs.firstHiddenFocusableElementOnOverlay),t.preventDefault()):(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(this.filter)))},onBackspaceKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i&&!this.overlayVisible&&this.show()},onOverlayEnter:function(t){var i=this;Zc.set("overlay",t,this.$primevue.config.zIndex.overlay),$w(t,{position:"absolute",top:"0",left:"0"}),this.alignOverlay(),this.scrollInView(),setTimeout(function(){i.autoFilterFocus&&i.filter&&io(i.$refs.filterInput.$el),i.autoUpdateModel()},1)},onOverlayAfterEnter:function(){this.bindOutsideClickListener(),this.bindScrollListener(),this.bindResizeListener(),this.$emit("show")},onOverlayLeave:function(){var t=this;this.unbindOutsideClickListener(),this.unbindScrollListener(),this.unbindResizeListener(),this.autoFilterFocus&&this.filter&&!this.editable&&this.$nextTick(function(){t.$refs.filterInput&&io(t.$refs.filterInput.$el)}),this.$emit("hide"),this.overlay=null},onOverlayAfterLeave:function(t){Zc.clear(t)},alignOverlay:function(){this.appendTo==="self"?YM(this.overlay,this.$el):this.overlay&&(this.overlay.style.minWidth=Bw(this.$el)+"px",zw(this.overlay,this.$el))},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(i){t.overlayVisible&&t.overlay&&!t.$el.contains(i.target)&&!t.overlay.contains(i.target)&&t.hide()},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null)},bindScrollListener:function(){var t=this;this.scrollHandler||(this.scrollHandler=new m2(this.$refs.container,function(){t.overlayVisible&&t.hide()})),this.scrollHandler.bindScrollListener()},unbindScrollListener:function(){this.scrollHandler&&this.scrollHandler.unbindScrollListener()},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(){t.overlayVisible&&!Uw()&&t.hide()},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)},bindLabelClickListener:function(){var t=this;if(!this.editable&&!this.labelClickListener){var i=document.querySelector('label[for="'.concat(this.labelId,'"]'));i&&Cp(i)&&(this.labelClickListener=function(){io(t.$refs.focusInput)},i.addEventListener("click",this.labelClickListener))}},unbindLabelClickListener:function(){if(this.labelClickListener){var t=document.querySelector('label[for="'.concat(this.labelId,'"]'));t&&Cp(t)&&t.removeEventListener("click",this.labelClickListener)}},bindMatchMediaOrientationListener:function(){var t=this;if(!this.matchMediaOrientationListener){var i=matchMedia("(orientation: portrait)");this.queryOrientation=i,this.matchMediaOrientationListener=function(){t.alignOverlay()},this.queryOrientation.addEventListener("change",this.matchMediaOrientationListener)}},unbindMatchMediaOrientationListener:function(){this.matchMediaOrientationListener&&(this.queryOrientation.removeEventListener("change",this.matchMediaOrientationListener),this.queryOrientation=null,this.matchMediaOrientationListener=null)},hasFocusableElements:function(){return __(this.overlay,':not([data-p-hidden-focusable="true"])').length>0},isOptionExactMatched:function(t){var i;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((i=this.getOptionLabel(t))===null||i===void 0?void 0:i.toLocaleLowerCase(this.filterLocale))==this.searchValue.toLocaleLowerCase(this.filterLocale)},isOptionStartsWith:function(t){var i;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((i=this.getOptionLabel(t))===null||i===void 0?void 0:i.toLocaleLowerCase(this.filterLocale).startsWith(this.searchValue.toLocaleLowerCase(this.filterLocale)))},isValidOption:function(t){return Tr(t)&&!(this.isOptionDisabled(t)||this.isOptionGroup(t))},isValidSelectedOption:function(t){return this.isValidOption(t)&&this.isSelected(t)},isSelected:function(t){return Th(this.d_value,this.getOptionValue(t),this.equalityKey)},findFirstOptionIndex:function(){var t=this;return this.visibleOptions.findIndex(function(i){return t.isValidOption(i)})},findLastOptionIndex:function(){var t=this;return Rv(this.visibleOptions,function(i){return t.isValidOption(i)})},findNextOptionIndex:function(t){var i=this,c=t<this.visibleOptions.length-1?this.visibleOptions.slice(t+1).findIndex(function(p){return i.isValidOption(p)}):-1;return c>-1?c+t+1:t},findPrevOptionIndex:function(t){var i=this,c=t>0?Rv(this.visibleOptions.slice(0,t),function(p){return i.isValidOption(p)}):-1;return c>-1?c:t},findSelectedOptionIndex:function(){var t=this;return this.$filled?this.visibleOptions.findIndex(function(i){return t.isValidSelectedOption(i)}):-1},findFirstFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findFirstOptionIndex():t},findLastFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findLastOptionIndex():t},searchOptions:function(t,i){var c=this;this.searchValue=(this.searchValue||"")+i;var p=-1,g=!1;return Tr(this.searchValue)&&(p=this.visibleOptions.findIndex(function(m){return c.isOptionExactMatched(m)}),p===-1&&(p=this.visibleOptions.findIndex(function(m){return c.isOptionStartsWith(m)})),p!==-1&&(g=!0),p===-1&&this.focusedOptionIndex===-1&&(p=this.findFirstFocusedOptionIndex()),p!==-1&&this.changeFocusedOptionIndex(t,p)),this.searchTimeout&&clearTimeout(this.searchTimeout),this.searchTimeout=setTimeout(function(){c.searchValue="",c.searchTimeout=null},500),g},changeFocusedOptionIndex:function(t,i){this.focusedOptionIndex!==i&&(this.focusedOptionIndex=i,this.scrollInView(),this.selectOnFocus&&this.onOptionSelect(t,this.visibleOptions[i],!1))},scrollInView:function(){var t=this,i=arguments.length>0&&arguments[0]!==void 0?arguments[0]:-1;this.$nextTick(function(){var c=i!==-1?"".concat(t.$id,"_").concat(i):t.focusedOptionId,p=em(t.list,'li[id="'.concat(c,'"]'));p?p.scrollIntoView&&p.scrollIntoView({block:"nearest",inline:"nearest"}):t.virtualScrollerDisabled||t.virtualScroller&&t.virtualScroller.scrollToIndex(i!==-1?i:t.focusedOptionIndex)})},autoUpdateModel:function(){this.autoOptionFocus&&(this.focusedOptionIndex=this.findFirstFocusedOptionIndex()),this.selectOnFocus&&this.autoOptionFocus&&!this.$filled&&this.onOptionSelect(null,this.visibleOptions[this.focusedOptionIndex],!1)},updateModel:function(t,i){this.writeValue(i,t),this.$emit("change",{originalEvent:t,value:i})},flatOptions:function(t){var i=this;return(t||[]).reduce(function(c,p,g){c.push({optionGroup:p,group:!0,index:g});var m=i.getOptionGroupChildren(p);return m&&m.forEach(function(l){return c.push(l)}),c},[])},overlayRef:function(t){this.overlay=t},listRef:function(t,i){this.list=t,i&&i(t)},virtualScrollerRef:function(t){this.virtualScroller=t}},computed:{visibleOptions:function(){var t=this,i=this.optionGroupLabel?this.flatOptions(this.options):this.options||[];if(this.filterValue){var c=gE.filter(i,this.searchFields,this.filterValue,this.filterMatchMode,this.filterLocale);if(this.optionGroupLabel){var p=this.options||[],g=[];return p.forEach(function(m){var l=t.getOptionGroupChildren(m),S=l.filter(function(I){return c.includes(I)});S.length>0&&g.push(Ux(Ux({},m),{},sC({},typeof t.optionGroupChildren=="string"?t.optionGroupChildren:"items",KV(S))))}),this.flatOptions(g)}return c}return i},hasSelectedOption:function(){return this.$filled},label:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.placeholder||"p-emptylabel"},editableInputValue:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.d_value||""},equalityKey:function(){return this.optionValue?null:this.dataKey},searchFields:function(){return this.filterFields||[this.optionLabel]},filterResultMessageText:function(){return Tr(this.visibleOptions)?this.filterMessageText.replaceAll("{0}",this.visibleOptions.length):this.emptyFilterMessageText},filterMessageText:function(){return this.filterMessage||this.$primevue.config.locale.searchMessage||""},emptyFilterMessageText:function(){return this.emptyFilterMessage||this.$primevue.config.locale.emptySearchMessage||this.$primevue.config.locale.emptyFilterMessage||""},emptyMessageText:function(){return this.emptyMessage||this.$primevue.config.locale.emptyMessage||""},selectionMessageText:function(){return this.selectionMessage||this.$primevue.config.locale.selectionMessage||""},emptySelectionMessageText:function(){return this.emptySelectionMessage||this.$primevue.config.locale.emptySelectionMessage||""},selectedMessageText:function(){return this.$filled?this.selectionMessageText.replaceAll("{0}","1"):this.emptySelectionMessageText},focusedOptionId:function(){return this.focusedOptionIndex!==-1?"".concat(this.$id,"_").concat(this.focusedOptionIndex):null},ariaSetSize:function(){var t=this;return this.visibleOptions.filter(function(i){return!t.isOptionGroup(i)}).length},isClearIconVisible:function(){return this.showClear&&this.d_value!=null&&Tr(this.options)},virtualScrollerDisabled:function(){return!this.virtualScrollerOptions}},directives:{ripple:g2},components:{InputText:nC,VirtualScroller:oC,Portal:w_,InputIcon:rC,IconField:tC,TimesIcon:eC,ChevronDownIcon:J2,SpinnerIcon:E_,SearchIcon:Q2,CheckIcon:M_,BlankIcon:X2}},r9=["id"],n9=["name","id","value","placeholder","tabindex","disabled","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid"],i9=["name","id","tabindex","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid","aria-disabled"],o9=["id"],s9=["id"],a9=["id","aria-label","aria-selected","aria-disabled","aria-setsize","aria-posinset","onClick","onMousemove","data-p-selected","data-p-focused","data-p-disabled"];function l9(e,t,i,c,p,g){var m=no("SpinnerIcon"),l=no("InputText"),S=no("SearchIcon"),I=no("InputIcon"),A=no("IconField"),z=no("CheckIcon"),O=no("BlankIcon"),D=no("VirtualScroller"),H=no("Portal"),ue=B1("ripple");return gt(),Ct("div",Bt({ref:"container",id:e.$id,class:e.cx("root"),onClick:t[11]||(t[11]=function(){return g.onContainerClick&&g.onContainerClick.apply(g,arguments)})},e.ptmi("root")),[e.editable?(gt(),Ct("input",Bt({key:0,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,type:"text",class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],value:g.editableInputValue,placeholder:e.placeholder,tabindex:e.disabled?-1:e.tabindex,disabled:e.disabled,autocomplete:"off",role:"combobox","aria-label":e.ariaLabel,"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":p.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":p.focused?g.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,onFocus:t[0]||(t[0]=function(){return g.onFocus&&g.onFocus.apply(g,arguments)}),onBlur:t[1]||(t[1]=function(){return g.onBlur&&g.onBlur.apply(g,arguments)}),onKeydown:t[2]||(t[2]=function(){return g.onKeyDown&&g.onKeyDown.apply(g,arguments)}),onInput:t[3]||(t[3]=function(){return g.onEditableInput&&g.onEditableInput.apply(g,arguments)})},e.ptm("label")),null,16,n9)):(gt(),Ct("span",Bt({key:1,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],tabindex:e.disabled?-1:e.tabindex,role:"combobox","aria-label":e.ariaLabel||(g.label==="p-emptylabel"?void 0:g.label),"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":p.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":p.focused?g.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,"aria-disabled":e.disabled,onFocus:t[4]||(t[4]=function(){return g.onFocus&&g.onFocus.apply(g,arguments)}),onBlur:t[5]||(t[5]=function(){return g.onBlur&&g.onBlur.apply(g,arguments)}),onKeydown:t[6]||(t[6]=function(){return g.onKeyDown&&g.onKeyDown.apply(g,arguments)})},e.ptm("label")),[cn(e.$slots,"value",{value:e.d_value,placeholder:e.placeholder},function(){var _e;return[ap(ar(g.label==="p-emptylabel"?" ":(_e=g.label)!==null&&_e!==void 0?_e:"empty"),1)]})],16,i9)),g.isClearIconVisible?cn(e.$slots,"clearicon",{key:2,class:Lo(e.cx("clearIcon")),clearCallback:g.onClearClick},function(){return[(gt(),jn(ey(e.clearIcon?"i":"TimesIcon"),Bt({ref:"clearIcon",class:[e.cx("clearIcon"),e.clearIcon],onClick:g.onClearClick},e.ptm("clearIcon"),{"data-pc-section":"clearicon"}),null,16,["class","onClick"]))]}):Pr("",!0),st("div",Bt({class:e.cx("dropdown")},e.ptm("dropdown")),[e.loading?cn(e.$slots,"loadingicon",{key:0,class:Lo(e.cx("loadingIcon"))},function(){return[e.loadingIcon?(gt(),Ct("span",Bt({key:0,class:[e.cx("loadingIcon"),"pi-spin",e.loadingIcon],"aria-hidden":"true"},e.ptm("loadingIcon")),null,16)):(gt(),jn(m,Bt({key:1,class:e.cx("loadingIcon"),spin:"","aria-hidden":"true"},e.ptm("loadingIcon")),null,16,["class"]))]}):cn(e.$slots,"dropdownicon",{key:1,class:Lo(e.cx("dropdownIcon"))},function(){return[(gt(),jn(ey(e.dropdownIcon?"span":"ChevronDownIcon"),Bt({class:[e.cx("dropdownIcon"),e.dropdownIcon],"aria-hidden":"true"},e.ptm("dropdownIcon")),null,16,["class"]))]})],16),Sr(H,{appendTo:e.appendTo},{default:Jo(function(){return[Sr(cw,Bt({name:"p-connected-overlay",onEnter:g.onOverlayEnter,onAfterEnter:g.onOverlayAfterEnter,onLeave:g.onOverlayLeave,onAfterLeave:g.onOverlayAfterLeave},e.ptm("transition")),{default:Jo(function(){return[p.overlayVisible?(gt(),Ct("div",Bt({key:0,ref:g.overlayRef,class:[e.cx("overlay"),e.panelClass,e.overlayClass],style:[e.panelStyle,e.overlayStyle],onClick:t[9]||(t[9]=function(){return g.onOverlayClick&&g.onOverlayClick.apply(g,arguments)}),onKeydown:t[10]||(t[10]=function(){return g.onOverlayKeyDown&&g.onOverlayKeyDown.apply(g,arguments)})},e.ptm("overlay")),[st("span",Bt({ref:"firstHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[7]||(t[7]=function(){return g.onFirstHiddenFocus&&g.onFirstHiddenFocus.apply(g,arguments)})},e.ptm("hiddenFirstFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16),cn(e.$slots,"header",{value:e.d_value,options:g.visibleOptions}),e.filter?(gt(),Ct("div",Bt({key:0,class:e.cx("header")},e.ptm("header")),[Sr(A,{unstyled:e.unstyled,pt:e.ptm("pcFilterContainer")},{default:Jo(function(){return[Sr(l,{ref:"filterInput",type:"text",value:p.filterValue,onVnodeMounted:g.onFilterUpdated,onVnodeUpdated:g.onFilterUpdated,class:Lo(e.cx("pcFilter")),placeholder:e.filterPlaceholder,variant:e.variant,unstyled:e.unstyled,role:"searchbox",autocomplete:"off","aria-owns":e.$id+"_list","aria-activedescendant":g.focusedOptionId,onKeydown:g.onFilterKeyDown,onBlur:g.onFilterBlur,onInput:g.onFilterChange,pt:e.ptm("pcFilter"),formControl:{novalidate:!0}},null,8,["value","onVnodeMounted","onVnodeUpdated","class","placeholder","variant","unstyled","aria-owns","aria-activedescendant","onKeydown","onBlur","onInput","pt"]),Sr(I,{unstyled:e.unstyled,pt:e.ptm("pcFilterIconContainer")},{default:Jo(function(){return[cn(e.$slots,"filtericon",{},function(){return[e.filterIcon?(gt(),Ct("span",Bt({key:0,class:e.filterIcon},e.ptm("filterIcon")),null,16)):(gt(),jn(S,Xx(Bt({key:1},e.ptm("filterIcon"))),null,16))]})]}),_:3},8,["unstyled","pt"])]}),_:3},8,["unstyled","pt"]),st("span",Bt({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenFilterResult"),{"data-p-hidden-accessible":!0}),ar(g.filterResultMessageText),17)],16)):Pr("",!0),st("div",Bt({class:e.cx("listContainer"),style:{"max-height":g.virtualScrollerDisabled?e.scrollHeight:""}},e.ptm("listContainer")),[Sr(D,Bt({ref:g.virtualScrollerRef},e.virtualScrollerOptions,{items:g.visibleOptions,style:{height:e.scrollHeight},tabindex:-1,disabled:g.virtualScrollerDisabled,pt:e.ptm("virtualScroller")}),Xk({content:Jo(function(_e){var ie=_e.styleClass,xe=_e.contentRef,Ce=_e.items,J=_e.getItemOptions,we=_e.contentStyle,$e=_e.itemSize;return[st("ul",Bt({ref:function(Ue){return g.listRef(Ue,xe)},id:e.$id+"_list",class:[e.cx("list"),ie],style:we,role:"listbox"},e.ptm("list")),[(gt(!0),Ct(Rr,null,vo(Ce,function(Pe,Ue){return gt(),Ct(Rr,{key:g.getOptionRenderKey(Pe,g.getOptionIndex(Ue,J))},[g.isOptionGroup(Pe)?(gt(),Ct("li",Bt({key:0,id:e.$id+"_"+g.getOptionIndex(Ue,J),style:{height:$e?$e+"px":void 0},class:e.cx("optionGroup"),role:"option",ref_for:!0},e.ptm("optionGroup")),[cn(e.$slots,"optiongroup",{option:Pe.optionGroup,index:g.getOptionIndex(Ue,J)},function(){return[st("span",Bt({class:e.cx("optionGroupLabel"),ref_for:!0},e.ptm("optionGroupLabel")),ar(g.getOptionGroupLabel(Pe.optionGroup)),17)]})],16,s9)):S1((gt(),Ct("li",Bt({key:1,id:e.$id+"_"+g.getOptionIndex(Ue,J),class:e.cx("option",{option:Pe,focusedOption:g.getOptionIndex(Ue,J)}),style:{height:$e?$e+"px":void 0},role:"option","aria-label":g.getOptionLabel(Pe),"aria-selected":g.isSelected(Pe),"aria-disabled":g.isOptionDisabled(Pe),"aria-setsize":g.ariaSetSize,"aria-posinset":g.getAriaPosInset(g.getOptionIndex(Ue,J)),onClick:function(mt){return g.onOptionSelect(mt,Pe)},onMousemove:function(mt){return g.onOptionMouseMove(mt,g.getOptionIndex(Ue,J))},"data-p-selected":g.isSelected(Pe),"data-p-focused":p.focusedOptionIndex===g.getOptionIndex(Ue,J),"data-p-disabled":g.isOptionDisabled(Pe),ref_for:!0},g.getPTItemOptions(Pe,J,Ue,"option")),[e.checkmark?(gt(),Ct(Rr,{key:0},[g.isSelected(Pe)?(gt(),jn(z,Bt({key:0,class:e.cx("optionCheckIcon"),ref_for:!0},e.ptm("optionCheckIcon")),null,16,["class"])):(gt(),jn(O,Bt({key:1,class:e.cx("optionBlankIcon"),ref_for:!0},e.ptm("optionBlankIcon")),null,16,["class"]))],64)):Pr("",!0),cn(e.$slots,"option",{option:Pe,selected:g.isSelected(Pe),index:g.getOptionIndex(Ue,J)},function(){return[st("span",Bt({class:e.cx("optionLabel"),ref_for:!0},e.ptm("optionLabel")),ar(g.getOptionLabel(Pe)),17)]})],16,a9)),[[ue]])],64)}),128)),p.filterValue&&(!Ce||Ce&&Ce.length===0)?(gt(),Ct("li",Bt({key:0,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[cn(e.$slots,"emptyfilter",{},function(){return[ap(ar(g.emptyFilterMessageText),1)]})],16)):!e.options||e.options&&e.options.length===0?(gt(),Ct("li",Bt({key:1,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[cn(e.$slots,"empty",{},function(){return[ap(ar(g.emptyMessageText),1)]})],16)):Pr("",!0)],16,o9)]}),_:2},[e.$slots.loader?{name:"loader",fn:Jo(function(_e){var ie=_e.options;return[cn(e.$slots,"loader",{options:ie})]}),key:"0"}:void 0]),1040,["items","style","disabled","pt"])],16),cn(e.$slots,"footer",{value:e.d_value,options:g.visibleOptions}),!e.options||e.options&&e.options.length===0?(gt(),Ct("span",Bt({key:1,role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenEmptyMessage"),{"data-p-hidden-accessible":!0}),ar(g.emptyMessageText),17)):Pr("",!0),st("span",Bt({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenSelectedMessage"),{"data-p-hidden-accessible":!0}),ar(g.selectedMessageText),17),st("span",Bt({ref:"lastHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[8]||(t[8]=function(){return g.onLastHiddenFocus&&g.onLastHiddenFocus.apply(g,arguments)})},e.ptm("hiddenLastFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16)],16)):Pr("",!0)]}),_:3},16,["onEnter","onAfterEnter","onLeave","onAfterLeave"])]}),_:3},8,["appendTo"])],16,r9)}aC.render=l9;const c9={class:"map-options"},u9={class:"basemap-options"},d9=["for"],h9=["for"],f9={class:"boundary-check"},p9={for:"boundary",class:"boundary-label"},m9={key:0,class:"zoom-locations"},g9={__name:"MapOptions",setup(e){const t=Ph(),{t:i}=wl({locale:"en",messages:{en:{mapOptions:{boundaries:"Boundaries"}},fr:{mapOptions:{boundaries:"Frontières"}},ar:{mapOptions:{boundaries:"الحدود"}},am:{mapOptions:{boundaries:"ድንበሮች"}},es:{mapOptions:{boundaries:"Fronteras"}},sw:{mapOptions:{boundaries:"Mipaka"}}}});return(c,p)=>(gt(),Ct("div",c9,[st("div",u9,[mr(t).usingApiStyle?(gt(!0),Ct(Rr,{key:0},vo(mr(t).apiBaseMaps,g=>(gt(),Ct("div",{key:g.id,class:"basemap-item"},[Sr(mr(Ly),{modelValue:mr(t).selectedApiBaseMap,"onUpdate:modelValue":p[0]||(p[0]=m=>mr(t).selectedApiBaseMap=m),inputId:g.id,name:"basemap",value:g.id,class:"basemap-input"},null,8,["modelValue","inputId","value"]),st("label",{for:g.id},ar(g.label),9,d9)]))),128)):(gt(!0),Ct(Rr,{key:1},vo(mr(t).basemaps,g=>(gt(),Ct("div",{key:g.value,class:"basemap-item"},[Sr(mr(Ly),{modelValue:mr(t).selectedBasemap,"onUpdate:modelValue":p[1]||(p[1]=m=>mr(t).selectedBasemap=m),inputId:g.value,name:"basemap",value:g.value,class:"basemap-input"},null,8,["modelValue","inputId","value"]),st("label",{for:g.value},ar(g.label),9,h9)]))),128))]),p[5]||(p[5]=st("div",{class:"divisor"},null,-1)),st("div",f9,[Sr(mr(Y2),{modelValue:mr(t).showBoundary,"onUpdate:modelValue":p[2]||(p[2]=g=>mr(t).showBoundary=g),inputId:"boundary",name:"boundary",value:"yes",binary:""},null,8,["modelValue"]),st("label",p9,ar(mr(i)("mapOptions.boundaries")),1)]),p[6]||(p[6]=st("div",{class:"divisor"},null,-1)),mr(t).zoomLocations?(gt(),Ct("div",m9,[p[4]||(p[4]=st("label",{class:"zoom-locations-label",for:"zoom_location"},"Zoom Locations",-1)),Sr(mr(aC),{inputId:"zoom_location",modelValue:mr(t).selectedZoomLocation,"onUpdate:modelValue":p[3]||(p[3]=g=>mr(t).selectedZoomLocation=g),options:mr(t).zoomLocations,optionLabel:"name",optionValue:"id",size:"small",placeholder:"Select location"},null,8,["modelValue","options"])])):Pr("",!0)]))}},y9=Bo(g9,[["__scopeId","data-v-77953f81"]]),_9={class:"popup"},b9={class:"alert-severity-label"},v9={class:"alert-meta"},x9={class:"alert-meta-item"},w9={class:"alert-meta-label"},C9={class:"alert-meta-value"},S9={class:"alert-meta-item"},k9={class:"alert-meta-label"},T9={class:"alert-meta-value"},P9={class:"alert-meta-item"},I9={class:"alert-meta-label"},M9={class:"alert-meta-value"},E9={class:"alert-meta-item"},A9={class:"alert-meta-label"},L9={class:"alert-meta-value"},R9={class:"alert-meta-item"},D9={class:"alert-meta-label"},O9={class:"alert-meta-value"},z9={class:"alert-detail"},$9={class:"alert-event"},B9={class:"alert-headline"},F9=["href"],N9={__name:"CAPWarningPopup",props:{properties:{type:Object,required:!0}},setup(e){const t=e,{t:i}=wl({locale:"en",messages:{en:{alert:{certainty:"Certainty",urgency:"Urgency",sent:"Sent",onset:"Onset",expires:"Expires",event:"Event",headline:"Headline",moreDetail:"More Detail"}},fr:{alert:{certainty:"Certitude",urgency:"Urgence",sent:"Envoyé",onset:"Début",expires:"Expire",event:"Événement",headline:"Titre",moreDetail:"Plus de détails"}},ar:{alert:{certainty:"اليقين",urgency:"الاستعجال",sent:"تم الإرسال",onset:"البداية",expires:"تنتهي",event:"الحدث",headline:"العنوان",moreDetail:"مزيد من التفاصيل"}},am:{alert:{certainty:"እርግጠኝነት",urgency:"አስቸኳይነት",sent:"ተልኳል",onset:"መጀመሪያ",expires:"ጊዜው ያበቃል",event:"ክስተት",headline:"ርዕስ",moreDetail:"ተጨማሪ መረጃ"}},es:{alert:{certainty:"Certeza",urgency:"Urgencia",sent:"Enviado",onset:"Comienzo",expires:"Expira",event:"Evento",headline:"Titular",moreDetail:"Más detalles"}},sw:{alert:{certainty:"Uhakika",urgency:"Uharaka",sent:"Imetumwa",onset:"Mwanzo",expires:"Inaisha",event:"Tukio",headline:"Kichwa cha Habari",moreDetail:"Maelezo Zaidi"}}}}),c=dr(()=>{const p={...t.properties};if(p){if(p.sent){const g=rm(p.sent);if(p.sent=IF(g,{addSuffix:!0}),p.onset){const m=Date.parse(p.onset),l=new Date(m);p.onset=hp(l,"MMM dd yyyy, HH:MM")}else p.onset=hp(g,"MMM dd yyyy, HH:MM")}if(p.expires){const g=Date.parse(p.expires),m=new Date(g);p.expires=hp(m,"MMM dd yyyy, HH:MM")}return p}return null});return(p,g)=>(gt(),Ct("div",_9,[st("div",{class:"alert-severity",style:ns({backgroundColor:c.value.severity_color})},[g[0]||(g[0]=st("div",{class:"alert-icon"},[st("svg",null,[st("use",{"xlink:href":"#icon-warning"})])],-1)),st("div",b9,ar(c.value.severity),1)],4),st("div",v9,[st("div",x9,[st("div",w9,ar(mr(i)("alert.certainty")),1),st("div",C9,ar(c.value.certainty),1)]),st("div",S9,[st("div",k9,ar(mr(i)("alert.urgency")),1),st("div",T9,ar(c.value.urgency),1)]),st("div",P9,[st("div",I9,ar(mr(i)("alert.sent")),1),st("div",M9,ar(c.value.sent),1)]),st("div",E9,[st("div",A9,ar(mr(i)("alert.onset")),1),st("div",L9,ar(c.value.onset),1)]),st("div",R9,[st("div",D9,ar(mr(i)("alert.expires")),1),st("div",O9,ar(c.value.expires),1)])]),st("div",z9,[st("div",$9,ar(c.value.event),1),st("div",B9,ar(c.value.headline),1)]),c.value.web?(gt(),Ct("a",{key:0,href:c.value.web,target:"_blank",class:"alert-link"},ar(mr(i)("alert.moreDetail")),9,F9)):Pr("",!0)]))}},j9=Bo(N9,[["__scopeId","data-v-f5649f8b"]]),V9={key:0,class:"popup"},U9={class:"location-name"},G9={key:0,class:"condition"},Z9={class:"condition-icon"},W9=["src"],H9={class:"condition-label"},q9={class:"forecast-data-table"},K9={class:"forecast-name"},Y9={class:"forecast-value"},X9=["href"],J9={__name:"LocationForecastPopup",props:{properties:{type:Object,required:!0},locationForecastDetailUrl:{type:String,required:!1}},setup(e){const t=e,i=Ph(),{t:c}=wl({inheritLocale:!0,messages:{en:{viewForecast:"View Forecast"},fr:{viewForecast:"Voir les prévisions"},pt:{viewForecast:"Ver previsão"},es:{viewForecast:"Ver pronóstico"},ar:{viewForecast:"عرض التوقعات"},am:{viewForecast:"የተንቀሳቃሽ እቅድ እይ"},sw:{viewForecast:"Tazama Utabiri"}}}),p=dr(()=>{var m;return(m=i.forecastSettings)==null?void 0:m.parameters.reduce((l,S)=>(l[S.parameter]=S,l),{})}),g=dr(()=>{if(!p.value)return null;const m={data:[]},l=t.properties.city,S=t.properties.city_slug,I=t.properties.condition_label;t.locationForecastDetailUrl&&S&&(m.detailUrl=t.locationForecastDetailUrl+S),I&&(m.condition={label:I,icon:t.properties.condition_symbol_url}),l&&(m.city=l);for(const A in p.value){const z=t.properties[A];if(z){const O=z,D=p.value[A].parameter_unit;m.data.push({value:O,name:p.value[A].name,unit:D,valueWithUnit:O?`${O} ${D}`:null})}}return m});return(m,l)=>g.value?(gt(),Ct("div",V9,[st("div",U9,ar(g.value.city),1),g.value.condition?(gt(),Ct("div",G9,[st("figure",Z9,[st("img",{src:g.value.condition.icon,alt:"Condition Icon"},null,8,W9)]),st("div",H9,ar(g.value.condition.label),1)])):Pr("",!0),st("div",q9,[st("table",null,[st("tbody",null,[(gt(!0),Ct(Rr,null,vo(g.value.data,(S,I)=>(gt(),Ct("tr",{key:I},[st("td",K9,ar(S.name),1),st("td",Y9,ar(S.valueWithUnit),1)]))),128))])])]),g.value.detailUrl?(gt(),Ct("a",{key:1,href:g.value.detailUrl,class:"detail-btn"},ar(mr(c)("viewForecast")),9,X9)):Pr("",!0)])):Pr("",!0)}},Q9=Bo(J9,[["__scopeId","data-v-1c0dae67"]]),Gx={version:8,glyphs:"https://tiles.basemaps.cartocdn.com/fonts/{fontstack}/{range}.pbf",sources:{voyager:{type:"raster",tiles:["https://a.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"carto-dark":{type:"raster",tiles:["https://a.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"carto-light":{type:"raster",tiles:["https://a.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"osm-standard":{type:"raster",tiles:["https://a.tile.openstreetmap.org/{z}/{x}/{y}.png","https://b.tile.openstreetmap.org/{z}/{x}/{y}.png","https://c.tile.openstreetmap.org/{z}/{x}/{y}.png"],tileSize:256,attribution:"© OpenStreetMap contributors"},"open-topo":{type:"raster",tiles:["https://a.tile.opentopomap.org/{z}/{x}/{y}.png","https://b.tile.opentopomap.org/{z}/{x}/{y}.png","https://c.tile.opentopomap.org/{z}/{x}/{y}.png"],tileSize:256,attribution:"© OpenTopoMap contributors"},"esri-light-gray":{type:"raster",tiles:["https://services.arcgisonline.com/arcgis/rest/services/Canvas/World_Light_Gray_Base/MapServer/tile/{z}/{y}/{x}"],tileSize:256,attribution:"© Esri © OpenStreetMap contributors"}},layers:[{id:"voyager",source:"voyager",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"carto-light",source:"carto-light",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"carto-dark",source:"carto-dark",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"osm-standard",source:"osm-standard",type:"raster",minzoom:0,maxzoom:19,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"open-topo",source:"open-topo",type:"raster",minzoom:0,maxzoom:17,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"esri-light-gray",source:"esri-light-gray",type:"raster",minzoom:0,maxzoom:16,layout:{visibility:"visible"},metadata:{"mapbox:groups":"background"}}]},eU={class:"basemap-control"},tU={class:"fixed-layer-control"},rU={class:"dynamic-layer-control"},nU={class:"legend-control"},iU={key:0,class:"overlay-loader"},oU={__name:"Map",props:{mapSettingsUrl:{type:String,required:!0},initialBounds:{type:String,required:!1},locationForecastDetailUrl:{type:String,required:!1},primaryColor:{type:String,required:!1}},setup(e){const t=e,i=Ph(),c=Ca(null),p=yi();let g=yi([]),m;const l=["admin-boundary-fill","admin-boundary-line","admin-boundary-line-1","admin-boundary-line-lv-1","weather-warnings","weather-forecast"],S=yi(null),I=yi(null),A=yi(!1),z=Ca(null),O=yi({}),D=async()=>(await fetch(t.mapSettingsUrl)).json(),H=async()=>{const ct={container:c.value,style:{version:8,sources:{},layers:[]},center:[0,0],zoom:4,scrollZoom:!1,attributionControl:!1};if(t.initialBounds)try{const Qe=JSON.parse(t.initialBounds);ct.bounds=[[Qe[0],Qe[1]],[Qe[2],Qe[3]]],ct.fitBoundsOptions={padding:20}}catch(Qe){console.error("Error parsing initial bounds",Qe)}m=new Fg.Map(ct),m.addControl(new Fg.AttributionControl({customAttribution:'<a href="https://maplibre.org" target="_blank">MapLibre</a>   &copy; <a href="http://www.openstreetmap.org/copyright" target="_blank">OpenStreetMap</a> &copy; <a href="https://carto.com/attributions" target="_blank">CARTO</a>',compact:!1}),"bottom-left"),m.on("load",async()=>{i.setLoading(!0);try{const Qe=await D();i.setLoading(!1),ue(Qe)}catch(Qe){console.log("Error fetching map settings",Qe),i.setLoading(!1)}});const ut=["weather-warnings","weather-forecast"];ut.forEach(Qe=>{m.on("mouseenter",Qe,()=>{m.getCanvas().style.cursor="pointer"}),m.on("mouseleave",Qe,()=>{m.getCanvas().style.cursor=""})}),m.on("click",Qe=>{I.value&&(I.value.remove(),I.value=null);const _t=ut.filter(Yt=>i.visibleLayers.find(ur=>ur.id===Yt)),Ut=m.queryRenderedFeatures(Qe.point,{layers:_t}),Zt=Ut&&!!Ut.length&&Ut[0];if(Zt){const Yt=Zt.layer.id;Yt==="weather-warnings"?(z.value=j9,O.value={properties:Zt.properties}):Yt==="weather-forecast"&&(z.value=Q9,O.value={properties:Zt.properties,locationForecastDetailUrl:t.locationForecastDetailUrl}),A.value=!0,wh(()=>{I.value&&I.value.remove(),I.value=new Fg.Popup().setDOMContent(S.value).setLngLat(Qe.lngLat).addTo(m),I.value.on("close",()=>{A.value=!1,I.value.remove(),I.value=null})})}})},ue=async ct=>{const{boundaryTilesUrl:ut,showWarningsLayer:Qe,capWarningsLayerDisplayName:_t,capGeojsonUrl:Ut,showLocationForecastLayer:Zt,locationForecastLayerDisplayName:Yt,locationForecastDateDisplayFormat:ur,homeForecastDataUrl:vr,weatherIconsUrl:sr,forecastClusterConfig:Er,dynamicMapLayers:qt,forecastSettingsUrl:ce,zoomLocations:ge,basemaps:Le,showLevel1Boundaries:lt}=ct;if(Le&&Le.length){const Je=Le.find(tt=>tt.default)||Le[0];if(i.setApiBaseMaps(Le),Je){const{mapStyle:tt}=Je,te=await fetch(tt).then(ne=>ne.json()).catch(ne=>console.error(ne));te?(te.metadata={...te.metadata,customStyle:!0},m.setStyle(te),i.setUsingApiStyle(!0),i.setSelectedApiBaseMap(Je.id),Kt()):m.setStyle(Gx)}}else m.setStyle(Gx);if(ge){i.setZoomLocations(ge);const Je=ge.find(tt=>tt.default);Je&&i.setSelectedZoomLocation(Je.id)}if(_e(ut,lt),Qe&&(i.updateLayerTitle("weather-warnings",_t),ie(Ut)),Zt){i.updateLayerTitle("weather-forecast",Yt),i.updateLayerState("weather-forecast",!0),i.setWeatherForecastLayerDateFormat({currentTime:ur});try{const Je=await fetch(ce).then(tt=>tt.json());i.setForecastSettings(Je),xe(vr,sr,Er)}catch(Je){console.log("Error fetching forecast settings",Je)}}else i.updateLayerState("weather-forecast",!1);qt&&qt.length&&qt.forEach(Je=>{var ke,Oe;const tt=(Oe=(ke=Je.paramsSelectorConfig)==null?void 0:ke.find(bt=>bt.key==="time"))==null?void 0:Oe.dateFormat,te={...Je,title:Je.display_name||Je.name,homeMapLayerType:"dynamic",visible:!1,enabled:!0,icon:Je.icon?`icon-${Je.icon}`:"icon-layers",dateFormat:tt,opacity:1};Pe(te);const ne=qt.find(bt=>bt.show_by_default);ne&&(Ue(ne.id,!0),i.updateLayerVisibility(ne.id,!0))})},_e=(ct,ut)=>{m.addSource("admin-boundary-source",{type:"vector",tiles:[ct]}),m.addLayer({id:"admin-boundary-fill",type:"fill",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"fill-color":"#fff","fill-opacity":0},metadata:{"mapbox:groups":"boundary"}}),m.addLayer({id:"admin-boundary-line",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"line-color":"#faffa0","line-width":2,"line-offset":1},metadata:{"mapbox:groups":"boundary"}}),m.addLayer({id:"admin-boundary-line-1",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"line-color":t.primaryColor,"line-width":1.5},metadata:{"mapbox:groups":"boundary"}}),ut&&m.addLayer({id:"admin-boundary-line-lv-1",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",1],paint:{"line-color":"#8b8b8b","line-width":.8,"line-dasharray":[2,4]},metadata:{"mapbox:groups":"boundary"}})},ie=ct=>{fetch(ct).then(ut=>ut.json()).then(ut=>{if(ut.features.length>0){i.updateLayerState("weather-warnings",!0);const Qe=d3(ut);m.fitBounds(Qe,{padding:50}),m.addSource("weather-warnings",{type:"geojson",data:ut});let _t;m.getLayer("weather-forecast")&&(_t="weather-forecast"),m.addLayer({id:"weather-warnings",type:"fill",source:"weather-warnings",paint:{"fill-color":["case",["==",["get","severity"],"Extreme"],"#d42d41",["==",["get","severity"],"Severe"],"#f08c11",["==",["get","severity"],"Moderate"],"#f4cf00",["==",["get","severity"],"Minor"],"#399cc7",["==",["get","severity"],"Unknown"],"#82a8df","black"],"fill-opacity":1,"fill-outline-color":["case",["==",["get","severity"],"Extreme"],"#DC2626",["==",["get","severity"],"Severe"],"#C2600A",["==",["get","severity"],"Moderate"],"#A16207",["==",["get","severity"],"Minor"],"#0E7490",["==",["get","severity"],"Unknown"],"#4B6CB7","black"]}},_t),i.updateLayerVisibility("weather-warnings",!0)}})},xe=(ct,ut,Qe)=>{m.addSource("weather-forecast",{type:"geojson",data:{type:"FeatureCollection",features:[]},...Qe}),m.addLayer({id:"weather-forecast",type:"symbol",layout:{"icon-image":["get","condition"],"icon-size":.3,"icon-allow-overlap":!0},source:"weather-forecast"}),i.setLoading(!0),fetch(ct).then(_t=>_t.json()).then(_t=>{Ce(ut),J(_t);const{data:Ut}=_t;Ut&&Ut.length&&i.updateLayerVisibility("weather-forecast",!0),i.setLoading(!1),Kt()}).catch(_t=>{i.setLoading(!1)})},Ce=ct=>{fetch(ct).then(ut=>ut.json()).then(ut=>{ut&&Array.isArray(ut)&&ut.forEach(Qe=>{m.loadImage(Qe.url).then(_t=>{m.addImage(Qe.id,_t.data)})})})},J=ct=>{const{multi_period:ut,data:Qe}=ct;g.value=Qe;const _t=Date.now(),Ut=Qe.map(Zt=>Zt.datetime).filter(Zt=>new Date(Zt).getTime()>=_t).sort((Zt,Yt)=>new Date(Zt)-new Date(Yt));i.setSelectedTimeLayerDateIndex("weather-forecast",0),i.setTimeLayerDates("weather-forecast",Ut),Ut.length&&$e(Ut[0])},we=({layerId:ct,opacity:ut})=>{i.setLayerOpacity(ct,ut);const Qe=i.getLayerById(ct);if(!Qe)return;const{layerType:_t,mapLayerConfig:Ut}=Qe;if((_t==="raster_file"||_t==="wms")&&m.getLayer(ct)&&m.setPaintProperty(ct,"raster-opacity",ut),_t==="vector_tile"){const{layers:Zt}=Ut;Zt==null||Zt.forEach(Yt=>{m.getLayer(Yt.id)&&(Yt.type==="fill"&&m.setPaintProperty(Yt.id,"fill-opacity",ut),Yt.type==="line"&&m.setPaintProperty(Yt.id,"line-opacity",ut),Yt.type==="circle"&&m.setPaintProperty(Yt.id,"circle-opacity",ut))})}},$e=ct=>{if(!ct)return;const ut=new Date(ct).getTime(),Qe=g.value.find(_t=>new Date(_t.datetime).getTime()===ut);if(Qe){const _t=m.getSource("weather-forecast");_t&&_t.setData(Qe)}},Pe=ct=>{const{layerType:ut}=ct;if(ut==="raster_file")ct.mapLayerConfig=Yv(ct),i.addLayer(ct);else if(ut==="wms"){const{getCapabilitiesUrl:Qe,getCapabilitiesLayerName:_t}=ct;Qe&&_t&&(ct.mapLayerConfig=Yv(ct),i.addLayer(ct))}else ut==="vector_tile"?(ct.mapLayerConfig=h3(ct),i.addLayer(ct)):console.error("Unsupported layer type:",ut)},Ue=(ct,ut)=>{const Qe=i.getLayerById(ct),{layerType:_t}=Qe;if(ut)(_t==="raster_file"||_t==="wms"||_t==="vector_tile")&&et(Qe.id);else{if(_t==="vector_tile"){const{layers:Ut}=Qe.mapLayerConfig;Ut&&Ut.forEach(Zt=>{m.getLayer(Zt.id)&&m.removeLayer(Zt.id)})}else m.getLayer(ct)&&m.removeLayer(ct);m.getSource(ct)&&m.removeSource(ct)}},Ke=(ct,ut="timestamps")=>fetch(ct).then(Qe=>Qe.json()).then(Qe=>Qe[ut]),mt=ct=>{const{layerType:ut}=ct;if(ut==="raster_file"||ut==="vector_tile"){const{tileJsonUrl:Qe,timestampsResponseObjectKey:_t}=ct;return Ke(Qe,_t)}else if(ut==="wms"){const{getCapabilitiesUrl:Qe,getCapabilitiesLayerName:_t}=ct;return V4(Qe,_t)}else console.error("Unsupported layer type:",ut);return[]},et=async ct=>{const ut=i.getLayerById(ct),{mapLayerConfig:Qe,layerType:_t,paramsSelectorConfig:Ut}=ut,{currentTimeMethod:Zt}=ut;try{i.setLoading(!0);const Yt=await mt(ut),ur=Yt.sort((vr,sr)=>new Date(vr)-new Date(sr));if(ur&&ur.length){const vr=HF([...ur],Zt),sr=ur.indexOf(vr);i.setSelectedTimeLayerDateIndex(ut.id,sr),i.setTimeLayerDates(ut.id,Yt);const Er=Qe.source.id;let qt;const ce=Ut.find(ge=>ge.key==="time");if(ce){let ge="time";const{url_param:Le}=ce;Le&&(ge=Le),qt=Xw(Qe.source.tiles[0],{[ge]:vr})}if(qt){if(m.getSource(Er)||m.addSource(Er,{...Qe.source,tiles:[qt]}),_t==="raster_file"||_t==="wms")m.getLayer(ct)||m.addLayer({id:ct,type:"raster",source:Er});else if(_t==="vector_tile"){const{layers:ge}=Qe;ge&&ge.forEach(Le=>{m.getLayer(Le.id)||m.addLayer({...Le,source:Er})})}l.forEach(ge=>{m.getLayer(ge)&&m.moveLayer(ge)}),Kt()}}i.setLoading(!1)}catch(Yt){console.log("Error adding dynamic layer",Yt),i.setLoading(!1)}},Xe=()=>m==null?void 0:m.zoomIn(),vt=()=>m==null?void 0:m.zoomOut(),Ot=ct=>{p.value.toggle(ct)},er=({layerId:ct,visible:ut})=>{i.updateLayerVisibility(ct,ut);const Qe=i.getLayerById(ct),{homeMapLayerType:_t}=Qe;if(_t==="fixed"&&m.getLayer(ct)){m.setLayoutProperty(ct,"visibility",ut?"visible":"none");return}_t==="dynamic"&&Ue(ct,ut)},xt=({layerId:ct,newDate:ut})=>{const Qe=i.getLayerById(ct);if(!Qe)return;const Ut=(i.timeLayerDates[ct]||[]).indexOf(ut);if(Ut!==-1&&i.setSelectedTimeLayerDateIndex(ct,Ut),ct==="weather-forecast"){$e(ut);return}At(Qe,ut)},At=(ct,ut)=>{const{layerType:Qe,mapLayerConfig:_t,paramsSelectorConfig:Ut}=ct;if(Qe==="raster_file"||Qe==="wms"||Qe==="vector_tile"){const Zt=Ut.find(ur=>ur.key==="time");let Yt="time";if(Zt){const{url_param:ur}=Zt;ur&&(Yt=ur)}_t&&f3(m,_t.source.id,{[Yt]:ut})}},Gt=ct=>{const ut=i.getApiBaseMapById(ct),Qe=["basemap"];if(m){const{layers:_t,metadata:Ut}=m.getStyle(),Zt=Object.keys(Ut["mapbox:groups"]).filter(vr=>{const{name:sr}=Ut["mapbox:groups"][vr];return Qe.map(qt=>{var ce;return(ce=sr==null?void 0:sr.toLowerCase())==null?void 0:ce.includes(qt)}).some(qt=>qt)}),ur=Zt.map(vr=>({...Ut["mapbox:groups"][vr],id:vr})).find(vr=>vr.name.includes(ut.basemapGroup));ur&&_t.filter(sr=>{const{metadata:Er}=sr;if(!Er)return!1;const qt=Er["mapbox:group"];return Zt.includes(qt)}).forEach(sr=>{sr.metadata["mapbox:group"]===ur.id?m.setLayoutProperty(sr.id,"visibility","visible"):m.setLayoutProperty(sr.id,"visibility","none")})}},Kt=()=>{if(!i.usingApiStyle)return;const ut=i.getSelectedApiBaseMap(),Qe=!0,_t="en",Ut=["labels"];if(m&&m.getStyle()){const{layers:Zt,metadata:Yt}=m.getStyle(),ur=Object.keys(Yt["mapbox:groups"]).filter(qt=>{const{name:ce}=Yt["mapbox:groups"][qt];return Ut.filter(Le=>ce.toLowerCase().includes(Le)).some(Le=>Le)}),sr=ur.map(qt=>({...Yt["mapbox:groups"][qt],id:qt})).find(qt=>qt.name.includes(ut==null?void 0:ut.labelsGroup))||{};Zt.filter(qt=>{const{metadata:ce}=qt;if(!ce)return!1;const ge=ce["mapbox:group"];return ur.includes(ge)}).forEach(qt=>{const ce=qt.metadata["mapbox:group"]===sr.id;m.setLayoutProperty(qt.id,"visibility",ce&&Qe?"visible":"none"),m.setLayoutProperty(qt.id,"text-field",["get",`name_${_t}`]),m.moveLayer(qt.id)})}};return qn(()=>i.selectedApiBaseMap,ct=>{Gt(ct)}),qn(()=>i.selectedBasemap,ct=>{m.getStyle().layers.filter(_t=>_t.metadata&&_t.metadata["mapbox:groups"]==="background").forEach(_t=>{_t.id===ct?m.setLayoutProperty(_t.id,"visibility","visible"):m.setLayoutProperty(_t.id,"visibility","none")})}),qn(()=>i.showBoundary,ct=>{m.getStyle().layers.filter(_t=>_t.metadata&&_t.metadata["mapbox:groups"]==="boundary").forEach(_t=>{ct?m.setLayoutProperty(_t.id,"visibility","visible"):m.setLayoutProperty(_t.id,"visibility","none")})}),qn(()=>i.selectedZoomLocation,ct=>{const ut=i.zoomLocations.find(Qe=>Qe.id===ct);if(ut&&ut.bounds){const Qe=ut.bounds;m.fitBounds([[Qe[0],Qe[1]],[Qe[2],Qe[3]]],{padding:50})}}),Ia(()=>H()),Gp(()=>m==null?void 0:m.remove()),(ct,ut)=>(gt(),Ct(Rr,null,[st("div",{ref_key:"mapContainer",ref:c,class:"map-container"},null,512),st("div",{class:"zoom-controls"},[st("button",{onClick:Xe},"+"),st("button",{onClick:vt},"−")]),st("div",eU,[st("div",{class:"basemap-icon icon",onClick:Ot},ut[0]||(ut[0]=[st("svg",null,[st("use",{"xlink:href":"#icon-layer-group"})],-1)])),Sr(mr(v2),{ref_key:"basemapChooserRef",ref:p},{default:Jo(()=>[Sr(y9)]),_:1},512)]),ut[2]||(ut[2]=st("div",{id:"datepicker-mobile"},null,-1)),st("div",tU,[(gt(!0),Ct(Rr,null,vo(mr(i).sortedFixedLayers,Qe=>(gt(),jn(px,{key:Qe.id,title:Qe.title,enabled:Qe.enabled,visible:Qe.visible,"home-map-layer-type":Qe.homeMapLayerType,position:Qe.position,id:Qe.id,icon:Qe.icon,multiTemporal:Qe.multiTemporal,"onUpdate:toggleLayer":er,"onUpdate:timeChange":xt,"onUpdate:opacity":we},null,8,["title","enabled","visible","home-map-layer-type","position","id","icon","multiTemporal"]))),128))]),st("div",rU,[(gt(!0),Ct(Rr,null,vo(mr(i).sortedDynamicLayers,Qe=>(gt(),jn(px,{key:Qe.id,title:Qe.title,enabled:Qe.enabled,visible:Qe.visible,"home-map-layer-type":Qe.homeMapLayerType,position:Qe.position,id:Qe.id,icon:Qe.icon,multiTemporal:Qe.multiTemporal,"onUpdate:toggleLayer":er,"onUpdate:timeChange":xt,"onUpdate:opacity":we},null,8,["title","enabled","visible","home-map-layer-type","position","id","icon","multiTemporal"]))),128))]),st("div",nU,[Sr(L7)]),mr(i).loading?(gt(),Ct("div",iU,ut[1]||(ut[1]=[st("div",{class:"spinner"},null,-1)]))):Pr("",!0),A.value?(gt(),jn(Xy,{key:1,to:"body"},[st("div",{ref_key:"popupContent",ref:S},[(gt(),jn(ey(z.value),Xx(iw(O.value)),null,16))],512)])):Pr("",!0)],64))}},sU=Bo(oU,[["__scopeId","data-v-cd3232eb"]]),Zx={__name:"HomeMap",props:{mapSettingsUrl:{type:String,required:!0},initialBounds:{type:String,required:!1},locationForecastDetailUrl:{type:String,required:!1},languageCode:{type:String,required:!1,default:"en"},homeMapAlertsUrl:{type:String,required:!1},primaryColor:{type:String,required:!1,default:"#000000"}},setup(e){const t=e,i=()=>{const c=document.getElementById("alerts-container");c&&t.homeMapAlertsUrl&&fetch(t.homeMapAlertsUrl).then(p=>{if(!p.ok)throw new Error("Error fetching alerts");return p.text()}).then(p=>{const g=new DOMParser().parseFromString(p,"text/html").body;if(g){c.append(g);const m=document.getElementById("alerts-count-badge");if(m){const l=c.querySelectorAll(".alert-item").length;m.textContent=l,m.classList.toggle("is-zero",l===0)}}}).catch(p=>{console.error("Error loading alerts:",p)})};return Ia(()=>i()),(c,p)=>(gt(),jn(sU,{initialBounds:e.initialBounds,mapSettingsUrl:e.mapSettingsUrl,locationForecastDetailUrl:e.locationForecastDetailUrl,primaryColor:e.primaryColor},null,8,["initialBounds","mapSettingsUrl","locationForecastDetailUrl","primaryColor"]))}},aU=gP(),ip=document.getElementById("home-map");if(ip){const e=LM({dataset:{...ip.dataset},component:Zx});let t=(e==null?void 0:e.languageCode)||"en";const c=vM({legacy:!1,locale:t,fallbackLocale:"en",messages:{en:RM,fr:DM,pt:OM}}),p=fP(Zx,e);p.use(VE,{theme:{preset:s3}}),p.use(aU),p.use(c),p.use(AM,{rootElement:ip}),p.mount(ip)}
+In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function XV(e,t){if(e){if(typeof e=="string")return Dy(e,t);var i={}.toString.call(e).slice(8,-1);return i==="Object"&&e.constructor&&(i=e.constructor.name),i==="Map"||i==="Set"?Array.from(e):i==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?Dy(e,t):void 0}}function JV(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function QV(e){if(Array.isArray(e))return Dy(e)}function Dy(e,t){(t==null||t>e.length)&&(t=e.length);for(var i=0,c=Array(t);i<t;i++)c[i]=e[i];return c}function Vx(e,t){var i=Object.keys(e);if(Object.getOwnPropertySymbols){var c=Object.getOwnPropertySymbols(e);t&&(c=c.filter(function(p){return Object.getOwnPropertyDescriptor(e,p).enumerable})),i.push.apply(i,c)}return i}function Ux(e){for(var t=1;t<arguments.length;t++){var i=arguments[t]!=null?arguments[t]:{};t%2?Vx(Object(i),!0).forEach(function(c){sC(e,c,i[c])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(i)):Vx(Object(i)).forEach(function(c){Object.defineProperty(e,c,Object.getOwnPropertyDescriptor(i,c))})}return e}function sC(e,t,i){return(t=e9(t))in e?Object.defineProperty(e,t,{value:i,enumerable:!0,configurable:!0,writable:!0}):e[t]=i,e}function e9(e){var t=t9(e,"string");return bh(t)=="symbol"?t:t+""}function t9(e,t){if(bh(e)!="object"||!e)return e;var i=e[Symbol.toPrimitive];if(i!==void 0){var c=i.call(e,t);if(bh(c)!="object")return c;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var aC={name:"Select",extends:qV,inheritAttrs:!1,emits:["change","focus","blur","before-show","before-hide","show","hide","filter"],outsideClickListener:null,scrollHandler:null,resizeListener:null,labelClickListener:null,matchMediaOrientationListener:null,overlay:null,list:null,virtualScroller:null,searchTimeout:null,searchValue:null,isModelValueChanged:!1,data:function(){return{clicked:!1,focused:!1,focusedOptionIndex:-1,filterValue:null,overlayVisible:!1,queryOrientation:null}},watch:{modelValue:function(){this.isModelValueChanged=!0},options:function(){this.autoUpdateModel()}},mounted:function(){this.autoUpdateModel(),this.bindLabelClickListener(),this.bindMatchMediaOrientationListener()},updated:function(){this.overlayVisible&&this.isModelValueChanged&&this.scrollInView(this.findSelectedOptionIndex()),this.isModelValueChanged=!1},beforeUnmount:function(){this.unbindOutsideClickListener(),this.unbindResizeListener(),this.unbindLabelClickListener(),this.unbindMatchMediaOrientationListener(),this.scrollHandler&&(this.scrollHandler.destroy(),this.scrollHandler=null),this.overlay&&(Zc.clear(this.overlay),this.overlay=null)},methods:{getOptionIndex:function(t,i){return this.virtualScrollerDisabled?t:i&&i(t).index},getOptionLabel:function(t){return this.optionLabel?As(t,this.optionLabel):t},getOptionValue:function(t){return this.optionValue?As(t,this.optionValue):t},getOptionRenderKey:function(t,i){return(this.dataKey?As(t,this.dataKey):this.getOptionLabel(t))+"_"+i},getPTItemOptions:function(t,i,c,p){return this.ptm(p,{context:{option:t,index:c,selected:this.isSelected(t),focused:this.focusedOptionIndex===this.getOptionIndex(c,i),disabled:this.isOptionDisabled(t)}})},isOptionDisabled:function(t){return this.optionDisabled?As(t,this.optionDisabled):!1},isOptionGroup:function(t){return this.optionGroupLabel&&t.optionGroup&&t.group},getOptionGroupLabel:function(t){return As(t,this.optionGroupLabel)},getOptionGroupChildren:function(t){return As(t,this.optionGroupChildren)},getAriaPosInset:function(t){var i=this;return(this.optionGroupLabel?t-this.visibleOptions.slice(0,t).filter(function(c){return i.isOptionGroup(c)}).length:t)+1},show:function(t){this.$emit("before-show"),this.overlayVisible=!0,this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),t&&io(this.$refs.focusInput)},hide:function(t){var i=this,c=function(){i.$emit("before-hide"),i.overlayVisible=!1,i.clicked=!1,i.focusedOptionIndex=-1,i.searchValue="",i.resetFilterOnHide&&(i.filterValue=null),t&&io(i.$refs.focusInput)};setTimeout(function(){c()},0)},onFocus:function(t){this.disabled||(this.focused=!0,this.overlayVisible&&(this.focusedOptionIndex=this.focusedOptionIndex!==-1?this.focusedOptionIndex:this.autoOptionFocus?this.findFirstFocusedOptionIndex():this.editable?-1:this.findSelectedOptionIndex(),this.scrollInView(this.focusedOptionIndex)),this.$emit("focus",t))},onBlur:function(t){var i,c;this.focused=!1,this.focusedOptionIndex=-1,this.searchValue="",this.$emit("blur",t),(i=(c=this.formField).onBlur)===null||i===void 0||i.call(c,t)},onKeyDown:function(t){if(this.disabled||rE()){t.preventDefault();return}var i=t.metaKey||t.ctrlKey;switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,this.editable);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,this.editable);break;case"Home":this.onHomeKey(t,this.editable);break;case"End":this.onEndKey(t,this.editable);break;case"PageDown":this.onPageDownKey(t);break;case"PageUp":this.onPageUpKey(t);break;case"Space":this.onSpaceKey(t,this.editable);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t);break;case"Backspace":this.onBackspaceKey(t,this.editable);break;case"ShiftLeft":case"ShiftRight":break;default:!i&&GM(t.key)&&(!this.overlayVisible&&this.show(),!this.editable&&this.searchOptions(t,t.key));break}this.clicked=!1},onEditableInput:function(t){var i=t.target.value;this.searchValue="";var c=this.searchOptions(t,i);!c&&(this.focusedOptionIndex=-1),this.updateModel(t,i),!this.overlayVisible&&Tr(i)&&this.show()},onContainerClick:function(t){this.disabled||this.loading||t.target.tagName==="INPUT"||t.target.getAttribute("data-pc-section")==="clearicon"||t.target.closest('[data-pc-section="clearicon"]')||((!this.overlay||!this.overlay.contains(t.target))&&(this.overlayVisible?this.hide(!0):this.show(!0)),this.clicked=!0)},onClearClick:function(t){this.updateModel(t,null),this.resetFilterOnClear&&(this.filterValue=null)},onFirstHiddenFocus:function(t){var i=t.relatedTarget===this.$refs.focusInput?zc(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;io(i)},onLastHiddenFocus:function(t){var i=t.relatedTarget===this.$refs.focusInput?jw(this.overlay,':not([data-p-hidden-focusable="true"])'):this.$refs.focusInput;io(i)},onOptionSelect:function(t,i){var c=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,p=this.getOptionValue(i);this.updateModel(t,p),c&&this.hide(!0)},onOptionMouseMove:function(t,i){this.focusOnHover&&this.changeFocusedOptionIndex(t,i)},onFilterChange:function(t){var i=t.target.value;this.filterValue=i,this.focusedOptionIndex=-1,this.$emit("filter",{originalEvent:t,value:i}),!this.virtualScrollerDisabled&&this.virtualScroller.scrollToIndex(0)},onFilterKeyDown:function(t){if(!t.isComposing)switch(t.code){case"ArrowDown":this.onArrowDownKey(t);break;case"ArrowUp":this.onArrowUpKey(t,!0);break;case"ArrowLeft":case"ArrowRight":this.onArrowLeftKey(t,!0);break;case"Home":this.onHomeKey(t,!0);break;case"End":this.onEndKey(t,!0);break;case"Enter":case"NumpadEnter":this.onEnterKey(t);break;case"Escape":this.onEscapeKey(t);break;case"Tab":this.onTabKey(t,!0);break}},onFilterBlur:function(){this.focusedOptionIndex=-1},onFilterUpdated:function(){this.overlayVisible&&this.alignOverlay()},onOverlayClick:function(t){Ed.emit("overlay-click",{originalEvent:t,target:this.$el})},onOverlayKeyDown:function(t){switch(t.code){case"Escape":this.onEscapeKey(t);break}},onArrowDownKey:function(t){if(!this.overlayVisible)this.show(),this.editable&&this.changeFocusedOptionIndex(t,this.findSelectedOptionIndex());else{var i=this.focusedOptionIndex!==-1?this.findNextOptionIndex(this.focusedOptionIndex):this.clicked?this.findFirstOptionIndex():this.findFirstFocusedOptionIndex();this.changeFocusedOptionIndex(t,i)}t.preventDefault()},onArrowUpKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(t.altKey&&!i)this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(),t.preventDefault();else{var c=this.focusedOptionIndex!==-1?this.findPrevOptionIndex(this.focusedOptionIndex):this.clicked?this.findLastOptionIndex():this.findLastFocusedOptionIndex();this.changeFocusedOptionIndex(t,c),!this.overlayVisible&&this.show(),t.preventDefault()}},onArrowLeftKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i&&(this.focusedOptionIndex=-1)},onHomeKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(i){var c=t.currentTarget;t.shiftKey?c.setSelectionRange(0,t.target.selectionStart):(c.setSelectionRange(0,0),this.focusedOptionIndex=-1)}else this.changeFocusedOptionIndex(t,this.findFirstOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onEndKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;if(i){var c=t.currentTarget;if(t.shiftKey)c.setSelectionRange(t.target.selectionStart,c.value.length);else{var p=c.value.length;c.setSelectionRange(p,p),this.focusedOptionIndex=-1}}else this.changeFocusedOptionIndex(t,this.findLastOptionIndex()),!this.overlayVisible&&this.show();t.preventDefault()},onPageUpKey:function(t){this.scrollInView(0),t.preventDefault()},onPageDownKey:function(t){this.scrollInView(this.visibleOptions.length-1),t.preventDefault()},onEnterKey:function(t){this.overlayVisible?(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.hide()):(this.focusedOptionIndex=-1,this.onArrowDownKey(t)),t.preventDefault()},onSpaceKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;!i&&this.onEnterKey(t)},onEscapeKey:function(t){this.overlayVisible&&this.hide(!0),t.preventDefault(),t.stopPropagation()},onTabKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i||(this.overlayVisible&&this.hasFocusableElements()?(io(this.$refs.firstHiddenFocusableElementOnOverlay),t.preventDefault()):(this.focusedOptionIndex!==-1&&this.onOptionSelect(t,this.visibleOptions[this.focusedOptionIndex]),this.overlayVisible&&this.hide(this.filter)))},onBackspaceKey:function(t){var i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!1;i&&!this.overlayVisible&&this.show()},onOverlayEnter:function(t){var i=this;Zc.set("overlay",t,this.$primevue.config.zIndex.overlay),$w(t,{position:"absolute",top:"0",left:"0"}),this.alignOverlay(),this.scrollInView(),setTimeout(function(){i.autoFilterFocus&&i.filter&&io(i.$refs.filterInput.$el),i.autoUpdateModel()},1)},onOverlayAfterEnter:function(){this.bindOutsideClickListener(),this.bindScrollListener(),this.bindResizeListener(),this.$emit("show")},onOverlayLeave:function(){var t=this;this.unbindOutsideClickListener(),this.unbindScrollListener(),this.unbindResizeListener(),this.autoFilterFocus&&this.filter&&!this.editable&&this.$nextTick(function(){t.$refs.filterInput&&io(t.$refs.filterInput.$el)}),this.$emit("hide"),this.overlay=null},onOverlayAfterLeave:function(t){Zc.clear(t)},alignOverlay:function(){this.appendTo==="self"?YM(this.overlay,this.$el):this.overlay&&(this.overlay.style.minWidth=Bw(this.$el)+"px",zw(this.overlay,this.$el))},bindOutsideClickListener:function(){var t=this;this.outsideClickListener||(this.outsideClickListener=function(i){t.overlayVisible&&t.overlay&&!t.$el.contains(i.target)&&!t.overlay.contains(i.target)&&t.hide()},document.addEventListener("click",this.outsideClickListener,!0))},unbindOutsideClickListener:function(){this.outsideClickListener&&(document.removeEventListener("click",this.outsideClickListener,!0),this.outsideClickListener=null)},bindScrollListener:function(){var t=this;this.scrollHandler||(this.scrollHandler=new m2(this.$refs.container,function(){t.overlayVisible&&t.hide()})),this.scrollHandler.bindScrollListener()},unbindScrollListener:function(){this.scrollHandler&&this.scrollHandler.unbindScrollListener()},bindResizeListener:function(){var t=this;this.resizeListener||(this.resizeListener=function(){t.overlayVisible&&!Uw()&&t.hide()},window.addEventListener("resize",this.resizeListener))},unbindResizeListener:function(){this.resizeListener&&(window.removeEventListener("resize",this.resizeListener),this.resizeListener=null)},bindLabelClickListener:function(){var t=this;if(!this.editable&&!this.labelClickListener){var i=document.querySelector('label[for="'.concat(this.labelId,'"]'));i&&Cp(i)&&(this.labelClickListener=function(){io(t.$refs.focusInput)},i.addEventListener("click",this.labelClickListener))}},unbindLabelClickListener:function(){if(this.labelClickListener){var t=document.querySelector('label[for="'.concat(this.labelId,'"]'));t&&Cp(t)&&t.removeEventListener("click",this.labelClickListener)}},bindMatchMediaOrientationListener:function(){var t=this;if(!this.matchMediaOrientationListener){var i=matchMedia("(orientation: portrait)");this.queryOrientation=i,this.matchMediaOrientationListener=function(){t.alignOverlay()},this.queryOrientation.addEventListener("change",this.matchMediaOrientationListener)}},unbindMatchMediaOrientationListener:function(){this.matchMediaOrientationListener&&(this.queryOrientation.removeEventListener("change",this.matchMediaOrientationListener),this.queryOrientation=null,this.matchMediaOrientationListener=null)},hasFocusableElements:function(){return __(this.overlay,':not([data-p-hidden-focusable="true"])').length>0},isOptionExactMatched:function(t){var i;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((i=this.getOptionLabel(t))===null||i===void 0?void 0:i.toLocaleLowerCase(this.filterLocale))==this.searchValue.toLocaleLowerCase(this.filterLocale)},isOptionStartsWith:function(t){var i;return this.isValidOption(t)&&typeof this.getOptionLabel(t)=="string"&&((i=this.getOptionLabel(t))===null||i===void 0?void 0:i.toLocaleLowerCase(this.filterLocale).startsWith(this.searchValue.toLocaleLowerCase(this.filterLocale)))},isValidOption:function(t){return Tr(t)&&!(this.isOptionDisabled(t)||this.isOptionGroup(t))},isValidSelectedOption:function(t){return this.isValidOption(t)&&this.isSelected(t)},isSelected:function(t){return Th(this.d_value,this.getOptionValue(t),this.equalityKey)},findFirstOptionIndex:function(){var t=this;return this.visibleOptions.findIndex(function(i){return t.isValidOption(i)})},findLastOptionIndex:function(){var t=this;return Rv(this.visibleOptions,function(i){return t.isValidOption(i)})},findNextOptionIndex:function(t){var i=this,c=t<this.visibleOptions.length-1?this.visibleOptions.slice(t+1).findIndex(function(p){return i.isValidOption(p)}):-1;return c>-1?c+t+1:t},findPrevOptionIndex:function(t){var i=this,c=t>0?Rv(this.visibleOptions.slice(0,t),function(p){return i.isValidOption(p)}):-1;return c>-1?c:t},findSelectedOptionIndex:function(){var t=this;return this.$filled?this.visibleOptions.findIndex(function(i){return t.isValidSelectedOption(i)}):-1},findFirstFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findFirstOptionIndex():t},findLastFocusedOptionIndex:function(){var t=this.findSelectedOptionIndex();return t<0?this.findLastOptionIndex():t},searchOptions:function(t,i){var c=this;this.searchValue=(this.searchValue||"")+i;var p=-1,g=!1;return Tr(this.searchValue)&&(p=this.visibleOptions.findIndex(function(m){return c.isOptionExactMatched(m)}),p===-1&&(p=this.visibleOptions.findIndex(function(m){return c.isOptionStartsWith(m)})),p!==-1&&(g=!0),p===-1&&this.focusedOptionIndex===-1&&(p=this.findFirstFocusedOptionIndex()),p!==-1&&this.changeFocusedOptionIndex(t,p)),this.searchTimeout&&clearTimeout(this.searchTimeout),this.searchTimeout=setTimeout(function(){c.searchValue="",c.searchTimeout=null},500),g},changeFocusedOptionIndex:function(t,i){this.focusedOptionIndex!==i&&(this.focusedOptionIndex=i,this.scrollInView(),this.selectOnFocus&&this.onOptionSelect(t,this.visibleOptions[i],!1))},scrollInView:function(){var t=this,i=arguments.length>0&&arguments[0]!==void 0?arguments[0]:-1;this.$nextTick(function(){var c=i!==-1?"".concat(t.$id,"_").concat(i):t.focusedOptionId,p=em(t.list,'li[id="'.concat(c,'"]'));p?p.scrollIntoView&&p.scrollIntoView({block:"nearest",inline:"nearest"}):t.virtualScrollerDisabled||t.virtualScroller&&t.virtualScroller.scrollToIndex(i!==-1?i:t.focusedOptionIndex)})},autoUpdateModel:function(){this.autoOptionFocus&&(this.focusedOptionIndex=this.findFirstFocusedOptionIndex()),this.selectOnFocus&&this.autoOptionFocus&&!this.$filled&&this.onOptionSelect(null,this.visibleOptions[this.focusedOptionIndex],!1)},updateModel:function(t,i){this.writeValue(i,t),this.$emit("change",{originalEvent:t,value:i})},flatOptions:function(t){var i=this;return(t||[]).reduce(function(c,p,g){c.push({optionGroup:p,group:!0,index:g});var m=i.getOptionGroupChildren(p);return m&&m.forEach(function(l){return c.push(l)}),c},[])},overlayRef:function(t){this.overlay=t},listRef:function(t,i){this.list=t,i&&i(t)},virtualScrollerRef:function(t){this.virtualScroller=t}},computed:{visibleOptions:function(){var t=this,i=this.optionGroupLabel?this.flatOptions(this.options):this.options||[];if(this.filterValue){var c=gE.filter(i,this.searchFields,this.filterValue,this.filterMatchMode,this.filterLocale);if(this.optionGroupLabel){var p=this.options||[],g=[];return p.forEach(function(m){var l=t.getOptionGroupChildren(m),S=l.filter(function(I){return c.includes(I)});S.length>0&&g.push(Ux(Ux({},m),{},sC({},typeof t.optionGroupChildren=="string"?t.optionGroupChildren:"items",KV(S))))}),this.flatOptions(g)}return c}return i},hasSelectedOption:function(){return this.$filled},label:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.placeholder||"p-emptylabel"},editableInputValue:function(){var t=this.findSelectedOptionIndex();return t!==-1?this.getOptionLabel(this.visibleOptions[t]):this.d_value||""},equalityKey:function(){return this.optionValue?null:this.dataKey},searchFields:function(){return this.filterFields||[this.optionLabel]},filterResultMessageText:function(){return Tr(this.visibleOptions)?this.filterMessageText.replaceAll("{0}",this.visibleOptions.length):this.emptyFilterMessageText},filterMessageText:function(){return this.filterMessage||this.$primevue.config.locale.searchMessage||""},emptyFilterMessageText:function(){return this.emptyFilterMessage||this.$primevue.config.locale.emptySearchMessage||this.$primevue.config.locale.emptyFilterMessage||""},emptyMessageText:function(){return this.emptyMessage||this.$primevue.config.locale.emptyMessage||""},selectionMessageText:function(){return this.selectionMessage||this.$primevue.config.locale.selectionMessage||""},emptySelectionMessageText:function(){return this.emptySelectionMessage||this.$primevue.config.locale.emptySelectionMessage||""},selectedMessageText:function(){return this.$filled?this.selectionMessageText.replaceAll("{0}","1"):this.emptySelectionMessageText},focusedOptionId:function(){return this.focusedOptionIndex!==-1?"".concat(this.$id,"_").concat(this.focusedOptionIndex):null},ariaSetSize:function(){var t=this;return this.visibleOptions.filter(function(i){return!t.isOptionGroup(i)}).length},isClearIconVisible:function(){return this.showClear&&this.d_value!=null&&Tr(this.options)},virtualScrollerDisabled:function(){return!this.virtualScrollerOptions}},directives:{ripple:g2},components:{InputText:nC,VirtualScroller:oC,Portal:w_,InputIcon:rC,IconField:tC,TimesIcon:eC,ChevronDownIcon:J2,SpinnerIcon:E_,SearchIcon:Q2,CheckIcon:M_,BlankIcon:X2}},r9=["id"],n9=["name","id","value","placeholder","tabindex","disabled","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid"],i9=["name","id","tabindex","aria-label","aria-labelledby","aria-expanded","aria-controls","aria-activedescendant","aria-invalid","aria-disabled"],o9=["id"],s9=["id"],a9=["id","aria-label","aria-selected","aria-disabled","aria-setsize","aria-posinset","onClick","onMousemove","data-p-selected","data-p-focused","data-p-disabled"];function l9(e,t,i,c,p,g){var m=no("SpinnerIcon"),l=no("InputText"),S=no("SearchIcon"),I=no("InputIcon"),A=no("IconField"),z=no("CheckIcon"),O=no("BlankIcon"),D=no("VirtualScroller"),H=no("Portal"),ue=B1("ripple");return gt(),Ct("div",Bt({ref:"container",id:e.$id,class:e.cx("root"),onClick:t[11]||(t[11]=function(){return g.onContainerClick&&g.onContainerClick.apply(g,arguments)})},e.ptmi("root")),[e.editable?(gt(),Ct("input",Bt({key:0,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,type:"text",class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],value:g.editableInputValue,placeholder:e.placeholder,tabindex:e.disabled?-1:e.tabindex,disabled:e.disabled,autocomplete:"off",role:"combobox","aria-label":e.ariaLabel,"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":p.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":p.focused?g.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,onFocus:t[0]||(t[0]=function(){return g.onFocus&&g.onFocus.apply(g,arguments)}),onBlur:t[1]||(t[1]=function(){return g.onBlur&&g.onBlur.apply(g,arguments)}),onKeydown:t[2]||(t[2]=function(){return g.onKeyDown&&g.onKeyDown.apply(g,arguments)}),onInput:t[3]||(t[3]=function(){return g.onEditableInput&&g.onEditableInput.apply(g,arguments)})},e.ptm("label")),null,16,n9)):(gt(),Ct("span",Bt({key:1,ref:"focusInput",name:e.name,id:e.labelId||e.inputId,class:[e.cx("label"),e.inputClass,e.labelClass],style:[e.inputStyle,e.labelStyle],tabindex:e.disabled?-1:e.tabindex,role:"combobox","aria-label":e.ariaLabel||(g.label==="p-emptylabel"?void 0:g.label),"aria-labelledby":e.ariaLabelledby,"aria-haspopup":"listbox","aria-expanded":p.overlayVisible,"aria-controls":e.$id+"_list","aria-activedescendant":p.focused?g.focusedOptionId:void 0,"aria-invalid":e.invalid||void 0,"aria-disabled":e.disabled,onFocus:t[4]||(t[4]=function(){return g.onFocus&&g.onFocus.apply(g,arguments)}),onBlur:t[5]||(t[5]=function(){return g.onBlur&&g.onBlur.apply(g,arguments)}),onKeydown:t[6]||(t[6]=function(){return g.onKeyDown&&g.onKeyDown.apply(g,arguments)})},e.ptm("label")),[cn(e.$slots,"value",{value:e.d_value,placeholder:e.placeholder},function(){var _e;return[ap(ar(g.label==="p-emptylabel"?" ":(_e=g.label)!==null&&_e!==void 0?_e:"empty"),1)]})],16,i9)),g.isClearIconVisible?cn(e.$slots,"clearicon",{key:2,class:Lo(e.cx("clearIcon")),clearCallback:g.onClearClick},function(){return[(gt(),jn(ey(e.clearIcon?"i":"TimesIcon"),Bt({ref:"clearIcon",class:[e.cx("clearIcon"),e.clearIcon],onClick:g.onClearClick},e.ptm("clearIcon"),{"data-pc-section":"clearicon"}),null,16,["class","onClick"]))]}):Pr("",!0),st("div",Bt({class:e.cx("dropdown")},e.ptm("dropdown")),[e.loading?cn(e.$slots,"loadingicon",{key:0,class:Lo(e.cx("loadingIcon"))},function(){return[e.loadingIcon?(gt(),Ct("span",Bt({key:0,class:[e.cx("loadingIcon"),"pi-spin",e.loadingIcon],"aria-hidden":"true"},e.ptm("loadingIcon")),null,16)):(gt(),jn(m,Bt({key:1,class:e.cx("loadingIcon"),spin:"","aria-hidden":"true"},e.ptm("loadingIcon")),null,16,["class"]))]}):cn(e.$slots,"dropdownicon",{key:1,class:Lo(e.cx("dropdownIcon"))},function(){return[(gt(),jn(ey(e.dropdownIcon?"span":"ChevronDownIcon"),Bt({class:[e.cx("dropdownIcon"),e.dropdownIcon],"aria-hidden":"true"},e.ptm("dropdownIcon")),null,16,["class"]))]})],16),Sr(H,{appendTo:e.appendTo},{default:Jo(function(){return[Sr(cw,Bt({name:"p-connected-overlay",onEnter:g.onOverlayEnter,onAfterEnter:g.onOverlayAfterEnter,onLeave:g.onOverlayLeave,onAfterLeave:g.onOverlayAfterLeave},e.ptm("transition")),{default:Jo(function(){return[p.overlayVisible?(gt(),Ct("div",Bt({key:0,ref:g.overlayRef,class:[e.cx("overlay"),e.panelClass,e.overlayClass],style:[e.panelStyle,e.overlayStyle],onClick:t[9]||(t[9]=function(){return g.onOverlayClick&&g.onOverlayClick.apply(g,arguments)}),onKeydown:t[10]||(t[10]=function(){return g.onOverlayKeyDown&&g.onOverlayKeyDown.apply(g,arguments)})},e.ptm("overlay")),[st("span",Bt({ref:"firstHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[7]||(t[7]=function(){return g.onFirstHiddenFocus&&g.onFirstHiddenFocus.apply(g,arguments)})},e.ptm("hiddenFirstFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16),cn(e.$slots,"header",{value:e.d_value,options:g.visibleOptions}),e.filter?(gt(),Ct("div",Bt({key:0,class:e.cx("header")},e.ptm("header")),[Sr(A,{unstyled:e.unstyled,pt:e.ptm("pcFilterContainer")},{default:Jo(function(){return[Sr(l,{ref:"filterInput",type:"text",value:p.filterValue,onVnodeMounted:g.onFilterUpdated,onVnodeUpdated:g.onFilterUpdated,class:Lo(e.cx("pcFilter")),placeholder:e.filterPlaceholder,variant:e.variant,unstyled:e.unstyled,role:"searchbox",autocomplete:"off","aria-owns":e.$id+"_list","aria-activedescendant":g.focusedOptionId,onKeydown:g.onFilterKeyDown,onBlur:g.onFilterBlur,onInput:g.onFilterChange,pt:e.ptm("pcFilter"),formControl:{novalidate:!0}},null,8,["value","onVnodeMounted","onVnodeUpdated","class","placeholder","variant","unstyled","aria-owns","aria-activedescendant","onKeydown","onBlur","onInput","pt"]),Sr(I,{unstyled:e.unstyled,pt:e.ptm("pcFilterIconContainer")},{default:Jo(function(){return[cn(e.$slots,"filtericon",{},function(){return[e.filterIcon?(gt(),Ct("span",Bt({key:0,class:e.filterIcon},e.ptm("filterIcon")),null,16)):(gt(),jn(S,Xx(Bt({key:1},e.ptm("filterIcon"))),null,16))]})]}),_:3},8,["unstyled","pt"])]}),_:3},8,["unstyled","pt"]),st("span",Bt({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenFilterResult"),{"data-p-hidden-accessible":!0}),ar(g.filterResultMessageText),17)],16)):Pr("",!0),st("div",Bt({class:e.cx("listContainer"),style:{"max-height":g.virtualScrollerDisabled?e.scrollHeight:""}},e.ptm("listContainer")),[Sr(D,Bt({ref:g.virtualScrollerRef},e.virtualScrollerOptions,{items:g.visibleOptions,style:{height:e.scrollHeight},tabindex:-1,disabled:g.virtualScrollerDisabled,pt:e.ptm("virtualScroller")}),Xk({content:Jo(function(_e){var ie=_e.styleClass,xe=_e.contentRef,Ce=_e.items,J=_e.getItemOptions,we=_e.contentStyle,$e=_e.itemSize;return[st("ul",Bt({ref:function(Ue){return g.listRef(Ue,xe)},id:e.$id+"_list",class:[e.cx("list"),ie],style:we,role:"listbox"},e.ptm("list")),[(gt(!0),Ct(Rr,null,vo(Ce,function(Pe,Ue){return gt(),Ct(Rr,{key:g.getOptionRenderKey(Pe,g.getOptionIndex(Ue,J))},[g.isOptionGroup(Pe)?(gt(),Ct("li",Bt({key:0,id:e.$id+"_"+g.getOptionIndex(Ue,J),style:{height:$e?$e+"px":void 0},class:e.cx("optionGroup"),role:"option",ref_for:!0},e.ptm("optionGroup")),[cn(e.$slots,"optiongroup",{option:Pe.optionGroup,index:g.getOptionIndex(Ue,J)},function(){return[st("span",Bt({class:e.cx("optionGroupLabel"),ref_for:!0},e.ptm("optionGroupLabel")),ar(g.getOptionGroupLabel(Pe.optionGroup)),17)]})],16,s9)):S1((gt(),Ct("li",Bt({key:1,id:e.$id+"_"+g.getOptionIndex(Ue,J),class:e.cx("option",{option:Pe,focusedOption:g.getOptionIndex(Ue,J)}),style:{height:$e?$e+"px":void 0},role:"option","aria-label":g.getOptionLabel(Pe),"aria-selected":g.isSelected(Pe),"aria-disabled":g.isOptionDisabled(Pe),"aria-setsize":g.ariaSetSize,"aria-posinset":g.getAriaPosInset(g.getOptionIndex(Ue,J)),onClick:function(mt){return g.onOptionSelect(mt,Pe)},onMousemove:function(mt){return g.onOptionMouseMove(mt,g.getOptionIndex(Ue,J))},"data-p-selected":g.isSelected(Pe),"data-p-focused":p.focusedOptionIndex===g.getOptionIndex(Ue,J),"data-p-disabled":g.isOptionDisabled(Pe),ref_for:!0},g.getPTItemOptions(Pe,J,Ue,"option")),[e.checkmark?(gt(),Ct(Rr,{key:0},[g.isSelected(Pe)?(gt(),jn(z,Bt({key:0,class:e.cx("optionCheckIcon"),ref_for:!0},e.ptm("optionCheckIcon")),null,16,["class"])):(gt(),jn(O,Bt({key:1,class:e.cx("optionBlankIcon"),ref_for:!0},e.ptm("optionBlankIcon")),null,16,["class"]))],64)):Pr("",!0),cn(e.$slots,"option",{option:Pe,selected:g.isSelected(Pe),index:g.getOptionIndex(Ue,J)},function(){return[st("span",Bt({class:e.cx("optionLabel"),ref_for:!0},e.ptm("optionLabel")),ar(g.getOptionLabel(Pe)),17)]})],16,a9)),[[ue]])],64)}),128)),p.filterValue&&(!Ce||Ce&&Ce.length===0)?(gt(),Ct("li",Bt({key:0,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[cn(e.$slots,"emptyfilter",{},function(){return[ap(ar(g.emptyFilterMessageText),1)]})],16)):!e.options||e.options&&e.options.length===0?(gt(),Ct("li",Bt({key:1,class:e.cx("emptyMessage"),role:"option"},e.ptm("emptyMessage"),{"data-p-hidden-accessible":!0}),[cn(e.$slots,"empty",{},function(){return[ap(ar(g.emptyMessageText),1)]})],16)):Pr("",!0)],16,o9)]}),_:2},[e.$slots.loader?{name:"loader",fn:Jo(function(_e){var ie=_e.options;return[cn(e.$slots,"loader",{options:ie})]}),key:"0"}:void 0]),1040,["items","style","disabled","pt"])],16),cn(e.$slots,"footer",{value:e.d_value,options:g.visibleOptions}),!e.options||e.options&&e.options.length===0?(gt(),Ct("span",Bt({key:1,role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenEmptyMessage"),{"data-p-hidden-accessible":!0}),ar(g.emptyMessageText),17)):Pr("",!0),st("span",Bt({role:"status","aria-live":"polite",class:"p-hidden-accessible"},e.ptm("hiddenSelectedMessage"),{"data-p-hidden-accessible":!0}),ar(g.selectedMessageText),17),st("span",Bt({ref:"lastHiddenFocusableElementOnOverlay",role:"presentation","aria-hidden":"true",class:"p-hidden-accessible p-hidden-focusable",tabindex:0,onFocus:t[8]||(t[8]=function(){return g.onLastHiddenFocus&&g.onLastHiddenFocus.apply(g,arguments)})},e.ptm("hiddenLastFocusableEl"),{"data-p-hidden-accessible":!0,"data-p-hidden-focusable":!0}),null,16)],16)):Pr("",!0)]}),_:3},16,["onEnter","onAfterEnter","onLeave","onAfterLeave"])]}),_:3},8,["appendTo"])],16,r9)}aC.render=l9;const c9={class:"map-options"},u9={class:"basemap-options"},d9=["for"],h9=["for"],f9={class:"boundary-check"},p9={for:"boundary",class:"boundary-label"},m9={key:0,class:"zoom-locations"},g9={__name:"MapOptions",setup(e){const t=Ph(),{t:i}=wl({locale:"en",messages:{en:{mapOptions:{boundaries:"Boundaries"}},fr:{mapOptions:{boundaries:"Frontières"}},ar:{mapOptions:{boundaries:"الحدود"}},am:{mapOptions:{boundaries:"ድንበሮች"}},es:{mapOptions:{boundaries:"Fronteras"}},sw:{mapOptions:{boundaries:"Mipaka"}}}});return(c,p)=>(gt(),Ct("div",c9,[st("div",u9,[mr(t).usingApiStyle?(gt(!0),Ct(Rr,{key:0},vo(mr(t).apiBaseMaps,g=>(gt(),Ct("div",{key:g.id,class:"basemap-item"},[Sr(mr(Ly),{modelValue:mr(t).selectedApiBaseMap,"onUpdate:modelValue":p[0]||(p[0]=m=>mr(t).selectedApiBaseMap=m),inputId:g.id,name:"basemap",value:g.id,class:"basemap-input"},null,8,["modelValue","inputId","value"]),st("label",{for:g.id},ar(g.label),9,d9)]))),128)):(gt(!0),Ct(Rr,{key:1},vo(mr(t).basemaps,g=>(gt(),Ct("div",{key:g.value,class:"basemap-item"},[Sr(mr(Ly),{modelValue:mr(t).selectedBasemap,"onUpdate:modelValue":p[1]||(p[1]=m=>mr(t).selectedBasemap=m),inputId:g.value,name:"basemap",value:g.value,class:"basemap-input"},null,8,["modelValue","inputId","value"]),st("label",{for:g.value},ar(g.label),9,h9)]))),128))]),p[5]||(p[5]=st("div",{class:"divisor"},null,-1)),st("div",f9,[Sr(mr(Y2),{modelValue:mr(t).showBoundary,"onUpdate:modelValue":p[2]||(p[2]=g=>mr(t).showBoundary=g),inputId:"boundary",name:"boundary",value:"yes",binary:""},null,8,["modelValue"]),st("label",p9,ar(mr(i)("mapOptions.boundaries")),1)]),p[6]||(p[6]=st("div",{class:"divisor"},null,-1)),mr(t).zoomLocations?(gt(),Ct("div",m9,[p[4]||(p[4]=st("label",{class:"zoom-locations-label",for:"zoom_location"},"Zoom Locations",-1)),Sr(mr(aC),{inputId:"zoom_location",modelValue:mr(t).selectedZoomLocation,"onUpdate:modelValue":p[3]||(p[3]=g=>mr(t).selectedZoomLocation=g),options:mr(t).zoomLocations,optionLabel:"name",optionValue:"id",size:"small",placeholder:"Select location"},null,8,["modelValue","options"])])):Pr("",!0)]))}},y9=Bo(g9,[["__scopeId","data-v-77953f81"]]),_9={class:"popup"},b9={class:"alert-severity-label"},v9={class:"alert-meta"},x9={class:"alert-meta-item"},w9={class:"alert-meta-label"},C9={class:"alert-meta-value"},S9={class:"alert-meta-item"},k9={class:"alert-meta-label"},T9={class:"alert-meta-value"},P9={class:"alert-meta-item"},I9={class:"alert-meta-label"},M9={class:"alert-meta-value"},E9={class:"alert-meta-item"},A9={class:"alert-meta-label"},L9={class:"alert-meta-value"},R9={class:"alert-meta-item"},D9={class:"alert-meta-label"},O9={class:"alert-meta-value"},z9={class:"alert-detail"},$9={class:"alert-event"},B9={class:"alert-headline"},F9=["href"],N9={__name:"CAPWarningPopup",props:{properties:{type:Object,required:!0}},setup(e){const t=e,{t:i}=wl({locale:"en",messages:{en:{alert:{certainty:"Certainty",urgency:"Urgency",sent:"Sent",onset:"Onset",expires:"Expires",event:"Event",headline:"Headline",moreDetail:"More Detail"}},fr:{alert:{certainty:"Certitude",urgency:"Urgence",sent:"Envoyé",onset:"Début",expires:"Expire",event:"Événement",headline:"Titre",moreDetail:"Plus de détails"}},ar:{alert:{certainty:"اليقين",urgency:"الاستعجال",sent:"تم الإرسال",onset:"البداية",expires:"تنتهي",event:"الحدث",headline:"العنوان",moreDetail:"مزيد من التفاصيل"}},am:{alert:{certainty:"እርግጠኝነት",urgency:"አስቸኳይነት",sent:"ተልኳል",onset:"መጀመሪያ",expires:"ጊዜው ያበቃል",event:"ክስተት",headline:"ርዕስ",moreDetail:"ተጨማሪ መረጃ"}},es:{alert:{certainty:"Certeza",urgency:"Urgencia",sent:"Enviado",onset:"Comienzo",expires:"Expira",event:"Evento",headline:"Titular",moreDetail:"Más detalles"}},sw:{alert:{certainty:"Uhakika",urgency:"Uharaka",sent:"Imetumwa",onset:"Mwanzo",expires:"Inaisha",event:"Tukio",headline:"Kichwa cha Habari",moreDetail:"Maelezo Zaidi"}}}}),c=dr(()=>{const p={...t.properties};if(p){if(p.sent){const g=rm(p.sent);if(p.sent=IF(g,{addSuffix:!0}),p.onset){const m=Date.parse(p.onset),l=new Date(m);p.onset=hp(l,"MMM dd yyyy, HH:MM")}else p.onset=hp(g,"MMM dd yyyy, HH:MM")}if(p.expires){const g=Date.parse(p.expires),m=new Date(g);p.expires=hp(m,"MMM dd yyyy, HH:MM")}return p}return null});return(p,g)=>(gt(),Ct("div",_9,[st("div",{class:"alert-severity",style:ns({backgroundColor:c.value.severity_color})},[g[0]||(g[0]=st("div",{class:"alert-icon"},[st("svg",null,[st("use",{"xlink:href":"#icon-warning"})])],-1)),st("div",b9,ar(c.value.severity),1)],4),st("div",v9,[st("div",x9,[st("div",w9,ar(mr(i)("alert.certainty")),1),st("div",C9,ar(c.value.certainty),1)]),st("div",S9,[st("div",k9,ar(mr(i)("alert.urgency")),1),st("div",T9,ar(c.value.urgency),1)]),st("div",P9,[st("div",I9,ar(mr(i)("alert.sent")),1),st("div",M9,ar(c.value.sent),1)]),st("div",E9,[st("div",A9,ar(mr(i)("alert.onset")),1),st("div",L9,ar(c.value.onset),1)]),st("div",R9,[st("div",D9,ar(mr(i)("alert.expires")),1),st("div",O9,ar(c.value.expires),1)])]),st("div",z9,[st("div",$9,ar(c.value.event),1),st("div",B9,ar(c.value.headline),1)]),c.value.web?(gt(),Ct("a",{key:0,href:c.value.web,target:"_blank",class:"alert-link"},ar(mr(i)("alert.moreDetail")),9,F9)):Pr("",!0)]))}},j9=Bo(N9,[["__scopeId","data-v-f5649f8b"]]),V9={key:0,class:"popup"},U9={class:"location-name"},G9={key:0,class:"condition"},Z9={class:"condition-icon"},W9=["src"],H9={class:"condition-label"},q9={class:"forecast-data-table"},K9={class:"forecast-name"},Y9={class:"forecast-value"},X9=["href"],J9={__name:"LocationForecastPopup",props:{properties:{type:Object,required:!0},locationForecastDetailUrl:{type:String,required:!1}},setup(e){const t=e,i=Ph(),{t:c}=wl({inheritLocale:!0,messages:{en:{viewForecast:"View Forecast"},fr:{viewForecast:"Voir les prévisions"},pt:{viewForecast:"Ver previsão"},es:{viewForecast:"Ver pronóstico"},ar:{viewForecast:"عرض التوقعات"},am:{viewForecast:"የተንቀሳቃሽ እቅድ እይ"},sw:{viewForecast:"Tazama Utabiri"}}}),p=dr(()=>{var m;return(m=i.forecastSettings)==null?void 0:m.parameters.reduce((l,S)=>(l[S.parameter]=S,l),{})}),g=dr(()=>{if(!p.value)return null;const m={data:[]},l=t.properties.city,S=t.properties.city_slug,I=t.properties.condition_label;t.locationForecastDetailUrl&&S&&(m.detailUrl=t.locationForecastDetailUrl+S),I&&(m.condition={label:I,icon:t.properties.condition_symbol_url}),l&&(m.city=l);for(const A in p.value){const z=t.properties[A];if(z){const O=z,D=p.value[A].parameter_unit;m.data.push({value:O,name:p.value[A].name,unit:D,valueWithUnit:O?`${O} ${D}`:null})}}return m});return(m,l)=>g.value?(gt(),Ct("div",V9,[st("div",U9,ar(g.value.city),1),g.value.condition?(gt(),Ct("div",G9,[st("figure",Z9,[st("img",{src:g.value.condition.icon,alt:"Condition Icon"},null,8,W9)]),st("div",H9,ar(g.value.condition.label),1)])):Pr("",!0),st("div",q9,[st("table",null,[st("tbody",null,[(gt(!0),Ct(Rr,null,vo(g.value.data,(S,I)=>(gt(),Ct("tr",{key:I},[st("td",K9,ar(S.name),1),st("td",Y9,ar(S.valueWithUnit),1)]))),128))])])]),g.value.detailUrl?(gt(),Ct("a",{key:1,href:g.value.detailUrl,class:"detail-btn"},ar(mr(c)("viewForecast")),9,X9)):Pr("",!0)])):Pr("",!0)}},Q9=Bo(J9,[["__scopeId","data-v-1c0dae67"]]),Gx={version:8,glyphs:"https://tiles.basemaps.cartocdn.com/fonts/{fontstack}/{range}.pbf",sources:{voyager:{type:"raster",tiles:["https://a.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/rastertiles/voyager/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"carto-dark":{type:"raster",tiles:["https://a.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"carto-light":{type:"raster",tiles:["https://a.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://b.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://c.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png","https://d.basemaps.cartocdn.com/light_all/{z}/{x}/{y}@2x.png"],tileSize:256,attribution:"© OpenStreetMap © CARTO"},"osm-standard":{type:"raster",tiles:["https://a.tile.openstreetmap.org/{z}/{x}/{y}.png","https://b.tile.openstreetmap.org/{z}/{x}/{y}.png","https://c.tile.openstreetmap.org/{z}/{x}/{y}.png"],tileSize:256,attribution:"© OpenStreetMap contributors"},"open-topo":{type:"raster",tiles:["https://a.tile.opentopomap.org/{z}/{x}/{y}.png","https://b.tile.opentopomap.org/{z}/{x}/{y}.png","https://c.tile.opentopomap.org/{z}/{x}/{y}.png"],tileSize:256,attribution:"© OpenTopoMap contributors"},"esri-light-gray":{type:"raster",tiles:["https://services.arcgisonline.com/arcgis/rest/services/Canvas/World_Light_Gray_Base/MapServer/tile/{z}/{y}/{x}"],tileSize:256,attribution:"© Esri © OpenStreetMap contributors"}},layers:[{id:"voyager",source:"voyager",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"carto-light",source:"carto-light",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"carto-dark",source:"carto-dark",type:"raster",minzoom:0,maxzoom:22,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"osm-standard",source:"osm-standard",type:"raster",minzoom:0,maxzoom:19,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"open-topo",source:"open-topo",type:"raster",minzoom:0,maxzoom:17,layout:{visibility:"none"},metadata:{"mapbox:groups":"background"}},{id:"esri-light-gray",source:"esri-light-gray",type:"raster",minzoom:0,maxzoom:16,layout:{visibility:"visible"},metadata:{"mapbox:groups":"background"}}]},eU={class:"basemap-control"},tU={class:"fixed-layer-control"},rU={class:"dynamic-layer-control"},nU={class:"legend-control"},iU={key:0,class:"overlay-loader"},oU={__name:"Map",props:{mapSettingsUrl:{type:String,required:!0},initialBounds:{type:String,required:!1},locationForecastDetailUrl:{type:String,required:!1},primaryColor:{type:String,required:!1}},setup(e){const t=e,i=Ph(),c=Ca(null),p=yi();let g=yi([]),m;const l=["admin-boundary-fill","admin-boundary-line","admin-boundary-line-1","admin-boundary-line-lv-1","weather-warnings","weather-forecast"],S=yi(null),I=yi(null),A=yi(!1),z=Ca(null),O=yi({}),D=async()=>(await fetch(t.mapSettingsUrl)).json(),H=async()=>{const ct={container:c.value,style:{version:8,sources:{},layers:[]},center:[0,0],zoom:4,scrollZoom:!1,attributionControl:!1};if(t.initialBounds)try{const Qe=JSON.parse(t.initialBounds);ct.bounds=[[Qe[0],Qe[1]],[Qe[2],Qe[3]]],ct.fitBoundsOptions={padding:20}}catch(Qe){console.error("Error parsing initial bounds",Qe)}m=new Fg.Map(ct),m.addControl(new Fg.AttributionControl({customAttribution:'<a href="https://maplibre.org" target="_blank">MapLibre</a>   &copy; <a href="http://www.openstreetmap.org/copyright" target="_blank">OpenStreetMap</a> &copy; <a href="https://carto.com/attributions" target="_blank">CARTO</a>',compact:!1}),"bottom-left"),m.on("load",async()=>{i.setLoading(!0);try{const Qe=await D();i.setLoading(!1),ue(Qe)}catch(Qe){console.log("Error fetching map settings",Qe),i.setLoading(!1)}});const ut=["weather-warnings","weather-forecast"];ut.forEach(Qe=>{m.on("mouseenter",Qe,()=>{m.getCanvas().style.cursor="pointer"}),m.on("mouseleave",Qe,()=>{m.getCanvas().style.cursor=""})}),m.on("click",Qe=>{I.value&&(I.value.remove(),I.value=null);const _t=ut.filter(Yt=>i.visibleLayers.find(ur=>ur.id===Yt)),Ut=m.queryRenderedFeatures(Qe.point,{layers:_t}),Zt=Ut&&!!Ut.length&&Ut[0];if(Zt){const Yt=Zt.layer.id;if(Yt==="weather-forecast"&&Zt.properties.point_count>1){m.easeTo({center:Qe.lngLat,zoom:m.getZoom()+2});return}Yt==="weather-warnings"?(z.value=j9,O.value={properties:Zt.properties}):Yt==="weather-forecast"&&(z.value=Q9,O.value={properties:Zt.properties,locationForecastDetailUrl:t.locationForecastDetailUrl}),A.value=!0,wh(()=>{I.value&&I.value.remove(),I.value=new Fg.Popup().setDOMContent(S.value).setLngLat(Qe.lngLat).addTo(m),I.value.on("close",()=>{A.value=!1,I.value.remove(),I.value=null})})}})},ue=async ct=>{const{boundaryTilesUrl:ut,showWarningsLayer:Qe,capWarningsLayerDisplayName:_t,capGeojsonUrl:Ut,showLocationForecastLayer:Zt,locationForecastLayerDisplayName:Yt,locationForecastDateDisplayFormat:ur,homeForecastDataUrl:vr,homeForecastFeedUrl:Fq,homeForecastTileJsonUrl:Fqt,weatherIconsUrl:sr,forecastClusterConfig:Er,dynamicMapLayers:qt,forecastSettingsUrl:ce,zoomLocations:ge,basemaps:Le,showLevel1Boundaries:lt}=ct;if(Le&&Le.length){const Je=Le.find(tt=>tt.default)||Le[0];if(i.setApiBaseMaps(Le),Je){const{mapStyle:tt}=Je,te=await fetch(tt).then(ne=>ne.json()).catch(ne=>console.error(ne));te?(te.metadata={...te.metadata,customStyle:!0},m.setStyle(te),i.setUsingApiStyle(!0),i.setSelectedApiBaseMap(Je.id),Kt()):m.setStyle(Gx)}}else m.setStyle(Gx);if(ge){i.setZoomLocations(ge);const Je=ge.find(tt=>tt.default);Je&&i.setSelectedZoomLocation(Je.id)}if(_e(ut,lt),Qe&&(i.updateLayerTitle("weather-warnings",_t),ie(Ut)),Zt){i.updateLayerTitle("weather-forecast",Yt),i.updateLayerState("weather-forecast",!0),i.setWeatherForecastLayerDateFormat({currentTime:ur});try{const Je=await fetch(ce).then(tt=>tt.json());i.setForecastSettings(Je),Fqt?Zqt(Fqt,sr).catch(()=>xe(Fq,vr,sr,Er)):xe(Fq,vr,sr,Er)}catch(Je){console.log("Error fetching forecast settings",Je)}}else i.updateLayerState("weather-forecast",!1);qt&&qt.length&&qt.forEach(Je=>{var ke,Oe;const tt=(Oe=(ke=Je.paramsSelectorConfig)==null?void 0:ke.find(bt=>bt.key==="time"))==null?void 0:Oe.dateFormat,te={...Je,title:Je.display_name||Je.name,homeMapLayerType:"dynamic",visible:!1,enabled:!0,icon:Je.icon?`icon-${Je.icon}`:"icon-layers",dateFormat:tt,opacity:1};Pe(te);const ne=qt.find(bt=>bt.show_by_default);ne&&(Ue(ne.id,!0),i.updateLayerVisibility(ne.id,!0))})},_e=(ct,ut)=>{m.addSource("admin-boundary-source",{type:"vector",tiles:[ct]}),m.addLayer({id:"admin-boundary-fill",type:"fill",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"fill-color":"#fff","fill-opacity":0},metadata:{"mapbox:groups":"boundary"}}),m.addLayer({id:"admin-boundary-line",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"line-color":"#faffa0","line-width":2,"line-offset":1},metadata:{"mapbox:groups":"boundary"}}),m.addLayer({id:"admin-boundary-line-1",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",0],paint:{"line-color":t.primaryColor,"line-width":1.5},metadata:{"mapbox:groups":"boundary"}}),ut&&m.addLayer({id:"admin-boundary-line-lv-1",type:"line",source:"admin-boundary-source","source-layer":"default",filter:["==","level",1],paint:{"line-color":"#8b8b8b","line-width":.8,"line-dasharray":[2,4]},metadata:{"mapbox:groups":"boundary"}})},ie=ct=>{fetch(ct).then(ut=>ut.json()).then(ut=>{if(ut.features.length>0){i.updateLayerState("weather-warnings",!0);const Qe=d3(ut);m.fitBounds(Qe,{padding:50}),m.addSource("weather-warnings",{type:"geojson",data:ut});let _t;m.getLayer("weather-forecast")&&(_t="weather-forecast"),m.addLayer({id:"weather-warnings",type:"fill",source:"weather-warnings",paint:{"fill-color":["case",["==",["get","severity"],"Extreme"],"#d42d41",["==",["get","severity"],"Severe"],"#f08c11",["==",["get","severity"],"Moderate"],"#f4cf00",["==",["get","severity"],"Minor"],"#399cc7",["==",["get","severity"],"Unknown"],"#82a8df","black"],"fill-opacity":1,"fill-outline-color":["case",["==",["get","severity"],"Extreme"],"#DC2626",["==",["get","severity"],"Severe"],"#C2600A",["==",["get","severity"],"Moderate"],"#A16207",["==",["get","severity"],"Minor"],"#0E7490",["==",["get","severity"],"Unknown"],"#4B6CB7","black"]}},_t),i.updateLayerVisibility("weather-warnings",!0)}})},Zqp={periods:null},Zqt=(ct,ut)=>(i.setLoading(!0),fetch(ct).then(Qe=>Qe.json()).then(Qe=>{const _t=Date.now(),Ut=(Qe.periods||[]).filter(Zt=>new Date(Zt.datetime).getTime()>=_t).sort((Zt,Yt)=>new Date(Zt.datetime)-new Date(Yt.datetime));if(!Ut.length)throw new Error("No forecast periods");Zqp.periods=Ut,m.addSource("weather-forecast",{type:"vector",tiles:Ut[0].tiles}),m.addLayer({id:"weather-forecast",type:"symbol","source-layer":"default",layout:{"icon-image":["get","condition"],"icon-size":.3,"icon-allow-overlap":!0},source:"weather-forecast"}),Ce(ut),i.setSelectedTimeLayerDateIndex("weather-forecast",0),i.setTimeLayerDates("weather-forecast",Ut.map(Zt=>Zt.datetime)),i.updateLayerVisibility("weather-forecast",!0),i.setLoading(!1),Kt()}).catch(Qe=>{throw i.setLoading(!1),Qe})),Zq=ct=>{const{multi_period:ut,cities:Qe,conditions:_t,parameters:Ut=[],periods:Zt=[]}=ct;return{multi_period:ut,data:Zt.map(Yt=>{const ur=[];return Qe.name.forEach((vr,sr)=>{const Er=Yt.condition[sr];if(Er==null)return;const qt={date:Yt.datetime,effective_period_time:Yt.effective_period_time,effective_period_label:Yt.effective_period_label,city:vr,city_slug:Qe.slug[sr],condition:_t.symbol[Er],condition_label:_t.label[Er],condition_symbol_url:new URL(_t.icon_url[Er],window.location.origin).href};Ut.forEach(ce=>{const ge=Yt.values[ce];ge&&ge[sr]!==null&&(qt[ce]=ge[sr])}),ur.push({type:"Feature",geometry:{type:"Point",coordinates:Qe.coordinates[sr]},properties:qt})}),{type:"FeatureCollection",date:Yt.date,datetime:Yt.datetime,features:ur}})}},xe=(Fq,ct,ut,Qe)=>{m.addSource("weather-forecast",{type:"geojson",data:{type:"FeatureCollection",features:[]},...Qe}),m.addLayer({id:"weather-forecast",type:"symbol",layout:{"icon-image":["get","condition"],"icon-size":.3,"icon-allow-overlap":!0},source:"weather-forecast"}),i.setLoading(!0),(Fq?fetch(Fq).then(_t=>_t.json()).then(Zq):fetch(ct).then(_t=>_t.json())).then(_t=>{Ce(ut),J(_t);const{data:Ut}=_t;Ut&&Ut.length&&i.updateLayerVisibility("weather-forecast",!0),i.setLoading(!1),Kt()}).catch(_t=>{i.setLoading(!1)})},Ce=ct=>{fetch(ct).then(ut=>ut.json()).then(ut=>{ut&&Array.isArray(ut)&&ut.forEach(Qe=>{m.loadImage(Qe.url).then(_t=>{m.addImage(Qe.id,_t.data)})})})},J=ct=>{const{multi_period:ut,data:Qe}=ct;g.value=Qe;const _t=Date.now(),Ut=Qe.map(Zt=>Zt.datetime).filter(Zt=>new Date(Zt).getTime()>=_t).sort((Zt,Yt)=>new Date(Zt)-new Date(Yt));i.setSelectedTimeLayerDateIndex("weather-forecast",0),i.setTimeLayerDates("weather-forecast",Ut),Ut.length&&$e(Ut[0])},we=({layerId:ct,opacity:ut})=>{i.setLayerOpacity(ct,ut);const Qe=i.getLayerById(ct);if(!Qe)return;const{layerType:_t,mapLayerConfig:Ut}=Qe;if((_t==="raster_file"||_t==="wms")&&m.getLayer(ct)&&m.setPaintProperty(ct,"raster-opacity",ut),_t==="vector_tile"){const{layers:Zt}=Ut;Zt==null||Zt.forEach(Yt=>{m.getLayer(Yt.id)&&(Yt.type==="fill"&&m.setPaintProperty(Yt.id,"fill-opacity",ut),Yt.type==="line"&&m.setPaintProperty(Yt.id,"line-opacity",ut),Yt.type==="circle"&&m.setPaintProperty(Yt.id,"circle-opacity",ut))})}},$e=ct=>{if(!ct)return;const ut=new Date(ct).getTime();if(Zqp.periods){const _t=Zqp.periods.find(Ut=>new Date(Ut.datetime).getTime()===ut),Ut=m.getSource("weather-forecast");_t&&Ut&&Ut.setTiles(_t.tiles);return}const Qe=g.value.find(_t=>new Date(_t.datetime).getTime()===ut);if(Qe){const _t=m.getSource("weather-forecast");_t&&_t.setData(Qe)}},Pe=ct=>{const{layerType:ut}=ct;if(ut==="raster_file")ct.mapLayerConfig=Yv(ct),i.addLayer(ct);else if(ut==="wms"){const{getCapabilitiesUrl:Qe,getCapabilitiesLayerName:_t}=ct;Qe&&_t&&(ct.mapLayerConfig=Yv(ct),i.addLayer(ct))}else ut==="vector_tile"?(ct.mapLayerConfig=h3(ct),i.addLayer(ct)):console.error("Unsupported layer type:",ut)},Ue=(ct,ut)=>{const Qe=i.getLayerById(ct),{layerType:_t}=Qe;if(ut)(_t==="raster_file"||_t==="wms"||_t==="vector_tile")&&et(Qe.id);else{if(_t==="vector_tile"){const{layers:Ut}=Qe.mapLayerConfig;Ut&&Ut.forEach(Zt=>{m.getLayer(Zt.id)&&m.removeLayer(Zt.id)})}else m.getLayer(ct)&&m.removeLayer(ct);m.getSource(ct)&&m.removeSource(ct)}},Ke=(ct,ut="timestamps")=>fetch(ct).then(Qe=>Qe.json()).then(Qe=>Qe[ut]),mt=ct=>{const{layerType:ut}=ct;if(ut==="raster_file"||ut==="vector_tile"){const{tileJsonUrl:Qe,timestampsResponseObjectKey:_t}=ct;return Ke(Qe,_t)}else if(ut==="wms"){const{getCapabilitiesUrl:Qe,getCapabilitiesLayerName:_t}=ct;return V4(Qe,_t)}else console.error("Unsupported layer type:",ut);return[]},et=async ct=>{const ut=i.getLayerById(ct),{mapLayerConfig:Qe,layerType:_t,paramsSelectorConfig:Ut}=ut,{currentTimeMethod:Zt}=ut;try{i.setLoading(!0);const Yt=await mt(ut),ur=Yt.sort((vr,sr)=>new Date(vr)-new Date(sr));if(ur&&ur.length){const vr=HF([...ur],Zt),sr=ur.indexOf(vr);i.setSelectedTimeLayerDateIndex(ut.id,sr),i.setTimeLayerDates(ut.id,Yt);const Er=Qe.source.id;let qt;const ce=Ut.find(ge=>ge.key==="time");if(ce){let ge="time";const{url_param:Le}=ce;Le&&(ge=Le),qt=Xw(Qe.source.tiles[0],{[ge]:vr})}if(qt){if(m.getSource(Er)||m.addSource(Er,{...Qe.source,tiles:[qt]}),_t==="raster_file"||_t==="wms")m.getLayer(ct)||m.addLayer({id:ct,type:"raster",source:Er});else if(_t==="vector_tile"){const{layers:ge}=Qe;ge&&ge.forEach(Le=>{m.getLayer(Le.id)||m.addLayer({...Le,source:Er})})}l.forEach(ge=>{m.getLayer(ge)&&m.moveLayer(ge)}),Kt()}}i.setLoading(!1)}catch(Yt){console.log("Error adding dynamic layer",Yt),i.setLoading(!1)}},Xe=()=>m==null?void 0:m.zoomIn(),vt=()=>m==null?void 0:m.zoomOut(),Ot=ct=>{p.value.toggle(ct)},er=({layerId:ct,visible:ut})=>{i.updateLayerVisibility(ct,ut);const Qe=i.getLayerById(ct),{homeMapLayerType:_t}=Qe;if(_t==="fixed"&&m.getLayer(ct)){m.setLayoutProperty(ct,"visibility",ut?"visible":"none");return}_t==="dynamic"&&Ue(ct,ut)},xt=({layerId:ct,newDate:ut})=>{const Qe=i.getLayerById(ct);if(!Qe)return;const Ut=(i.timeLayerDates[ct]||[]).indexOf(ut);if(Ut!==-1&&i.setSelectedTimeLayerDateIndex(ct,Ut),ct==="weather-forecast"){$e(ut);return}At(Qe,ut)},At=(ct,ut)=>{const{layerType:Qe,mapLayerConfig:_t,paramsSelectorConfig:Ut}=ct;if(Qe==="raster_file"||Qe==="wms"||Qe==="vector_tile"){const Zt=Ut.find(ur=>ur.key==="time");let Yt="time";if(Zt){const{url_param:ur}=Zt;ur&&(Yt=ur)}_t&&f3(m,_t.source.id,{[Yt]:ut})}},Gt=ct=>{const ut=i.getApiBaseMapById(ct),Qe=["basemap"];if(m){const{layers:_t,metadata:Ut}=m.getStyle(),Zt=Object.keys(Ut["mapbox:groups"]).filter(vr=>{const{name:sr}=Ut["mapbox:groups"][vr];return Qe.map(qt=>{var ce;return(ce=sr==null?void 0:sr.toLowerCase())==null?void 0:ce.includes(qt)}).some(qt=>qt)}),ur=Zt.map(vr=>({...Ut["mapbox:groups"][vr],id:vr})).find(vr=>vr.name.includes(ut.basemapGroup));ur&&_t.filter(sr=>{const{metadata:Er}=sr;if(!Er)return!1;const qt=Er["mapbox:group"];return Zt.includes(qt)}).forEach(sr=>{sr.metadata["mapbox:group"]===ur.id?m.setLayoutProperty(sr.id,"visibility","visible"):m.setLayoutProperty(sr.id,"visibility","none")})}},Kt=()=>{if(!i.usingApiStyle)return;const ut=i.getSelectedApiBaseMap(),Qe=!0,_t="en",Ut=["labels"];if(m&&m.getStyle()){const{layers:Zt,metadata:Yt}=m.getStyle(),ur=Object.keys(Yt["mapbox:groups"]).filter(qt=>{const{name:ce}=Yt["mapbox:groups"][qt];return Ut.filter(Le=>ce.toLowerCase().includes(Le)).some(Le=>Le)}),sr=ur.map(qt=>({...Yt["mapbox:groups"][qt],id:qt})).find(qt=>qt.name.includes(ut==null?void 0:ut.labelsGroup))||{};Zt.filter(qt=>{const{metadata:ce}=qt;if(!ce)return!1;const ge=ce["mapbox:group"];return ur.includes(ge)}).forEach(qt=>{const ce=qt.metadata["mapbox:group"]===sr.id;m.setLayoutProperty(qt.id,"visibility",ce&&Qe?"visible":"none"),m.setLayoutProperty(qt.id,"text-field",["get",`name_${_t}`]),m.moveLayer(qt.id)})}};return qn(()=>i.selectedApiBaseMap,ct=>{Gt(ct)}),qn(()=>i.selectedBasemap,ct=>{m.getStyle().layers.filter(_t=>_t.metadata&&_t.metadata["mapbox:groups"]==="background").forEach(_t=>{_t.id===ct?m.setLayoutProperty(_t.id,"visibility","visible"):m.setLayoutProperty(_t.id,"visibility","none")})}),qn(()=>i.showBoundary,ct=>{m.getStyle().layers.filter(_t=>_t.metadata&&_t.metadata["mapbox:groups"]==="boundary").forEach(_t=>{ct?m.setLayoutProperty(_t.id,"visibility","visible"):m.setLayoutProperty(_t.id,"visibility","none")})}),qn(()=>i.selectedZoomLocation,ct=>{const ut=i.zoomLocations.find(Qe=>Qe.id===ct);if(ut&&ut.bounds){const Qe=ut.bounds;m.fitBounds([[Qe[0],Qe[1]],[Qe[2],Qe[3]]],{padding:50})}}),Ia(()=>H()),Gp(()=>m==null?void 0:m.remove()),(ct,ut)=>(gt(),Ct(Rr,null,[st("div",{ref_key:"mapContainer",ref:c,class:"map-container"},null,512),st("div",{class:"zoom-controls"},[st("button",{onClick:Xe},"+"),st("button",{onClick:vt},"−")]),st("div",eU,[st("div",{class:"basemap-icon icon",onClick:Ot},ut[0]||(ut[0]=[st("svg",null,[st("use",{"xlink:href":"#icon-layer-group"})],-1)])),Sr(mr(v2),{ref_key:"basemapChooserRef",ref:p},{default:Jo(()=>[Sr(y9)]),_:1},512)]),ut[2]||(ut[2]=st("div",{id:"datepicker-mobile"},null,-1)),st("div",tU,[(gt(!0),Ct(Rr,null,vo(mr(i).sortedFixedLayers,Qe=>(gt(),jn(px,{key:Qe.id,title:Qe.title,enabled:Qe.enabled,visible:Qe.visible,"home-map-layer-type":Qe.homeMapLayerType,position:Qe.position,id:Qe.id,icon:Qe.icon,multiTemporal:Qe.multiTemporal,"onUpdate:toggleLayer":er,"onUpdate:timeChange":xt,"onUpdate:opacity":we},null,8,["title","enabled","visible","home-map-layer-type","position","id","icon","multiTemporal"]))),128))]),st("div",rU,[(gt(!0),Ct(Rr,null,vo(mr(i).sortedDynamicLayers,Qe=>(gt(),jn(px,{key:Qe.id,title:Qe.title,enabled:Qe.enabled,visible:Qe.visible,"home-map-layer-type":Qe.homeMapLayerType,position:Qe.position,id:Qe.id,icon:Qe.icon,multiTemporal:Qe.multiTemporal,"onUpdate:toggleLayer":er,"onUpdate:timeChange":xt,"onUpdate:opacity":we},null,8,["title","enabled","visible","home-map-layer-type","position","id","icon","multiTemporal"]))),128))]),st("div",nU,[Sr(L7)]),mr(i).loading?(gt(),Ct("div",iU,ut[1]||(ut[1]=[st("div",{class:"spinner"},null,-1)]))):Pr("",!0),A.value?(gt(),jn(Xy,{key:1,to:"body"},[st("div",{ref_key:"popupContent",ref:S},[(gt(),jn(ey(z.value),Xx(iw(O.value)),null,16))],512)])):Pr("",!0)],64))}},sU=Bo(oU,[["__scopeId","data-v-cd3232eb"]]),Zx={__name:"HomeMap",props:{mapSettingsUrl:{type:String,required:!0},initialBounds:{type:String,required:!1},locationForecastDetailUrl:{type:String,required:!1},languageCode:{type:String,required:!1,default:"en"},homeMapAlertsUrl:{type:String,required:!1},primaryColor:{type:String,required:!1,default:"#000000"}},setup(e){const t=e,i=()=>{const c=document.getElementById("alerts-container");c&&t.homeMapAlertsUrl&&fetch(t.homeMapAlertsUrl).then(p=>{if(!p.ok)throw new Error("Error fetching alerts");return p.text()}).then(p=>{const g=new DOMParser().parseFromString(p,"text/html").body;if(g){c.append(g);const m=document.getElementById("alerts-count-badge");if(m){const l=c.querySelectorAll(".alert-item").length;m.textContent=l,m.classList.toggle("is-zero",l===0)}}}).catch(p=>{console.error("Error loading alerts:",p)})};return Ia(()=>i()),(c,p)=>(gt(),jn(sU,{initialBounds:e.initialBounds,mapSettingsUrl:e.mapSettingsUrl,locationForecastDetailUrl:e.locationForecastDetailUrl,primaryColor:e.primaryColor},null,8,["initialBounds","mapSettingsUrl","locationForecastDetailUrl","primaryColor"]))}},aU=gP(),ip=document.getElementById("home-map");if(ip){const e=LM({dataset:{...ip.dataset},component:Zx});let t=(e==null?void 0:e.languageCode)||"en";const c=vM({legacy:!1,locale:t,fallbackLocale:"en",messages:{en:RM,fr:DM,pt:OM}}),p=fP(Zx,e);p.use(VE,{theme:{preset:s3}}),p.use(aU),p.use(c),p.use(AM,{rootElement:ip}),p.mount(ip)}
@@ -33,6 +33,8 @@ def home_map_settings(request):
             "weatherIconsUrl": get_full_url(request, reverse("weather-icons")),
             "forecastSettingsUrl": get_full_url(request, reverse("forecast-settings")),
             "homeForecastDataUrl": get_full_url(request, reverse("home-weather-forecast")),
+            "homeForecastFeedUrl": get_full_url(request, reverse("home-weather-forecast-feed")),
+            "homeForecastTileJsonUrl": get_full_url(request, reverse("home-weather-forecast-tilejson")),
         })
 
     if "capcomposer.cap" in settings.INSTALLED_APPS:
@@ -16,6 +16,8 @@ class MediaIndexPage(AbstractBannerWithIntroPage):
     parent_page_types = ['home.HomePage']
     subpage_types = []
     max_count = 1
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('news.NewsPage',)
 
     feature_block_items = StreamField(
         [
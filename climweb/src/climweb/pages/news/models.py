@@ -54,6 +54,10 @@ class NewsIndexPage(AbstractBannerPage):
     subpage_types = ['news.NewsPage']
     max_count = 1
     show_in_menus_default = True
+    # snippets listed by query, whose changes purge this page from the cache
+    listed_snippet_models = (NewsType, ServiceCategory)
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('news.NewsPage',)
     
     items_per_page = models.PositiveIntegerField(default=6, validators=[MinValueValidator(6), MaxValueValidator(20)],
                                                  verbose_name=_("Items per page"),
@@ -18,6 +18,8 @@ class AboutPage(AbstractIntroPage):
     subpage_types = ['flex_page.FlexPage', 'flexible_forms.FlexibleFormPage', ]
     max_count = 1
     show_in_menus_default = True
+    # snippets listed by query, whose changes purge this page from the cache
+    listed_snippet_models = (Partner,)
     
     mission = models.CharField(max_length=500, help_text=_("Organisation's mission"), blank=True, null=True,
                                verbose_name=_("Organisation's mission"))
@@ -53,6 +53,8 @@ class PartnersPage(AbstractBannerWithIntroPage):
     subpage_types = []
     max_count = 1
     show_in_menus_default = True
+    # snippets listed by query, whose changes purge this page from the cache
+    listed_snippet_models = (Partner,)
 
     partners_cta_title = models.CharField(max_length=100, blank=True, null=True,
                                           verbose_name=_("Partners Call to Action title"),
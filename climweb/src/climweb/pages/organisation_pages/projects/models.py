@@ -28,6 +28,8 @@ class ProjectIndexPage(AbstractBannerWithIntroPage):
     subpage_types = ['projects.ProjectPage']
     max_count = 1
     show_in_menus_default = True
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('projects.ProjectPage',)
     
     items_per_page = models.PositiveIntegerField(default=6, validators=[
         MinValueValidator(6),
@@ -105,6 +107,8 @@ class ProjectPage(AbstractBannerWithIntroPage):
     template = 'project_page.html'
     parent_page_types = ['projects.ProjectIndexPage']
     subpage_types = []
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('publications.PublicationPage', 'news.NewsPage', 'events.EventPage')
     
     services = ParentalManyToManyField('base.ServiceCategory', through='ServiceProject', related_name='projects',
                                        verbose_name=_("Services"))
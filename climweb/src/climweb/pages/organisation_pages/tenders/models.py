@@ -23,6 +23,8 @@ class TendersPage(AbstractBannerWithIntroPage):
     subpage_types = ['tenders.TenderDetailPage']
     max_count = 1
     show_in_menus_default = True
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('tenders.TenderDetailPage',)
     
     no_tenders_header_text = models.TextField(blank=True, null=True,
                                               help_text=_("Text to appear when there are no tenders"),
@@ -23,6 +23,8 @@ class VacanciesPage(AbstractBannerWithIntroPage):
     max_count = 1
     show_in_menus = True
     show_in_menus_default = True
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('vacancies.VacancyDetailPage',)
     
     banner_image = models.ForeignKey(
         'wagtailimages.Image',
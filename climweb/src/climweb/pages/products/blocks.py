@@ -9,25 +9,46 @@ from wagtailiconchooser.blocks import IconChooserBlock
 
 
 class ProductItemStructValue(StructValue):
+    def set_product_item_type(self, item_type):
+        self._product_item_type = item_type
+
     def product_item_type(self):
+        # set by ProductItemTypeResolver when the page is rendered
+        if hasattr(self, "_product_item_type"):
+            return self._product_item_type
+
         from climweb.base.models import ProductItemType
         product_type = self.get('product_type')
-        
+
         try:
             p = ProductItemType.objects.get(pk=product_type)
         except ObjectDoesNotExist:
             return None
+        self._product_item_type = p
         return p
     
     def product_date_str(self):
         return self.get("date").isoformat()
     
+    @property
+    def document_thumbnail(self):
+        if self.get("thumbnail"):
+            return self.get("thumbnail")
+        
+        # auto-generated thumbnails are rendered in the background and stored on
+        # the document, so they are read from there once ready
+        document = self.get("document")
+        if document and self.get("auto_generate_thumbnail"):
+            return getattr(document, "thumbnail", None)
+        
+        return None
+    
     @property
     def p_image(self):
         if self.get("image"):
             return self.get("image")
-        if self.get("thumbnail"):
-            return self.get("thumbnail")
+        if self.document_thumbnail:
+            return self.document_thumbnail
         
         return None
     
@@ -129,11 +150,12 @@ class ProductItemDocumentContentBlock(blocks.StructBlock):
                     _("The effective until date cannot be earlier than the effective from date"))
             })
         
-        # generate thumbnail from document if not provided
+        # use the document's thumbnail if not provided, queueing its generation
+        # in the background if it does not exist yet
         document = result.get('document')
         auto_generate_thumbnail = result.get('auto_generate_thumbnail')
         if document and auto_generate_thumbnail:
-            thumbnail = document.get_thumbnail()
+            thumbnail = document.request_thumbnail()
             if thumbnail:
                 result["thumbnail"] = thumbnail
         return result
@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+
+from climweb.pages.products.tasks import (
+    IngestionTimer,
+    _file_digest,
+    _ingest_product,
+    _iter_matched_files,
+)
+
+
+def _previous_period(dt, convention):
+    """Step dt back by the finest unit used in the convention, so every name is unique."""
+    if "{hh}" in convention:
+        return dt - timedelta(hours=1)
+    if "{dd}" in convention:
+        return dt - timedelta(days=1)
+    if "{mm}" in convention:
+        return dt.replace(year=dt.year - 1, month=12) if dt.month == 1 else dt.replace(month=dt.month - 1)
+    return dt.replace(year=dt.year - 1)
+
+
+# nothing is uploaded or published in a dry run, so the later phases never run
+DRY_RUN_PHASES = ("walk", "match", "lookup")
+
+
+def generate_synthetic_tree(format_dir, convention, fmt, count, size=0):
+    """
+    Create count files named after convention under format_dir, going back from
+    today one period at a time (an hour, day, month or year, per the convention).
+    """
+    dt = datetime.now().replace(minute=0, second=0, microsecond=0)
+    if "{dd}" not in convention:
+        # stepping back by month from the 31st would hit invalid dates
+        dt = dt.replace(day=1)
+    content = b"\0" * size
+
+    for _ in range(count):
+        name = (convention
+                .replace("{yyyy}", f"{dt.year:04d}")
+                .replace("{mm}", f"{dt.month:02d}")
+                .replace("{dd}", f"{dt.day:02d}")
+                .replace("{hh}", f"{dt.hour:02d}"))
+        path = os.path.join(format_dir, *f"{name}.{fmt}".split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        dt = _previous_period(dt, convention)
+
+
+class Command(BaseCommand):
+    help = "Measure product ingestion scan time, per phase, without publishing anything"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--product",
+            type=int,
+            help="ID of a Product whose real watch folders should be scanned in dry-run mode",
+        )
+        parser.add_argument(
+            "--generate",
+            type=int,
+            metavar="N",
+            help="Generate a synthetic tree of N files and benchmark walking and matching it",
+        )
+        parser.add_argument(
+            "--convention",
+            default="{yyyy}_{mm}_{dd}_00_00_00",
+            help="Filename convention for the synthetic tree (default: daily)",
+        )
+        parser.add_argument(
+            "--format",
+            default="png",
+            help="File format of the synthetic tree (default: png)",
+        )
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=0,
+            help="Size in bytes of each synthetic file (default: 0)",
+        )
+        parser.add_argument(
+            "--root",
+            help="Directory to generate the synthetic tree in, kept afterwards "
+                 "(default: a temporary directory that is removed)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the generated synthetic tree",
+        )
+
+    def handle(self, *args, **options):
+        if options["product"] is None and options["generate"] is None:
+            raise CommandError("Pass --product ID to scan a product or --generate N to scan a synthetic tree")
+
+        if options["product"] is not None:
+            self.benchmark_product(options["product"])
+
+        if options["generate"] is not None:
+            self.benchmark_synthetic(options)
+
+    def benchmark_product(self, product_id):
+        from climweb.base.models import Product
+
+        product = Product.objects.filter(pk=product_id).first()
+        if not product:
+            raise CommandError(f"Product {product_id} does not exist")
+
+        timer = IngestionTimer()
+        start = time.perf_counter()
+        stats = _ingest_product(product, dry_run=True, timer=timer)
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(f"Product '{product.name}' (dry run)")
+        self.stdout.write(f"  {stats['new']} new, {stats['changed']} changed, {stats['skipped']} unchanged file(s)")
+        self.report(timer, elapsed)
+
+    def benchmark_synthetic(self, options):
+        fmt = options["format"].lower().strip(".")
+        convention = options["convention"]
+        root = options["root"] or tempfile.mkdtemp(prefix="climweb-ingestion-benchmark-")
+        format_dir = os.path.join(root, fmt)
+
+        try:
+            start = time.perf_counter()
+            generate_synthetic_tree(format_dir, convention, fmt, options["generate"], options["size"])
+            self.stdout.write(
+                f"Generated {options['generate']} file(s) in {format_dir} "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+
+            item_type = SimpleNamespace(pk=None, file_name_convention=convention, valid_for_days=None)
+            timer = IngestionTimer()
+
+            start = time.perf_counter()
+            for file_path, _, _ in _iter_matched_files(format_dir, fmt, [item_type], timer=timer):
+                # nothing is ingested yet, so every file is stat'd and hashed
+                with timer.phase("lookup"):
+                    os.path.getmtime(file_path)
+                    _file_digest(file_path)
+            elapsed = time.perf_counter() - start
+
+            self.stdout.write(f"Synthetic tree, convention '{convention}' (dry run)")
+            self.report(timer, elapsed)
+        finally:
+            # a directory passed with --root is never removed
+            if not options["keep"] and not options["root"]:
+                shutil.rmtree(root, ignore_errors=True)
+
+    def report(self, timer, elapsed):
+        self.stdout.write(f"  {timer.files} file(s) walked, {timer.matched} matched")
+        for phase in IngestionTimer.PHASES:
+            if phase in DRY_RUN_PHASES:
+                self.stdout.write(f"  {phase:<8} {timer.seconds[phase]:8.3f}s")
+            else:
+                self.stdout.write(f"  {phase:<8} {'not measured':>9} (dry run)")
+        self.stdout.write(f"  {'total':<8} {elapsed:8.3f}s")
+
+        files_per_second = timer.files / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(f"  {files_per_second:,.0f} files/s"))
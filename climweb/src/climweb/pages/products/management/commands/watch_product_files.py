@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from climweb.pages.products.watcher import ProductFileWatcher
+
+
+class Command(BaseCommand):
+    help = "Watch product ingestion folders and publish new files as soon as they appear"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--polling",
+            action="store_true",
+            help="Poll for changes instead of using inotify, e.g. for network mounts",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=int,
+            default=10,
+            help="Seconds between polls when polling (default: 10)",
+        )
+        parser.add_argument(
+            "--debounce",
+            type=float,
+            default=2.0,
+            help="Seconds to wait for a folder to go quiet before ingesting (default: 2)",
+        )
+
+    def handle(self, *args, **options):
+        watcher = ProductFileWatcher(
+            debounce=options["debounce"],
+            poll_interval=options["poll_interval"],
+            force_polling=options["polling"],
+        )
+
+        self.stdout.write("Watching product ingestion folders. Press Ctrl+C to stop.")
+
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS("Stopped watching product ingestion folders"))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0033_add_gif_product_block'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productingestedfile',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 digest of the file content when it was ingested', max_length=64, verbose_name='Content Hash'),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 5.2.16 on 2026-10-18 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.template.defaultfilters import truncatechars
+
+
+def _listing_image_id(raw, Document):
+    for block in raw:
+        value = block.get('value') or {}
+        if value.get('image'):
+            return value['image']
+        if value.get('thumbnail'):
+            return value['thumbnail']
+        if value.get('document') and value.get('auto_generate_thumbnail'):
+            thumbnail_id = Document.objects.filter(pk=value['document']) \
+                .values_list('thumbnail_id', flat=True).first()
+            if thumbnail_id:
+                return thumbnail_id
+    return None
+
+
+def _summary(raw):
+    from climweb.base.utils import get_first_non_empty_p_string
+
+    for block in raw:
+        description = (block.get('value') or {}).get('description')
+        if description:
+            p = get_first_non_empty_p_string(description)
+            return truncatechars(p, 160) if p else ''
+    return ''
+
+
+def populate_product_item_listings(apps, schema_editor):
+    Page = apps.get_model('wagtailcore', 'Page')
+    ProductPage = apps.get_model('products', 'ProductPage')
+    SubNationalProductPage = apps.get_model('products', 'SubNationalProductPage')
+    ProductItemPage = apps.get_model('products', 'ProductItemPage')
+    ProductItemListing = apps.get_model('products', 'ProductItemListing')
+    Document = apps.get_model('base', 'CustomDocumentModel')
+
+    products_by_page = dict(ProductPage.objects.values_list('page_ptr_id', 'product_id'))
+    products_by_page.update(SubNationalProductPage.objects.values_list('page_ptr_id', 'product_id'))
+    parents_by_path = {}
+
+    listings = []
+    for page in ProductItemPage.objects.filter(live=True).iterator():
+        # wagtail page paths use 4 characters per tree level
+        parent_path = page.path[:-4]
+        if parent_path not in parents_by_path:
+            parents_by_path[parent_path] = Page.objects.filter(path=parent_path) \
+                .values_list('pk', flat=True).first()
+        parent_id = parents_by_path[parent_path]
+        if parent_id is None:
+            continue
+
+        raw = list(page.products.raw_data) if page.products else []
+        listings.append(ProductItemListing(
+            page_id=page.pk,
+            parent_page_id=parent_id,
+            product_id=products_by_page.get(parent_id),
+            title=page.title,
+            date=page.date,
+            valid_until=page.valid_until,
+            listing_image_id=_listing_image_id(raw, Document),
+            summary=_summary(raw),
+        ))
+
+    ProductItemListing.objects.bulk_create(listings, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0055_customdocumentmodel_thumbnail_pending'),
+        ('products', '0034_productingestedfile_content_hash'),
+        ('wagtailcore', '0094_alter_page_locale'),
+        ('wagtailimages', '0027_image_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductItemListing',
+            fields=[
+                ('page', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing', serialize=False, to='products.productitempage', verbose_name='Product Item Page')),
+                ('title', models.CharField(max_length=255, verbose_name='Title')),
+                ('date', models.DateField(verbose_name='Effective from')),
+                ('valid_until', models.DateField(blank=True, null=True, verbose_name='Effective until')),
+                ('summary', models.TextField(blank=True, verbose_name='Summary')),
+                ('listing_image', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='wagtailimages.image', verbose_name='Listing Image')),
+                ('parent_page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='wagtailcore.page', verbose_name='Product Page')),
+                ('product', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='base.product', verbose_name='Product')),
+            ],
+            options={
+                'verbose_name': 'Product Item Listing',
+                'verbose_name_plural': 'Product Item Listings',
+                'indexes': [models.Index(fields=['parent_page', '-date'], name='products_listing_parent_date')],
+            },
+        ),
+        migrations.RunPython(populate_product_item_listings, migrations.RunPython.noop),
+    ]
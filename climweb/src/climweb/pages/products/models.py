@@ -1,7 +1,11 @@
+import json
+
 from adminboundarymanager.models import AdminBoundarySettings
 from django import forms
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.template.defaultfilters import truncatechars
 from django.urls import reverse
 from django.utils import timezone
@@ -18,15 +22,18 @@ from wagtail.api.v2.utils import get_full_url
 from wagtail.fields import StreamField
 from wagtail.models import Page
 from wagtail.rich_text import RichText
+from wagtail.signals import page_published, page_unpublished, post_page_move
 from wagtail.snippets.models import register_snippet
 from climweb.base.choosers import register_searchable_chooser
 
 from climweb.base.blocks import UUIDModelChooserBlock
 from climweb.base.mixins import MetadataPageMixin
-from climweb.base.models import Product, ProductItemType
+from climweb.base.models import Product, ProductCategory, ProductItemType
 from climweb.base.models import ServiceCategory, AbstractIntroPage
+from climweb.base.models.custom import document_thumbnail_generated
 from climweb.base.utils import paginate, query_param_to_list, get_first_non_empty_p_string
 from climweb.pages.publications.models import PageView
+from .utils import bump_product_item_types_version, get_product_item_type_resolver
 from .blocks import (
     ProductItemImageContentBlock,
     ProductItemDocumentContentBlock,
@@ -45,6 +52,8 @@ class ProductIndexPage(MetadataPageMixin, Page):
     
     max_count = 1
     is_products_index = True
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('products.ProductPage', 'products.SubNationalProductPage')
     
     listing_heading = models.CharField(max_length=255, default="Explore our Products",
                                        verbose_name=_("Products listing Heading"))
@@ -155,13 +164,15 @@ class BaseProductPage(AbstractIntroPage):
     
     @cached_property
     def filters(self):
-        years = self.all_products.dates("productitempage__date", "year")
+        years = self.all_products.dates("date", "year")
         return {'year': years, 'month': MONTHS}
     
     @cached_property
     def all_products(self):
-        product_items = self.get_children().specific().live().order_by('-productitempage__date')
-        # Return the related items
+        # read from the listing table, which only holds live items
+        product_items = ProductItemListing.objects.filter(parent_page_id=self.pk) \
+            .select_related('page', 'listing_image') \
+            .order_by('-date')
         return product_items
     
     def filter_products(self, request):
@@ -173,9 +184,9 @@ class BaseProductPage(AbstractIntroPage):
         filters = models.Q()
         
         if years:
-            filters &= models.Q(productitempage__date__year__in=years)
+            filters &= models.Q(date__year__in=years)
         if months:
-            filters &= models.Q(productitempage__date__month__in=months)
+            filters &= models.Q(date__month__in=months)
         
         return products.filter(filters)
     
@@ -252,27 +263,23 @@ class ProductPage(BaseProductPage):
     @cached_property
     def map_layers_list(self):
         layers = []
+        resolver = get_product_item_type_resolver(self.product_id)
         for map_layer in self.map_layers:
             layer = map_layer.value.get("geomanager_layer")
             product_type = map_layer.value.get("product_type")
             
             if product_type:
-                product_type = ProductItemType.objects.filter(pk=product_type).first()
+                product_type = resolver.get(product_type)
             layers.append({
                 "layer": layer,
                 "product_type": product_type
             })
         return layers
     
-    @property
+    @cached_property
     def view_count(self):
         """Get the total number of views for this product page"""
-        try:
-            from django.contrib.contenttypes.models import ContentType
-            content_type = ContentType.objects.get_for_model(self)
-            return PageView.objects.filter(content_type=content_type, object_id=self.pk).count()
-        except Exception:
-            return 0
+        return PageView.get_view_count(self)
     
     def record_view(self, request=None, **kwargs):
         """Record a view of this product page"""
@@ -371,16 +378,8 @@ class ProductItemPage(MetadataPageMixin, Page):
         context = super().get_context(request, *args, **kwargs)
 
         parent_page = self.get_parent().specific
-        categories = list(parent_page.product.categories.all())
-
-        # build a complete map: item_type_id → list of category ids
-        # (one item type can belong to multiple categories)
-        item_type_to_categories = {}
-        for category in categories:
-            for item_type in category.product_item_types.all():
-                if item_type.pk not in item_type_to_categories:
-                    item_type_to_categories[item_type.pk] = []
-                item_type_to_categories[item_type.pk].append(category.id)
+        resolver = get_product_item_type_resolver(parent_page.product_id, request)
+        resolver.resolve_blocks(self.products)
 
         product_categories = {}
         products_dict = {}
@@ -388,10 +387,9 @@ class ProductItemPage(MetadataPageMixin, Page):
         for product in self.products:
             item_type = product.value.product_item_type()
 
-            # find which category this item type belongs to
-            category_ids = item_type_to_categories.get(item_type.pk, [])
-            # use the first matching category — or None
-            category_id = category_ids[0] if category_ids else None
+            # every item type belongs to a single category of the product
+            category = item_type.category if item_type.category.product_id == parent_page.product_id else None
+            category_id = category.pk if category else None
 
             # composite key guarantees uniqueness across categories
             composite_key = f"{category_id}-{item_type.pk}" if category_id else str(item_type.pk)
@@ -406,10 +404,7 @@ class ProductItemPage(MetadataPageMixin, Page):
 
             # collect categories that have products
             if category_id and category_id not in product_categories:
-                for cat in categories:
-                    if cat.id == category_id:
-                        product_categories[cat.id] = cat
-                        break
+                product_categories[category_id] = category
 
         # sort each group by date
         for key in products_dict:
@@ -485,15 +480,10 @@ class ProductItemPage(MetadataPageMixin, Page):
         
         return meta_description
     
-    @property
+    @cached_property
     def view_count(self):
         """Get the total number of views for this product item page"""
-        try:
-            from django.contrib.contenttypes.models import ContentType
-            content_type = ContentType.objects.get_for_model(self)
-            return PageView.objects.filter(content_type=content_type, object_id=self.pk).count()
-        except Exception:
-            return 0
+        return PageView.get_view_count(self)
     
     def record_view(self, request=None, **kwargs):
         """Record a view of this product item page"""
@@ -538,6 +528,8 @@ class ProductIngestedFile(models.Model):
     )
     file_path = models.CharField(max_length=1000, verbose_name=_("File Path"))
     file_mtime = models.FloatField(verbose_name=_("File Modification Time"))
+    content_hash = models.CharField(max_length=64, blank=True, verbose_name=_("Content Hash"),
+                                    help_text=_("SHA-256 digest of the file content when it was ingested"))
     product_item_page = models.ForeignKey(
         ProductItemPage,
         on_delete=models.SET_NULL,
@@ -556,6 +548,96 @@ class ProductIngestedFile(models.Model):
         return self.file_path
 
 
+class ProductItemListing(models.Model):
+    """
+    One row per live ProductItemPage with the fields shown in the product listing,
+    so a product page can filter and paginate its items from a single indexed query
+    instead of loading every child page and its products StreamField.
+    Rows are refreshed on publish, unpublish and when ingestion appends blocks.
+    """
+    page = models.OneToOneField(
+        ProductItemPage,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='listing',
+        verbose_name=_("Product Item Page"),
+    )
+    parent_page = models.ForeignKey(
+        Page,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_("Product Page"),
+    )
+    product = models.ForeignKey(
+        'base.Product',
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+        verbose_name=_("Product"),
+    )
+    title = models.CharField(max_length=255, verbose_name=_("Title"))
+    date = models.DateField(verbose_name=_("Effective from"))
+    valid_until = models.DateField(blank=True, null=True, verbose_name=_("Effective until"))
+    listing_image = models.ForeignKey(
+        'wagtailimages.Image',
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+        verbose_name=_("Listing Image"),
+    )
+    summary = models.TextField(blank=True, verbose_name=_("Summary"))
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['parent_page', '-date'], name='products_listing_parent_date'),
+        ]
+        verbose_name = _("Product Item Listing")
+        verbose_name_plural = _("Product Item Listings")
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def update_for_page(cls, page):
+        """Create, refresh or remove the listing row of a ProductItemPage"""
+        if not page.live:
+            cls.objects.filter(page_id=page.pk).delete()
+            return None
+
+        parent = page.get_parent().specific
+        listing_image = page.products_listing_image
+
+        listing, _ = cls.objects.update_or_create(
+            page_id=page.pk,
+            defaults={
+                'parent_page_id': parent.pk,
+                'product_id': getattr(parent, 'product_id', None),
+                'title': page.title,
+                'date': page.date,
+                'valid_until': page.valid_until,
+                'listing_image_id': listing_image.pk if listing_image else None,
+                'summary': page.listing_summary or '',
+            },
+        )
+        return listing
+
+    @property
+    def url(self):
+        return self.page.url
+
+    @property
+    def products_listing_image(self):
+        return self.listing_image
+
+    @property
+    def listing_summary(self):
+        return self.summary
+
+    @property
+    def view_count(self):
+        return self.page.view_count
+
+
 class SubNationalProductsLandingPage(AbstractIntroPage, Page):
     parent_page_types = ['products.ProductIndexPage']
     subpage_types = ['products.SubNationalProductPage']
@@ -653,15 +735,10 @@ class SubNationalProductPage(BaseProductPage):
         summary = self.get_meta_description()
         return summary
     
-    @property
+    @cached_property
     def view_count(self):
         """Get the total number of views for this subnational product page"""
-        try:
-            from django.contrib.contenttypes.models import ContentType
-            content_type = ContentType.objects.get_for_model(self)
-            return PageView.objects.filter(content_type=content_type, object_id=self.pk).count()
-        except Exception:
-            return 0
+        return PageView.get_view_count(self)
     
     def record_view(self, request=None, **kwargs):
         """Record a view of this subnational product page"""
@@ -694,3 +771,63 @@ class SubNationalProductPage(BaseProductPage):
             print(f"Error recording page view: {e}")
         
         return super().serve(request, *args, **kwargs)
+
+
+@receiver(page_published, sender=ProductItemPage)
+def warm_product_item_page_renditions(sender, instance, **kwargs):
+    from climweb.pages.products.tasks import warm_product_item_renditions
+    
+    page_id = instance.pk
+    transaction.on_commit(lambda: warm_product_item_renditions.delay(page_id))
+
+
+@receiver(page_published, sender=ProductItemPage)
+@receiver(page_unpublished, sender=ProductItemPage)
+def update_product_item_listing(sender, instance, **kwargs):
+    ProductItemListing.update_for_page(instance)
+
+
+@receiver(post_page_move, sender=ProductItemPage)
+def update_moved_product_item_listing(sender, instance, **kwargs):
+    # the moved page is sent as a plain Page, without the listing fields
+    ProductItemListing.update_for_page(instance.specific)
+
+
+def product_item_pages_with_document(document):
+    """Live ProductItemPages with a document_product block of the document"""
+    # ingestion writes the blocks with a queryset update, so the reference index
+    # does not know about them, and the raw StreamField data is queried instead
+    return ProductItemPage.objects.live().extra(
+        where=["products @> %s::jsonb"],
+        params=[json.dumps([{"type": "document_product", "value": {"document": document.pk}}])],
+    )
+
+
+@receiver(document_thumbnail_generated)
+def update_product_item_listing_thumbnails(sender, document, thumbnail, **kwargs):
+    from climweb.base.cache import purge_page
+
+    # ingested items are listed while their thumbnail is still being rendered
+    for page in product_item_pages_with_document(document):
+        ProductItemListing.update_for_page(page)
+        # purges the product page listing the item too
+        purge_page(page)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductCategory)
+@receiver(post_delete, sender=ProductCategory)
+@receiver(post_save, sender=ProductItemType)
+@receiver(post_delete, sender=ProductItemType)
+def invalidate_product_item_types(sender, instance, **kwargs):
+    if isinstance(instance, Product):
+        product_id = instance.pk
+    elif isinstance(instance, ProductCategory):
+        product_id = instance.product_id
+    else:
+        product_id = ProductCategory.objects.filter(pk=instance.category_id) \
+            .values_list('product_id', flat=True).first()
+
+    if product_id:
+        bump_product_item_types_version(product_id)
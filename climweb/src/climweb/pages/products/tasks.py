@@ -1,28 +1,31 @@
+import functools
+import hashlib
 import json
 import os
 import re
+import time
 import unicodedata
 import uuid
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 
+from celery import chord
+from celery.signals import beat_init
 from celery_singleton import Singleton
 from django.core.files import File
+from django.db import transaction
 from django.utils.text import slugify
 from loguru import logger
 
 from climweb.config.celery import app
 
 
-def _convention_to_regex(convention):
+def _convention_to_pattern(convention, suffix=''):
     """
-    Convert a filename convention pattern to a named-group regex.
+    Convert a filename convention to an (unanchored) regex pattern string.
 
-    Supports subdirectory paths, e.g.:
-      {yyyy}/Bulletin_de_vigilance_nationale_du_{dd}-{mm}-{yyyy}
-
-    If a variable appears more than once, the first occurrence becomes a
-    named capturing group and subsequent ones become backreferences so the
-    same value must appear in both positions.
+    The date variables become named groups. A suffix is appended to the group
+    names so several conventions can be combined into a single regex.
     """
     pattern = re.escape(unicodedata.normalize('NFC', convention))
     seen = set()
@@ -34,11 +37,44 @@ def _convention_to_regex(convention):
     ]:
         while var in pattern:
             if name not in seen:
-                pattern = pattern.replace(var, f'(?P<{name}>{digits})', 1)
+                pattern = pattern.replace(var, f'(?P<{name}{suffix}>{digits})', 1)
                 seen.add(name)
             else:
-                pattern = pattern.replace(var, f'(?P={name})', 1)
-    return re.compile(r'^' + pattern + r'$')
+                pattern = pattern.replace(var, f'(?P={name}{suffix})', 1)
+    return pattern
+
+
+@functools.lru_cache(maxsize=512)
+def _convention_to_regex(convention):
+    """
+    Convert a filename convention pattern to a named-group regex.
+
+    Supports subdirectory paths, e.g.:
+      {yyyy}/Bulletin_de_vigilance_nationale_du_{dd}-{mm}-{yyyy}
+
+    If a variable appears more than once, the first occurrence becomes a
+    named capturing group and subsequent ones become backreferences so the
+    same value must appear in both positions.
+
+    Compiled patterns are cached per convention string.
+    """
+    return re.compile(r'^' + _convention_to_pattern(convention) + r'$')
+
+
+@functools.lru_cache(maxsize=128)
+def _combined_convention_regex(conventions):
+    """
+    Combine a tuple of conventions into one regex so each file is tested once.
+
+    Each convention becomes an alternative wrapped in a group named _c{index},
+    so match.lastgroup tells which convention matched. Like the per-convention
+    loop it replaces, the first matching convention wins.
+    """
+    alternatives = [
+        f'(?P<_c{index}>{_convention_to_pattern(convention, suffix=f"_{index}")})'
+        for index, convention in enumerate(conventions)
+    ]
+    return re.compile(r'^(?:' + '|'.join(alternatives) + r')$')
 
 
 def _parse_datetime(match):
@@ -87,47 +123,99 @@ def _get_or_create_product_item_page(product_page, variable_name, dt, has_time=F
     return page, True
 
 
+def _place_file_in_storage(field_file, file_path, mode):
+    """
+    Put file_path at the field's upload path without copying its bytes.
+
+    Only possible when the storage is on the local filesystem and on the same
+    device as the source file. In 'link' mode the file is hard-linked, so it
+    stays in the watch folder; in 'move' mode it is renamed into place.
+    Returns the stored name, or None if the file could not be placed this way.
+    """
+    storage = field_file.storage
+    try:
+        storage_root = storage.path('')
+    except NotImplementedError:
+        return None
+
+    if not os.path.isdir(storage_root) or os.stat(storage_root).st_dev != os.stat(file_path).st_dev:
+        return None
+
+    max_length = field_file.field.max_length
+    name = field_file.field.generate_filename(field_file.instance, os.path.basename(file_path))
+
+    while True:
+        name = storage.get_available_name(name, max_length=max_length)
+        target = storage.path(name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            if mode == 'move':
+                # os.link refuses to overwrite, so link then unlink to keep the move atomic
+                os.link(file_path, target)
+                os.unlink(file_path)
+            else:
+                os.link(file_path, target)
+        except FileExistsError:
+            # another process took this name in the meantime, pick another one
+            continue
+        except OSError as exc:
+            logger.warning(f"[INGESTION] Could not {mode} '{file_path}' into storage, copying instead: {exc}")
+            return None
+        return name
+
+
+def _save_ingested_file(instance, file_path):
+    """
+    Attach file_path to the file field of a new Image/Document and save it.
+
+    By default ('copy') the file is streamed into storage in chunks. When
+    PRODUCT_INGESTION_FILE_PLACEMENT opts into it, the file is hard-linked
+    ('link') or moved ('move') into the upload path instead, if storage is on the
+    same filesystem, since watch roots usually live inside MEDIA_ROOT.
+    """
+    from django.conf import settings
+
+    field_file = instance.file
+    mode = settings.PRODUCT_INGESTION_FILE_PLACEMENT
+
+    name = None
+    if mode in ('link', 'move'):
+        name = _place_file_in_storage(field_file, file_path, mode)
+
+    if name is None:
+        with open(file_path, 'rb') as f:
+            field_file.save(os.path.basename(file_path), File(f), save=True)
+        return instance
+
+    # mirrors FieldFile.save(); assigning through the descriptor also lets
+    # ImageField fill in the width and height of images
+    setattr(instance, field_file.field.attname, name)
+    instance.save()
+    return instance
+
+
 def _create_wagtail_image(file_path, title):
     from wagtail.images import get_image_model
     Image = get_image_model()
-    with open(file_path, 'rb') as f:
-        image = Image(title=title)
-        image.file.save(os.path.basename(file_path), File(f), save=True)
-    return image
+    return _save_ingested_file(Image(title=title), file_path)
 
 
 def _create_wagtail_document(file_path, title):
     from climweb.base.models import CustomDocumentModel
-    with open(file_path, 'rb') as f:
-        doc = CustomDocumentModel(title=title)
-        doc.file.save(os.path.basename(file_path), File(f), save=True)
-    return doc
+    return _save_ingested_file(CustomDocumentModel(title=title), file_path)
 
 
-def _get_products_raw(page):
+def _get_products_raw(page_obj):
     """
     Return the products StreamField as a plain list of block dicts.
     stream_data was removed in Wagtail 6+; use stream_block.get_prep_value()
     which serialises the StreamValue back to the list format used by JSONField.
     """
-    from climweb.pages.products.models import ProductItemPage
-    page_obj = ProductItemPage.objects.get(pk=page.pk)
     return page_obj.products.stream_block.get_prep_value(page_obj.products) or []
 
 
-def _save_products_raw(page, raw):
-    """
-    Write the raw block list back to the products StreamField.
-    Django's JSONField (use_json_field=True) serialises the list automatically.
-    """
-    from climweb.pages.products.models import ProductItemPage
-    ProductItemPage.objects.filter(pk=page.pk).update(products=raw)
-
-
-def _sync_page_valid_until(page):
-    """Set page.valid_until to the latest valid_until across all product blocks."""
-    from climweb.pages.products.models import ProductItemPage
-    raw = _get_products_raw(page)
+def _compute_valid_until(raw):
+    """Return the latest valid_until across all product blocks in a raw block list."""
     dates = []
     for block in raw:
         vu = block.get('value', {}).get('valid_until')
@@ -136,20 +224,23 @@ def _sync_page_valid_until(page):
                 dates.append(date.fromisoformat(vu))
             except (ValueError, TypeError):
                 pass
-    new_valid_until = max(dates) if dates else None
-    ProductItemPage.objects.filter(pk=page.pk).update(valid_until=new_valid_until)
-
+    return max(dates) if dates else None
 
-def _append_image_block(page, item_type_pk, effective_date, image_pk, valid_until=None):
-    """Append an image_product block to the page's products StreamField."""
-    raw = _get_products_raw(page)
-    date_str = effective_date.isoformat()
 
+def _has_product_block(raw, block_type, item_type_pk, date_str):
     for block in raw:
-        if (block.get('type') == 'image_product'
+        if (block.get('type') == block_type
                 and str(block.get('value', {}).get('product_type')) == str(item_type_pk)
                 and block.get('value', {}).get('date') == date_str):
-            return
+            return True
+    return False
+
+
+def _append_image_block(raw, item_type_pk, effective_date, image_pk, valid_until=None):
+    """Append an image_product block to a raw products list, unless one exists for the type and date."""
+    date_str = effective_date.isoformat()
+    if _has_product_block(raw, 'image_product', item_type_pk, date_str):
+        return False
 
     raw.append({
         'type': 'image_product',
@@ -162,21 +253,17 @@ def _append_image_block(page, item_type_pk, effective_date, image_pk, valid_unti
             'description': '',
         },
     })
-    _save_products_raw(page, raw)
+    return True
 
 
-def _append_document_block(page, item_type_pk, effective_date, doc, valid_until=None):
-    """Append a document_product block to the page's products StreamField."""
-    raw = _get_products_raw(page)
+def _append_document_block(raw, item_type_pk, effective_date, doc, valid_until=None):
+    """Append a document_product block to a raw products list, unless one exists for the type and date."""
     date_str = effective_date.isoformat()
+    if _has_product_block(raw, 'document_product', item_type_pk, date_str):
+        return False
 
-    for block in raw:
-        if (block.get('type') == 'document_product'
-                and str(block.get('value', {}).get('product_type')) == str(item_type_pk)
-                and block.get('value', {}).get('date') == date_str):
-            return
-
-    thumbnail = doc.get_thumbnail()
+    # generated in the background, the page shows the thumbnail once it is ready
+    thumbnail = doc.request_thumbnail()
 
     raw.append({
         'type': 'document_product',
@@ -186,12 +273,84 @@ def _append_document_block(page, item_type_pk, effective_date, doc, valid_until=
             'date': date_str,
             'valid_until': valid_until.isoformat() if valid_until else None,
             'document': doc.pk,
-            'auto_generate_thumbnail': False,
+            'auto_generate_thumbnail': True,
             'thumbnail': thumbnail.pk if thumbnail else None,
             'description': '',
         },
     })
-    _save_products_raw(page, raw)
+    return True
+
+
+class _PendingPageWrite:
+    """The blocks and ingested files collected for one ProductItemPage during a scan."""
+
+    def __init__(self, page):
+        self.page = page
+        self.blocks = []
+        self.files = []
+
+    def add(self, is_image, item_type_pk, effective_date, media_obj, valid_until, file_path, file_mtime,
+            content_hash):
+        self.blocks.append((is_image, item_type_pk, effective_date, media_obj, valid_until))
+        self.files.append((file_path, file_mtime, content_hash))
+
+
+def _write_page_products(product, pending):
+    """
+    Apply every block collected for a page in one read-modify-write.
+
+    The page is read once, all new blocks are appended in memory, valid_until is
+    computed from the result, and the page update plus the ProductIngestedFile
+    records are committed together in a single transaction.
+    """
+    from climweb.pages.products.models import ProductIngestedFile, ProductItemListing, ProductItemPage
+
+    with transaction.atomic():
+        page_obj = ProductItemPage.objects.select_for_update().get(pk=pending.page.pk)
+        raw = _get_products_raw(page_obj)
+
+        for is_image, item_type_pk, effective_date, media_obj, valid_until in pending.blocks:
+            if is_image:
+                _append_image_block(raw, item_type_pk, effective_date, media_obj.pk, valid_until)
+            else:
+                _append_document_block(raw, item_type_pk, effective_date, media_obj, valid_until)
+
+        # Django's JSONField (use_json_field=True) serialises the list automatically.
+        ProductItemPage.objects.filter(pk=page_obj.pk).update(
+            products=raw,
+            valid_until=_compute_valid_until(raw),
+        )
+
+        ProductIngestedFile.objects.bulk_create(
+            [
+                ProductIngestedFile(
+                    product=product,
+                    file_path=file_path,
+                    file_mtime=file_mtime,
+                    content_hash=content_hash,
+                    product_item_page_id=page_obj.pk,
+                )
+                for file_path, file_mtime, content_hash in pending.files
+            ],
+            update_conflicts=True,
+            unique_fields=['product', 'file_path'],
+            update_fields=['file_mtime', 'content_hash', 'product_item_page'],
+        )
+
+        # the update above bypasses publishing, so refresh the listing row here
+        page_obj.refresh_from_db(fields=['products', 'valid_until'])
+        ProductItemListing.update_for_page(page_obj)
+
+    for file_path, _, _ in pending.files:
+        logger.info(f"[INGESTION] Ingested: {file_path} → page '{page_obj.slug}'")
+
+    # blocks are written without publishing a new revision, so warm the renditions
+    # and purge the cached page here
+    from climweb.base.cache import purge_page
+
+    page_id = page_obj.pk
+    transaction.on_commit(lambda: warm_product_item_renditions.delay(page_id))
+    transaction.on_commit(lambda: purge_page(page_obj))
 
 
 def _resolve_watch_root(watch_root):
@@ -206,82 +365,258 @@ def _resolve_watch_root(watch_root):
     return os.path.join(settings.MEDIA_ROOT, watch_root)
 
 
-def _ingest_product(product):
+def _iter_format_dir_files(format_dir, paths=None):
+    """
+    Yield the files under format_dir that should be considered for ingestion.
+
+    With no paths this is a full os.walk of the tree (the periodic scan). When
+    the file watcher passes the paths it saw change, only those that live under
+    format_dir and still exist are yielded, so nothing is walked or re-stat'd.
+    """
+    if paths is None:
+        for dirpath, _, filenames in os.walk(format_dir):
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+        return
+
+    prefix = os.path.join(format_dir, '')
+    for path in paths:
+        if path.startswith(prefix) and os.path.isfile(path):
+            yield path
+
+
+def _product_variable_dir(product):
+    """Return the {watch_root}/{variable_name} folder scanned for a product."""
+    return os.path.join(_resolve_watch_root(product.watch_root), product.variable_name)
+
+
+def _file_digest(file_path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file, read in chunks so large files never sit in memory."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _record_touched_files(product, touched):
+    """
+    Store the new mtime of files whose content did not change, so they are
+    skipped on the next scan without being hashed again.
+    """
+    from climweb.pages.products.models import ProductIngestedFile
+
+    if not touched:
+        return
+
+    ProductIngestedFile.objects.bulk_create(
+        [
+            ProductIngestedFile(product=product, file_path=file_path, file_mtime=file_mtime,
+                                content_hash=content_hash)
+            for file_path, (file_mtime, content_hash) in touched.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['product', 'file_path'],
+        update_fields=['file_mtime'],
+    )
+
+
+def _load_ingested_index(product, paths=None):
+    """
+    Return {file_path: (file_mtime, content_hash)} for the files already ingested for a product.
+
+    Loaded once per scan so unchanged files are skipped without a query each.
+    When paths is given only those rows are loaded.
+    """
+    from climweb.pages.products.models import ProductIngestedFile
+
+    ingested = ProductIngestedFile.objects.filter(product=product)
+    if paths is not None:
+        ingested = ingested.filter(file_path__in=paths)
+    return {
+        file_path: (file_mtime, content_hash)
+        for file_path, file_mtime, content_hash in ingested.values_list(
+            'file_path', 'file_mtime', 'content_hash'
+        ).iterator()
+    }
+
+
+class IngestionTimer:
+    """
+    Accumulates the time spent in each phase of a scan, for the
+    benchmark_product_ingestion command and the scan log.
+    """
+    PHASES = ('walk', 'match', 'lookup', 'media', 'pages')
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.files = 0
+        self.matched = 0
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+
+def _iter_matched_files(format_dir, fmt, item_types, paths=None, timer=None):
+    """
+    Walk format_dir once and yield (file_path, item_type, match) for every file
+    whose relative path matches one of the item types' conventions.
+    """
+    timer = timer or IngestionTimer()
+
+    conventions = tuple(item_type.file_name_convention for item_type in item_types)
+    try:
+        matcher = _combined_convention_regex(conventions)
+    except re.error as exc:
+        logger.error(f"[INGESTION] Could not combine convention patterns for '{fmt}': {exc}")
+        return
+
+    files = _iter_format_dir_files(format_dir, paths)
+    while True:
+        with timer.phase('walk'):
+            file_path = next(files, None)
+        if file_path is None:
+            return
+        timer.files += 1
+
+        with timer.phase('match'):
+            _, ext = os.path.splitext(file_path)
+            if ext.lstrip('.').lower() != fmt:
+                continue
+
+            # Match against the relative path from format_dir (forward slashes)
+            # so conventions like {yyyy}/prefix_{dd}-{mm}-{yyyy} work correctly.
+            rel_stem = os.path.relpath(file_path, format_dir)
+            rel_stem = os.path.splitext(rel_stem)[0].replace(os.sep, '/')
+            rel_stem = unicodedata.normalize('NFC', rel_stem)
+
+            combined_match = matcher.match(rel_stem)
+            if not combined_match:
+                continue
+
+            item_type = item_types[int(combined_match.lastgroup[2:])]
+            match = _convention_to_regex(item_type.file_name_convention).match(rel_stem)
+
+        timer.matched += 1
+        yield file_path, item_type, match
+
+
+def _ingest_product(product, paths=None, dry_run=False, timer=None):
+    """
+    Match files in the product's watch folders against its filename conventions
+    and publish them on ProductItemPages.
+
+    When paths is given only those files are considered, otherwise the whole
+    {watch_root}/{variable_name}/{format} tree is scanned. With dry_run, files
+    are matched and compared against the ingested index, but nothing is
+    uploaded or written. Phase timings are accumulated on timer if given.
+
+    Returns a dict with the number of matched files that were skipped because
+    they were unchanged, re-ingested because they changed, or new. A file whose
+    mtime changed but whose content digest did not (e.g. touched or re-synced)
+    counts as unchanged and is not uploaded again.
+    """
     from climweb.base.models import IMAGE_FORMATS
-    from climweb.pages.products.models import ProductIngestedFile, ProductPage
+    from climweb.pages.products.models import ProductPage
+
+    stats = {'skipped': 0, 'changed': 0, 'new': 0}
+    timer = timer or IngestionTimer()
 
     if not product.watch_root or not product.variable_name:
         logger.warning(f"[INGESTION] Product '{product.name}' missing watch_root or variable_name, skipping.")
-        return
+        return stats
 
     product_page = ProductPage.objects.filter(product=product).live().first()
     if not product_page:
         logger.warning(f"[INGESTION] No live ProductPage found for product '{product.name}', skipping.")
-        return
+        return stats
 
-    watch_root = _resolve_watch_root(product.watch_root)
-    variable_dir = os.path.join(watch_root, product.variable_name)
+    variable_dir = _product_variable_dir(product)
     if not os.path.isdir(variable_dir):
         logger.warning(f"[INGESTION] Variable directory not found: {variable_dir}")
-        return
+        return stats
+
+    with timer.phase('lookup'):
+        ingested_index = _load_ingested_index(product, paths)
 
+    # Group the item types of every category by format so that each format
+    # directory is walked once, however many categories and item types share it.
+    item_types_by_format = {}
     for category in product.categories.all():
         fmt = (category.category_format or '').lower().strip()
         if not fmt:
             continue
 
-        format_dir = os.path.join(variable_dir, fmt)
-        if not os.path.isdir(format_dir):
-            continue
-
         for item_type in category.product_item_types.all():
             convention = item_type.file_name_convention
             if not convention:
                 continue
 
-            has_time = '{hh}' in convention
-
             try:
-                pattern = _convention_to_regex(convention)
+                _convention_to_regex(convention)
             except re.error as exc:
                 logger.error(f"[INGESTION] Invalid convention pattern '{convention}': {exc}")
                 continue
 
-            valid_for_days = item_type.valid_for_days
+            item_types_by_format.setdefault(fmt, []).append(item_type)
 
-            for dirpath, _, filenames in os.walk(format_dir):
-              for filename in filenames:
-                _, ext = os.path.splitext(filename)
-                if ext.lstrip('.').lower() != fmt:
-                    continue
+    # Matched files are grouped by target page and each page is written once at
+    # the end of the scan, instead of a read-modify-write per file.
+    pending_writes = {}
+    touched = {}
+    try:
+        for fmt, item_types in item_types_by_format.items():
+            format_dir = os.path.join(variable_dir, fmt)
+            if not os.path.isdir(format_dir):
+                continue
 
-                file_path = os.path.join(dirpath, filename)
-                # Match against the relative path from format_dir (forward slashes)
-                # so conventions like {yyyy}/prefix_{dd}-{mm}-{yyyy} work correctly.
-                rel_stem = os.path.relpath(file_path, format_dir)
-                rel_stem = os.path.splitext(rel_stem)[0].replace(os.sep, '/')
-                rel_stem = unicodedata.normalize('NFC', rel_stem)
+            is_image = fmt in IMAGE_FORMATS
 
-                match = pattern.match(rel_stem)
-                if not match:
-                    continue
-                file_mtime = os.path.getmtime(file_path)
+            for file_path, item_type, match in _iter_matched_files(format_dir, fmt, item_types, paths, timer):
+                has_time = '{hh}' in item_type.file_name_convention
+                valid_for_days = item_type.valid_for_days
 
-                existing = ProductIngestedFile.objects.filter(
-                    product=product, file_path=file_path
-                ).first()
-                if existing and existing.file_mtime == file_mtime:
-                    continue
+                with timer.phase('lookup'):
+                    file_mtime = os.path.getmtime(file_path)
+
+                    ingested_mtime, ingested_hash = ingested_index.get(file_path, (None, None))
+                    if ingested_mtime == file_mtime:
+                        stats['skipped'] += 1
+                        continue
+
+                    content_hash = _file_digest(file_path)
+                    if ingested_hash and ingested_hash == content_hash:
+                        touched[file_path] = (file_mtime, content_hash)
+                        ingested_index[file_path] = (file_mtime, content_hash)
+                        stats['skipped'] += 1
+                        continue
+                stats['new' if ingested_mtime is None else 'changed'] += 1
 
                 try:
                     dt = _parse_datetime(match)
                 except (ValueError, KeyError) as exc:
-                    logger.error(f"[INGESTION] Could not parse datetime from '{filename}': {exc}")
+                    logger.error(f"[INGESTION] Could not parse datetime from '{file_path}': {exc}")
                     continue
 
-                product_item_page, _ = _get_or_create_product_item_page(
-                    product_page, product.variable_name, dt, has_time=has_time
-                )
+                if dry_run:
+                    continue
+
+                slug = _datetime_slug(product.variable_name, dt, has_time)
+                if slug not in pending_writes:
+                    with timer.phase('pages'):
+                        product_item_page, _ = _get_or_create_product_item_page(
+                            product_page, product.variable_name, dt, has_time=has_time
+                        )
+                    pending_writes[slug] = _PendingPageWrite(product_item_page)
 
                 if has_time:
                     title = f"{product.name} {dt.strftime('%Y-%m-%d %H:00')}"
@@ -292,48 +627,244 @@ def _ingest_product(product):
                     dt.date() + timedelta(days=valid_for_days - 1)
                     if valid_for_days else None
                 )
-                is_image = fmt in IMAGE_FORMATS
 
-                if is_image:
-                    media_obj = _create_wagtail_image(file_path, title)
-                    _append_image_block(product_item_page, item_type.pk, dt.date(), media_obj.pk, valid_until)
-                else:
-                    media_obj = _create_wagtail_document(file_path, title)
-                    _append_document_block(product_item_page, item_type.pk, dt.date(), media_obj, valid_until)
-                _sync_page_valid_until(product_item_page)
+                with timer.phase('media'):
+                    if is_image:
+                        media_obj = _create_wagtail_image(file_path, title)
+                    else:
+                        media_obj = _create_wagtail_document(file_path, title)
+
+                pending_writes[slug].add(is_image, item_type.pk, dt.date(), media_obj, valid_until,
+                                         file_path, file_mtime, content_hash)
+                ingested_index[file_path] = (file_mtime, content_hash)
+    finally:
+        if not dry_run:
+            with timer.phase('pages'):
+                for pending in pending_writes.values():
+                    _write_page_products(product, pending)
+                _record_touched_files(product, touched)
+
+    logger.info(
+        f"[INGESTION] Product '{product.name}': {stats['new']} new, "
+        f"{stats['changed']} changed, {stats['skipped']} unchanged file(s) "
+        f"in {timer.total:.2f}s."
+    )
+    return stats
+
+
+# how long one task may hold, and another wait for, the lock on ingesting a product
+_PRODUCT_INGESTION_LOCK_TIMEOUT = 60 * 60
+_PRODUCT_INGESTION_LOCK_WAIT = 10 * 60
+
+
+def _get_product_ingestion_lock(product_id):
+    from django.core.cache import cache
+
+    return cache.lock(f"product-ingestion-lock:{product_id}", timeout=_PRODUCT_INGESTION_LOCK_TIMEOUT,
+                      blocking_timeout=_PRODUCT_INGESTION_LOCK_WAIT)
+
+
+@contextmanager
+def _product_ingestion_lock(product_id):
+    """
+    Ingest a product in one task at a time, whether it was started by the full
+    scan or by the watcher with a batch of paths.
+    """
+    with _get_product_ingestion_lock(product_id):
+        yield
 
-                ProductIngestedFile.objects.update_or_create(
-                    product=product,
-                    file_path=file_path,
-                    defaults={
-                        'file_mtime': file_mtime,
-                        'product_item_page': product_item_page,
-                    },
-                )
-                logger.info(f"[INGESTION] Ingested: {file_path} → page '{product_item_page.slug}'")
+
+# how long a worker may hold the lock on generating one rendition
+_RENDITION_LOCK_TIMEOUT = 5 * 60
+
+
+def _warm_rendition(image, filter_spec):
+    """
+    Generate a rendition unless another worker is already generating it.
+    The cache lock keeps concurrent warm-ups of the same image from doing the work twice.
+    """
+    from django.core.cache import cache
+
+    lock_key = f"rendition-warm-lock:{image.pk}:{filter_spec}"
+    if not cache.add(lock_key, True, timeout=_RENDITION_LOCK_TIMEOUT):
+        return False
+
+    try:
+        image.get_rendition(filter_spec)
+        return True
+    except Exception as exc:
+        logger.warning(f"[RENDITIONS] Could not generate '{filter_spec}' for image {image.pk}: {exc}")
+        return False
+    finally:
+        cache.delete(lock_key)
+
+
+@app.task(base=Singleton, bind=True)
+def warm_product_item_renditions(self, page_id):
+    """
+    Generate the renditions used to display a ProductItemPage, so the first
+    visitors after it is published do not all generate them at once: the product
+    images on the page, the listing thumbnail on the product page and the meta image.
+    """
+    from django.conf import settings
+    from climweb.pages.products.models import ProductItemPage
+
+    page = ProductItemPage.objects.live().filter(pk=page_id).first()
+    if not page:
+        return 0
+
+    warmed = 0
+    images = {}
+    for block in page.products:
+        if block.block_type == 'image_product':
+            image = block.value.get('image')
+        elif block.block_type == 'document_product':
+            image = block.value.document_thumbnail
+        else:
+            continue
+        if image:
+            images[image.pk] = image
+
+    for image in images.values():
+        for filter_spec in settings.PRODUCT_WARM_RENDITION_SPECS:
+            warmed += _warm_rendition(image, filter_spec)
+
+    listing_image = page.products_listing_image
+    if listing_image:
+        warmed += _warm_rendition(listing_image, 'original')
+
+    try:
+        # the meta image falls back to the parent pages, which wagtail-metadata
+        # renders with its own filter
+        if page.get_meta_image_rendition():
+            warmed += 1
+    except Exception as exc:
+        logger.warning(f"[RENDITIONS] Could not generate meta image for page {page_id}: {exc}")
+
+    logger.info(f"[RENDITIONS] Warmed {warmed} rendition(s) for page '{page.slug}'")
+    return warmed
+
+
+@app.task(bind=True)
+def ingest_single_product(self, product_id, paths=None):
+    """
+    Scan the watch folders of one product and publish new files, or only the
+    given changed paths, as reported by the watcher.
+
+    Each product is ingested under its own lock, so different products ingest
+    in parallel on separate workers. This is not a Singleton task, as the full
+    scan waits on these tasks in a chord, and a Singleton duplicate would hand
+    back another task's result the chord never counts.
+    """
+    from climweb.base.models import Product
+
+    product = Product.objects.filter(pk=product_id, ingestion_enabled=True).first()
+    if not product:
+        return None
+
+    if paths is not None:
+        paths = [os.path.abspath(path) for path in paths]
+        logger.info(f"[INGESTION] Processing {len(paths)} changed file(s) for product '{product.name}'.")
+
+    try:
+        with _product_ingestion_lock(product_id):
+            stats = _ingest_product(product, paths=paths)
+    except Exception as exc:
+        logger.exception(f"[INGESTION] Error processing product '{product.name}': {exc}")
+        raise  # re-raise so Celery records the failure
+
+    return {'product': product.name, **stats}
+
+
+@app.task
+def collect_product_ingestion_results(results):
+    """Log one summary for a scan, once the chord of per-product ingestion tasks is done."""
+    totals = {'skipped': 0, 'changed': 0, 'new': 0}
+    for stats in results:
+        if not stats:
+            continue
+        for key in totals:
+            totals[key] += stats.get(key, 0)
+
+    logger.info(
+        f"[INGESTION] Scan complete for {len(results)} product(s): {totals['new']} new, "
+        f"{totals['changed']} changed, {totals['skipped']} unchanged file(s)."
+    )
+    return {**totals, 'products': len(results)}
+
+
+@app.task
+def log_failed_product_ingestion_scan(request, exc, traceback):
+    """Errback of the scan chord, which skips the summary when a product failed."""
+    logger.error(f"[INGESTION] Scan incomplete, at least one product failed: {exc}")
 
 
 @app.task(base=Singleton, bind=True)
 def ingest_product_files(self):
-    """Scan watch folders for all ingestion-enabled products and publish new files."""
+    """
+    Dispatch one ingestion task per ingestion-enabled product in a chord, so one
+    slow product does not hold up the rest, and log a single summary once all of
+    them are done.
+    """
     from climweb.base.models import Product
 
-    products = Product.objects.filter(ingestion_enabled=True)
-    logger.info(f"[INGESTION] Starting scan for {products.count()} enabled product(s).")
+    product_ids = list(Product.objects.filter(ingestion_enabled=True).values_list('pk', flat=True))
 
-    for product in products:
-        try:
-            _ingest_product(product)
-        except Exception as exc:
-            logger.exception(f"[INGESTION] Error processing product '{product.name}': {exc}")
+    # a product still being ingested, by a previous scan or the watcher, is
+    # scanned again next time rather than queued behind the lock
+    busy = [product_id for product_id in product_ids if _get_product_ingestion_lock(product_id).locked()]
+    product_ids = [product_id for product_id in product_ids if product_id not in busy]
+    logger.info(f"[INGESTION] Starting scan for {len(product_ids)} enabled product(s), "
+                f"{len(busy)} already being ingested.")
+
+    if not product_ids:
+        return None
+
+    summary = collect_product_ingestion_results.s().on_error(log_failed_product_ingestion_scan.s())
+    return chord(ingest_single_product.s(product_id) for product_id in product_ids)(summary).id
 
-    logger.info("[INGESTION] Scan complete.")
+
+# the full scan is registered under a different name whether the watcher is
+# enabled or not
+_RECONCILE_TASK_NAME = 'ingest-product-files-reconcile'
+_SCAN_TASK_NAME = 'ingest-product-files-every-5-minutes'
 
 
 @app.on_after_finalize.connect
 def setup_product_ingestion_tasks(sender, **kwargs):
-    sender.add_periodic_task(
-        60 * 5,  # every 15 minutes
-        ingest_product_files.s(),
-        name='ingest-product-files-every-5-minutes',
-    )
+    from django.conf import settings
+
+    if settings.PRODUCT_INGESTION_WATCHER_ENABLED:
+        # The watch_product_files command picks up new files as they land, so the
+        # full scan only needs to run now and then to reconcile anything it missed
+        # (e.g. files written while the watcher was down).
+        sender.add_periodic_task(
+            settings.PRODUCT_INGESTION_RECONCILE_INTERVAL,
+            ingest_product_files.s(),
+            name=_RECONCILE_TASK_NAME,
+        )
+    else:
+        sender.add_periodic_task(
+            60 * 5,  # every 5 minutes
+            ingest_product_files.s(),
+            name=_SCAN_TASK_NAME,
+        )
+
+
+@beat_init.connect
+def disable_replaced_product_ingestion_task(sender, **kwargs):
+    """
+    The DatabaseScheduler keeps the rows of periodic tasks that are no longer
+    declared, so disable the scan registered under the other name, or both would run.
+    """
+    from django.conf import settings
+    from django_celery_beat.models import PeriodicTask, PeriodicTasks
+
+    if settings.PRODUCT_INGESTION_WATCHER_ENABLED:
+        replaced = _SCAN_TASK_NAME
+    else:
+        replaced = _RECONCILE_TASK_NAME
+
+    if PeriodicTask.objects.filter(name=replaced, enabled=True).update(enabled=False):
+        PeriodicTasks.update_changed()
+        logger.info(f"[INGESTION] Disabled the replaced periodic task '{replaced}'.")
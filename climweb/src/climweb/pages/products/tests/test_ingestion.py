@@ -0,0 +1,286 @@
+import hashlib
+import os
+import queue
+import tempfile
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from climweb.base.models import CustomDocumentModel, Product, ProductCategory, ProductItemType
+from climweb.pages.home.tests.factories import get_or_create_homepage
+from .. import tasks
+from ..models import ProductIngestedFile
+from ..tasks import (
+    IngestionTimer,
+    _append_image_block,
+    _combined_convention_regex,
+    _compute_valid_until,
+    _convention_to_regex,
+    _file_digest,
+    _ingest_product,
+    _iter_format_dir_files,
+    _iter_matched_files,
+    _place_file_in_storage,
+)
+from ..management.commands.benchmark_product_ingestion import generate_synthetic_tree
+from ..watcher import PollingBackend, ProductFileWatcher
+from .factories import ProductIndexPageFactory, ProductPageFactory
+
+
+def touch(*parts):
+    path = os.path.join(*parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("x")
+    return path
+
+
+class TestIterFormatDirFiles(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.format_dir = os.path.join(self.tmp.name, "rainfall", "png")
+        self.first = touch(self.format_dir, "2024", "rain_2024_01_01.png")
+        self.second = touch(self.format_dir, "rain_2024_01_02.png")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_full_walk_without_paths(self):
+        files = sorted(_iter_format_dir_files(self.format_dir))
+
+        self.assertEqual(files, sorted([self.first, self.second]))
+
+    def test_only_given_paths_under_format_dir(self):
+        outside = touch(self.tmp.name, "rainfall", "pdf", "rain_2024_01_01.pdf")
+        missing = os.path.join(self.format_dir, "rain_2024_01_03.png")
+
+        files = list(_iter_format_dir_files(self.format_dir, [self.second, outside, missing]))
+
+        self.assertEqual(files, [self.second])
+
+
+class TestCombinedConventionRegex(SimpleTestCase):
+    conventions = (
+        "rain_{yyyy}_{mm}_{dd}",
+        "{yyyy}/Bulletin_{dd}-{mm}-{yyyy}",
+        "rain_{yyyy}_{mm}_{dd}_{hh}",
+    )
+
+    def test_reports_matching_convention(self):
+        matcher = _combined_convention_regex(self.conventions)
+
+        self.assertEqual(matcher.match("rain_2024_01_02").lastgroup, "_c0")
+        self.assertEqual(matcher.match("2024/Bulletin_02-01-2024").lastgroup, "_c1")
+        self.assertEqual(matcher.match("rain_2024_01_02_06").lastgroup, "_c2")
+
+    def test_repeated_variables_must_agree(self):
+        matcher = _combined_convention_regex(self.conventions)
+
+        self.assertIsNone(matcher.match("2023/Bulletin_02-01-2024"))
+
+    def test_compiled_patterns_are_cached(self):
+        self.assertIs(_convention_to_regex("rain_{yyyy}"), _convention_to_regex("rain_{yyyy}"))
+
+
+class TestIterMatchedFiles(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_synthetic_tree_and_counts_files(self):
+        convention = "{yyyy}/rain_{yyyy}_{mm}_{dd}"
+        generate_synthetic_tree(self.tmp.name, convention, "png", 30)
+        touch(self.tmp.name, "notes.txt")
+        item_type = SimpleNamespace(pk=1, file_name_convention=convention, valid_for_days=None)
+        timer = IngestionTimer()
+
+        matched = list(_iter_matched_files(self.tmp.name, "png", [item_type], timer=timer))
+
+        self.assertEqual(len(matched), 30)
+        self.assertEqual(timer.files, 31)
+        self.assertEqual(timer.matched, 30)
+        self.assertTrue(all(found_type is item_type for _, found_type, _ in matched))
+
+
+class TestRawBlockBatching(SimpleTestCase):
+    def test_appends_many_blocks_in_memory_without_duplicates(self):
+        raw = []
+
+        self.assertTrue(_append_image_block(raw, 1, date(2024, 1, 1), 10, date(2024, 1, 1)))
+        self.assertTrue(_append_image_block(raw, 2, date(2024, 1, 1), 11, date(2024, 1, 7)))
+        self.assertFalse(_append_image_block(raw, 1, date(2024, 1, 1), 12))
+
+        self.assertEqual([block["value"]["image"] for block in raw], [10, 11])
+        self.assertEqual(_compute_valid_until(raw), date(2024, 1, 7))
+
+    def test_valid_until_ignores_blank_and_invalid_dates(self):
+        raw = [
+            {"type": "image_product", "value": {"valid_until": None}},
+            {"type": "image_product", "value": {"valid_until": "not-a-date"}},
+        ]
+
+        self.assertIsNone(_compute_valid_until(raw))
+
+
+class TestFileDigest(SimpleTestCase):
+    def test_chunked_digest_matches_whole_file_digest(self):
+        with tempfile.NamedTemporaryFile() as f:
+            content = os.urandom(3000)
+            f.write(content)
+            f.flush()
+
+            self.assertEqual(_file_digest(f.name, chunk_size=1024), hashlib.sha256(content).hexdigest())
+
+
+@override_settings(PRODUCT_INGESTION_FILE_PLACEMENT="copy")
+class TestIngestProductDeduplication(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media_root = override_settings(MEDIA_ROOT=os.path.join(self.tmp.name, "media"))
+        media_root.enable()
+        self.addCleanup(media_root.disable)
+
+        self.product = Product.objects.create(name="Rainfall", variable_name="rainfall", ingestion_enabled=True,
+                                              watch_root=os.path.join(self.tmp.name, "watch"))
+        category = ProductCategory.objects.create(product=self.product, name="Bulletins", category_format="pdf")
+        ProductItemType.objects.create(category=category, name="Bulletin", file_name_convention="rain_{yyyy}_{mm}_{dd}")
+
+        index_page = ProductIndexPageFactory(parent=get_or_create_homepage())
+        ProductPageFactory(parent=index_page, product=self.product)
+
+        self.file_path = touch(self.tmp.name, "watch", "rainfall", "pdf", "rain_2024_01_01.pdf")
+        self.assertEqual(_ingest_product(self.product)["new"], 1)
+
+    def set_mtime_later(self):
+        later = time.time() + 60
+        os.utime(self.file_path, (later, later))
+
+    def test_touched_file_is_not_uploaded_again(self):
+        self.set_mtime_later()
+
+        stats = _ingest_product(self.product)
+
+        self.assertEqual(stats, {"skipped": 1, "changed": 0, "new": 0})
+        self.assertEqual(CustomDocumentModel.objects.count(), 1)
+
+        # the new mtime is recorded, so the next scan skips the file without hashing it
+        with mock.patch.object(tasks, "_file_digest") as file_digest:
+            self.assertEqual(_ingest_product(self.product)["skipped"], 1)
+        file_digest.assert_not_called()
+
+    def test_changed_file_is_uploaded_again(self):
+        with open(self.file_path, "w") as f:
+            f.write("changed")
+        self.set_mtime_later()
+
+        stats = _ingest_product(self.product)
+
+        self.assertEqual(stats, {"skipped": 0, "changed": 1, "new": 0})
+        self.assertEqual(CustomDocumentModel.objects.count(), 2)
+        self.assertEqual(ProductIngestedFile.objects.get(file_path=self.file_path).content_hash,
+                         hashlib.sha256(b"changed").hexdigest())
+
+
+class FakeField:
+    max_length = 100
+
+    def generate_filename(self, instance, filename):
+        return f"documents/{filename}"
+
+
+class FakeFieldFile:
+    def __init__(self, storage):
+        self.storage = storage
+        self.field = FakeField()
+        self.instance = None
+
+
+class TestPlaceFileInStorage(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.field_file = FakeFieldFile(FileSystemStorage(location=os.path.join(self.tmp.name, "media")))
+        os.makedirs(self.field_file.storage.location)
+        self.source = touch(self.tmp.name, "watch", "bulletin.pdf")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_link_keeps_source_and_shares_inode(self):
+        name = _place_file_in_storage(self.field_file, self.source, "link")
+
+        self.assertEqual(name, "documents/bulletin.pdf")
+        self.assertTrue(os.path.exists(self.source))
+        self.assertTrue(os.path.samefile(self.source, self.field_file.storage.path(name)))
+
+    def test_existing_name_is_not_overwritten(self):
+        first = _place_file_in_storage(self.field_file, self.source, "link")
+        second = _place_file_in_storage(self.field_file, self.source, "link")
+
+        self.assertNotEqual(first, second)
+
+    def test_move_removes_source(self):
+        name = _place_file_in_storage(self.field_file, self.source, "move")
+
+        self.assertFalse(os.path.exists(self.source))
+        self.assertTrue(self.field_file.storage.exists(name))
+
+
+class TestPollingBackend(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.events = queue.Queue()
+        touch(self.tmp.name, "png", "existing.png")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def drain(self):
+        paths = []
+        while not self.events.empty():
+            paths.append(self.events.get())
+        return paths
+
+    def test_reports_only_new_files(self):
+        backend = PollingBackend(self.events, interval=0)
+        backend.start([self.tmp.name])
+        self.assertEqual(self.drain(), [])
+
+        new_file = touch(self.tmp.name, "png", "2024", "new.png")
+        backend.poll()
+
+        self.assertEqual(self.drain(), [new_file])
+
+
+class DeadBackend:
+    def __init__(self):
+        self.starts = 0
+
+    def is_alive(self):
+        return False
+
+    def start(self, directories):
+        self.starts += 1
+
+    def stop(self):
+        pass
+
+
+class TestProductFileWatcherBackend(SimpleTestCase):
+    def test_dead_backend_is_restarted_then_replaced_by_polling(self):
+        watcher = ProductFileWatcher(force_polling=True)
+        watcher.backend = backend = DeadBackend()
+
+        for _ in range(ProductFileWatcher.MAX_BACKEND_RESTARTS):
+            watcher._check_backend()
+        self.assertIs(watcher.backend, backend)
+        self.assertEqual(backend.starts, ProductFileWatcher.MAX_BACKEND_RESTARTS)
+
+        watcher._check_backend()
+        self.assertIsInstance(watcher.backend, PollingBackend)
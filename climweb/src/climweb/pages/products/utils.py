@@ -0,0 +1,83 @@
+from django.core.cache import cache
+
+from climweb.base.cache import bump_cache_version, get_cache_version
+
+PRODUCT_ITEM_TYPES_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _item_types_version_key(product_id):
+    return f"products:item_types_version:{product_id}"
+
+
+def get_product_item_types_version(product_id):
+    return get_cache_version(_item_types_version_key(product_id))
+
+
+def bump_product_item_types_version(product_id):
+    """Invalidate the cached item types of a product, e.g. after its snippet is saved"""
+    return bump_cache_version(_item_types_version_key(product_id))
+
+
+def _get_product_item_types(product_id):
+    """Return {item type id: ProductItemType} for a product, with categories loaded"""
+    from climweb.base.models import ProductItemType
+
+    version = get_product_item_types_version(product_id)
+    cache_key = f"products:item_types:{product_id}:{version}"
+
+    item_types = cache.get(cache_key)
+    if item_types is None:
+        queryset = ProductItemType.objects.filter(category__product_id=product_id).select_related("category")
+        item_types = {item_type.pk: item_type for item_type in queryset}
+        cache.set(cache_key, item_types, timeout=PRODUCT_ITEM_TYPES_CACHE_TIMEOUT)
+
+    return item_types
+
+
+class ProductItemTypeResolver:
+    """
+    Resolve the ProductItemType ids stored in product blocks and map layers.
+
+    Every item type of the product is loaded with its category in one query and
+    cached per product, so rendering a page with many products does not query
+    each item type and category separately.
+    """
+
+    def __init__(self, product_id):
+        self.product_id = product_id
+        self.item_types = dict(_get_product_item_types(product_id)) if product_id else {}
+
+    def get(self, item_type_id):
+        try:
+            item_type_id = int(item_type_id)
+        except (TypeError, ValueError):
+            return None
+
+        if item_type_id not in self.item_types:
+            # item types of another product are rare, look them up individually
+            from climweb.base.models import ProductItemType
+            self.item_types[item_type_id] = ProductItemType.objects.select_related("category") \
+                .filter(pk=item_type_id).first()
+
+        return self.item_types[item_type_id]
+
+    def resolve_blocks(self, stream_value):
+        """Attach the resolved item type to each product block of a StreamField value"""
+        for block in stream_value:
+            if hasattr(block.value, "set_product_item_type"):
+                block.value.set_product_item_type(self.get(block.value.get("product_type")))
+
+
+def get_product_item_type_resolver(product_id, request=None):
+    """Return a resolver for the product, shared for the duration of the request if given"""
+    if request is None:
+        return ProductItemTypeResolver(product_id)
+
+    resolvers = getattr(request, "_product_item_type_resolvers", None)
+    if resolvers is None:
+        resolvers = request._product_item_type_resolvers = {}
+
+    if product_id not in resolvers:
+        resolvers[product_id] = ProductItemTypeResolver(product_id)
+
+    return resolvers[product_id]
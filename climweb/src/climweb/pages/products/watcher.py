@@ -0,0 +1,269 @@
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+
+from django.db import close_old_connections
+from loguru import logger
+
+
+class InotifyBackend:
+    """
+    Report changed files using inotifywait (from inotify-tools, installed in the
+    Docker image). Only files that have been fully written (close_write) or moved
+    into place (moved_to) are reported, so half-copied files are never picked up.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.process = None
+        self.reader = None
+        self.directories = []
+
+    @staticmethod
+    def is_available():
+        return shutil.which("inotifywait") is not None
+
+    def start(self, directories):
+        self.stop()
+        self.directories = list(directories)
+        if not directories:
+            return
+
+        self.process = subprocess.Popen(
+            ["inotifywait", "-m", "-r", "-q",
+             "-e", "close_write", "-e", "moved_to",
+             "--format", "%w%f", *directories],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.reader = threading.Thread(target=self._read, args=(self.process,), daemon=True)
+        self.reader.start()
+
+    def _read(self, process):
+        for line in process.stdout:
+            path = line.rstrip("\n")
+            if path:
+                self.events.put(path)
+
+    def poll(self):
+        # events are pushed by the reader thread
+        pass
+
+    def is_alive(self):
+        # inotifywait exits when it hits the watch limit, or a watched folder is
+        # removed or unmounted, and reports nothing from then on
+        return self.process is None or self.process.poll() is None
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+class PollingBackend:
+    """
+    Fallback for filesystems where inotify is not available (e.g. network mounts).
+
+    Only directories are stat'd on each poll. Adding, removing or renaming a file
+    changes its parent directory's mtime, so only those directories are listed.
+    Files modified in place are left to the periodic reconciliation scan.
+    """
+
+    def __init__(self, events, interval=10):
+        self.events = events
+        self.interval = interval
+        self.directories = []
+        self.dir_mtimes = {}
+        self.dir_files = {}
+        self.last_poll = 0
+
+    def start(self, directories):
+        self.directories = list(directories)
+        self.dir_mtimes = {}
+        self.dir_files = {}
+        # take an initial snapshot without reporting anything
+        self._scan(report=False)
+        self.last_poll = time.monotonic()
+
+    def poll(self):
+        if time.monotonic() - self.last_poll < self.interval:
+            return
+        self._scan(report=True)
+        self.last_poll = time.monotonic()
+
+    def _iter_dirs(self, root):
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                mtime = os.stat(current).st_mtime
+                with os.scandir(current) as entries:
+                    subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+            except OSError:
+                continue
+            yield current, mtime
+            stack.extend(subdirs)
+
+    def _scan(self, report):
+        seen = set()
+        for root in self.directories:
+            for directory, mtime in self._iter_dirs(root):
+                seen.add(directory)
+                if self.dir_mtimes.get(directory) == mtime:
+                    continue
+                self.dir_mtimes[directory] = mtime
+
+                try:
+                    with os.scandir(directory) as entries:
+                        files = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    continue
+
+                if report:
+                    for name in files - self.dir_files.get(directory, set()):
+                        self.events.put(os.path.join(directory, name))
+                self.dir_files[directory] = files
+
+        for directory in set(self.dir_mtimes) - seen:
+            self.dir_mtimes.pop(directory, None)
+            self.dir_files.pop(directory, None)
+
+    def is_alive(self):
+        return True
+
+    def stop(self):
+        pass
+
+
+class ProductFileWatcher:
+    """
+    Watch the folders of every ingestion-enabled Product and feed the files that
+    change into the same matching and publishing logic used by the periodic scan.
+
+    Events are debounced so a batch of files copied together is ingested in one go,
+    and the list of watched products is refreshed periodically to pick up changes
+    made in the admin.
+    """
+
+    # inotifywait is restarted when it exits, unless it keeps exiting, in which
+    # case the watcher falls back to polling
+    MAX_BACKEND_RESTARTS = 5
+    BACKEND_RESTART_WINDOW = 10 * 60
+
+    def __init__(self, debounce=2.0, refresh_interval=60, poll_interval=10, force_polling=False):
+        self.debounce = debounce
+        self.max_delay = debounce * 10
+        self.refresh_interval = refresh_interval
+        self.poll_interval = poll_interval
+        self.events = queue.Queue()
+        self.backend_restarts = []
+
+        if not force_polling and InotifyBackend.is_available():
+            self.backend = InotifyBackend(self.events)
+        else:
+            if not force_polling:
+                logger.warning("[INGESTION] inotifywait not found, falling back to polling for product files.")
+            self.backend = PollingBackend(self.events, interval=poll_interval)
+
+        self.watched = {}
+
+    def _load_watched_dirs(self):
+        from climweb.base.models import Product
+        from climweb.pages.products.tasks import _product_variable_dir
+
+        watched = {}
+        for product in Product.objects.filter(ingestion_enabled=True):
+            if not product.watch_root or not product.variable_name:
+                continue
+            variable_dir = os.path.abspath(_product_variable_dir(product))
+            if os.path.isdir(variable_dir):
+                watched[variable_dir] = product
+        return watched
+
+    def _refresh(self):
+        watched = self._load_watched_dirs()
+        if set(watched) != set(self.watched):
+            logger.info(f"[INGESTION] Watching {len(watched)} product folder(s) for new files.")
+            self.backend.start(sorted(watched))
+        self.watched = watched
+
+    def _check_backend(self):
+        if self.backend.is_alive():
+            return
+
+        now = time.monotonic()
+        self.backend_restarts = [t for t in self.backend_restarts if now - t < self.BACKEND_RESTART_WINDOW]
+        self.backend_restarts.append(now)
+
+        if len(self.backend_restarts) > self.MAX_BACKEND_RESTARTS:
+            logger.warning("[INGESTION] inotifywait keeps exiting, falling back to polling for product files.")
+            self.backend.stop()
+            self.backend = PollingBackend(self.events, interval=self.poll_interval)
+        else:
+            logger.warning("[INGESTION] inotifywait exited, restarting it.")
+
+        # files written while it was down are picked up by the reconciliation scan
+        self.backend.start(sorted(self.watched))
+
+    def _product_for_path(self, path):
+        for variable_dir, product in self.watched.items():
+            if path.startswith(os.path.join(variable_dir, "")):
+                return product
+        return None
+
+    def _flush(self, pending):
+        from climweb.pages.products.tasks import ingest_single_product
+
+        by_product = {}
+        for path in pending:
+            product = self._product_for_path(path)
+            if product is not None:
+                by_product.setdefault(product.pk, (product, []))[1].append(path)
+
+        for product, paths in by_product.values():
+            # ingested by a worker, under the same per-product lock as the periodic scan
+            try:
+                ingest_single_product.delay(product.pk, sorted(paths))
+            except Exception as exc:
+                logger.exception(f"[INGESTION] Could not queue changed files of product '{product.name}': {exc}")
+
+    def run(self):
+        self._refresh()
+        last_refresh = time.monotonic()
+        pending = set()
+        first_event = last_event = None
+
+        try:
+            while True:
+                self._check_backend()
+                self.backend.poll()
+                try:
+                    pending.add(os.path.abspath(self.events.get(timeout=0.5)))
+                    last_event = time.monotonic()
+                    if first_event is None:
+                        first_event = last_event
+                except queue.Empty:
+                    pass
+
+                now = time.monotonic()
+                # flush once the folder has been quiet for a moment, but don't let a
+                # steady stream of files hold back ingestion indefinitely
+                if pending and (now - last_event >= self.debounce or now - first_event >= self.max_delay):
+                    close_old_connections()
+                    self._flush(pending)
+                    pending = set()
+                    first_event = last_event = None
+
+                if now - last_refresh >= self.refresh_interval:
+                    close_old_connections()
+                    self._refresh()
+                    last_refresh = now
+        finally:
+            self.backend.stop()
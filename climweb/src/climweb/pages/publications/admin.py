@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import PageView
+from .models import PageView, PageViewDaily
 
 
 @admin.register(PageView)
@@ -11,3 +11,13 @@ class PageViewAdmin(admin.ModelAdmin):
     
     def has_add_permission(self, request):
         return False  # Prevent manual creation of page views
+
+
+@admin.register(PageViewDaily)
+class PageViewDailyAdmin(admin.ModelAdmin):
+    list_display = ['content_type', 'object_id', 'day', 'views', 'unique_sessions', 'unique_visitors']
+    list_filter = ['content_type', 'day']
+    readonly_fields = ['content_type', 'object_id', 'day', 'views', 'unique_sessions', 'unique_visitors']
+
+    def has_add_permission(self, request):
+        return False  # Maintained by the rollup_page_views task
@@ -0,0 +1,244 @@
+import hashlib
+import hmac
+import json
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_redis import get_redis_connection
+from loguru import logger
+
+PAGE_VIEWS_BUFFER_KEY = "climweb:page_views:buffer"
+# HyperLogLog of the visitors of one object on one day
+PAGE_VIEWS_VISITORS_KEY = "climweb:page_views:visitors:{content_type_id}:{object_id}:{day}"
+
+
+def _visitors_key(content_type_id, object_id, day):
+    return PAGE_VIEWS_VISITORS_KEY.format(content_type_id=content_type_id, object_id=object_id,
+                                          day=day.isoformat())
+
+
+def _visitor_hash(ip_address, user_agent, session_key):
+    """
+    Anonymous visitor identifier, so no IP address is kept in Redis. It is keyed
+    with the SECRET_KEY, as a plain hash of an IPv4 address can be brute forced.
+    """
+    identity = f"{ip_address}|{user_agent or ''}" if ip_address else session_key
+    if not identity:
+        return None
+    return hmac.new(settings.SECRET_KEY.encode(), identity.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def _add_unique_visitor(pipe, content_type_id, object_id, ip_address, user_agent, session_key):
+    visitor = _visitor_hash(ip_address, user_agent, session_key)
+    if visitor is None:
+        return
+
+    key = _visitors_key(content_type_id, object_id, timezone.localdate())
+    pipe.pfadd(key, visitor)
+    pipe.expire(key, settings.PAGE_VIEWS_UNIQUE_VISITORS_TTL_DAYS * 24 * 60 * 60)
+
+
+def count_unique_visitor(content_type_id, object_id, ip_address=None, user_agent=None, session_key=None):
+    """Add the visitor to the daily HyperLogLog of the object, for views recorded without the buffer"""
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        _add_unique_visitor(pipe, content_type_id, object_id, ip_address, user_agent, session_key)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"[PAGE_VIEWS] Could not count unique visitor: {e}")
+
+
+def get_unique_visitors(content_object, days=1):
+    """
+    Approximate number of distinct visitors of an object over the last days
+    (including today), merged from the daily HyperLogLogs. The estimate has a
+    standard error of about 0.8% and each sketch uses at most 12 KB.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    content_type = ContentType.objects.get_for_model(content_object)
+    today = timezone.localdate()
+    keys = [_visitors_key(content_type.pk, content_object.pk, today - timedelta(days=i)) for i in range(days)]
+
+    return get_redis_connection("default").pfcount(*keys)
+
+
+def buffer_page_view(content_type_id, object_id, ip_address=None, user_agent=None, session_key=None):
+    """
+    Append a page view to the Redis buffer instead of inserting it on the request path.
+    The buffer is written to PageView in bulk by the flush_page_views task.
+
+    Returns False if Redis is unavailable, so the caller can record the view directly.
+    """
+    event = json.dumps({
+        "content_type_id": content_type_id,
+        "object_id": object_id,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "session_key": session_key,
+        "timestamp": timezone.now().isoformat(),
+    })
+
+    try:
+        redis = get_redis_connection("default")
+        pipe = redis.pipeline()
+        pipe.rpush(PAGE_VIEWS_BUFFER_KEY, event)
+        # keep only the newest events if the buffer is not being flushed
+        pipe.ltrim(PAGE_VIEWS_BUFFER_KEY, -settings.PAGE_VIEWS_BUFFER_MAX_LENGTH, -1)
+        _add_unique_visitor(pipe, content_type_id, object_id, ip_address, user_agent, session_key)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"[PAGE_VIEWS] Could not buffer page view: {e}")
+        return False
+
+    return True
+
+
+def _page_view_from_event(event):
+    from climweb.pages.publications.models import PageView
+
+    data = json.loads(event)
+    return PageView(
+        content_type_id=data["content_type_id"],
+        object_id=data["object_id"],
+        ip_address=data.get("ip_address"),
+        user_agent=data.get("user_agent"),
+        session_key=data.get("session_key"),
+        timestamp=parse_datetime(data["timestamp"]),
+    )
+
+
+def flush_buffered_page_views(batch_size=None):
+    """Move buffered page views into the PageView table, a batch at a time"""
+    from climweb.pages.publications.models import PageView
+
+    batch_size = batch_size or settings.PAGE_VIEWS_FLUSH_BATCH_SIZE
+    redis = get_redis_connection("default")
+    flushed = 0
+
+    while True:
+        # take the batch off the buffer atomically, so concurrent flushes never
+        # write the same events twice
+        pipe = redis.pipeline()
+        pipe.lrange(PAGE_VIEWS_BUFFER_KEY, 0, batch_size - 1)
+        pipe.ltrim(PAGE_VIEWS_BUFFER_KEY, batch_size, -1)
+        events, _ = pipe.execute()
+
+        if not events:
+            break
+
+        try:
+            PageView.objects.bulk_create([_page_view_from_event(event) for event in events])
+        except Exception:
+            # put the events back so they are retried on the next flush
+            redis.rpush(PAGE_VIEWS_BUFFER_KEY, *events)
+            raise
+
+        flushed += len(events)
+        if len(events) < batch_size:
+            break
+
+    return flushed
+
+
+def _day_bounds(day):
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def _count_unique_visitors(day, totals):
+    """Read the HyperLogLog counts of one day for each rollup row, or None if Redis is unavailable"""
+    try:
+        pipe = get_redis_connection("default").pipeline()
+        for row in totals:
+            pipe.pfcount(_visitors_key(row["content_type_id"], row["object_id"], day))
+        return pipe.execute()
+    except Exception as e:
+        logger.warning(f"[PAGE_VIEWS] Could not read unique visitor counts for {day}: {e}")
+        return None
+
+
+def rollup_page_views():
+    """
+    Update PageViewDaily from the PageView rows added since the last rollup, then
+    prune raw rows older than PAGE_VIEWS_RETENTION_DAYS that have been rolled up.
+
+    Days are recomputed in full from the raw rows rather than incremented, so
+    running a rollup twice never double counts, and unique sessions stay exact.
+    Today and yesterday are always recomputed to pick up views that were
+    committed out of id order.
+    """
+    from climweb.pages.publications.models import PageView, PageViewDaily
+
+    max_id = PageView.objects.aggregate(max_id=Max("id"))["max_id"]
+    if max_id is None:
+        return 0
+
+    # the last PageView already rolled up, stored with the rollups themselves
+    watermark = PageViewDaily.objects.aggregate(watermark=Max("last_view_id"))["watermark"]
+    new_views = PageView.objects.filter(id__lte=max_id)
+    if watermark is not None:
+        new_views = new_views.filter(id__gt=watermark)
+
+    today = timezone.localdate()
+    days = set(new_views.annotate(day=TruncDate("timestamp")).values_list("day", flat=True).distinct())
+    days.update({today, today - timedelta(days=1)})
+
+    rolled_up = 0
+    for day in sorted(days):
+        start, end = _day_bounds(day)
+        totals = list(PageView.objects.filter(timestamp__gte=start, timestamp__lt=end, id__lte=max_id)
+                      .values("content_type_id", "object_id")
+                      .annotate(views=Count("id"), unique_sessions=Count("session_key", distinct=True)))
+
+        update_fields = ["views", "unique_sessions"]
+        # the sketches of older days have expired, keep the count stored for them
+        if day > today - timedelta(days=settings.PAGE_VIEWS_UNIQUE_VISITORS_TTL_DAYS):
+            unique_visitors = _count_unique_visitors(day, totals)
+            if unique_visitors is not None:
+                for row, count in zip(totals, unique_visitors):
+                    row["unique_visitors"] = count
+                update_fields.append("unique_visitors")
+
+        PageViewDaily.objects.bulk_create(
+            [PageViewDaily(day=day, last_view_id=max_id, **row) for row in totals],
+            update_conflicts=True,
+            unique_fields=["content_type", "object_id", "day"],
+            update_fields=update_fields + ["last_view_id"],
+        )
+        rolled_up += len(totals)
+
+    # never prune today and yesterday, which are recomputed from raw rows on every run
+    retention_days = settings.PAGE_VIEWS_RETENTION_DAYS
+    if retention_days:
+        cutoff, _ = _day_bounds(today - timedelta(days=max(retention_days, 2)))
+        pruned, _ = PageView.objects.filter(timestamp__lt=cutoff, id__lte=max_id).delete()
+        if pruned:
+            logger.info(f"[PAGE_VIEWS] Pruned {pruned} raw page view(s) older than {retention_days} day(s)")
+
+    return rolled_up
+
+
+def get_view_count(content_object):
+    """
+    Total views of an object. Days before yesterday are read from the daily
+    rollups, while today and yesterday, which the rollup keeps recomputing, are
+    counted from the raw views so the total is always current.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from climweb.pages.publications.models import PageView, PageViewDaily
+
+    content_type = ContentType.objects.get_for_model(content_object)
+    yesterday = timezone.localdate() - timedelta(days=1)
+    since, _ = _day_bounds(yesterday)
+
+    rolled_up = PageViewDaily.objects.filter(content_type=content_type, object_id=content_object.pk,
+                                             day__lt=yesterday).aggregate(total=Sum("views"))["total"] or 0
+    recent = PageView.objects.filter(content_type=content_type, object_id=content_object.pk,
+                                     timestamp__gte=since).count()
+
+    return rolled_up + recent
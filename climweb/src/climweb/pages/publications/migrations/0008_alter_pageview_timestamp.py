@@ -0,0 +1,19 @@
+# Generated by Django 5.2.16 on 2026-10-18 12:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0007_alter_publicationsindexpage_earliest_publication_year'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pageview',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='View Timestamp'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.16 on 2026-10-18 12:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('publications', '0008_alter_pageview_timestamp'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PageViewDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('day', models.DateField(verbose_name='Day')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Views')),
+                ('unique_sessions', models.PositiveIntegerField(default=0, verbose_name='Unique Sessions')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Daily Page Views',
+                'verbose_name_plural': 'Daily Page Views',
+                'indexes': [models.Index(fields=['day'], name='publication_day_4f0b5e_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'day'), name='unique_page_view_daily')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0009_pageviewdaily'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pageviewdaily',
+            name='unique_visitors',
+            field=models.PositiveIntegerField(default=0, help_text='Approximate, counted with a HyperLogLog sketch', verbose_name='Unique Visitors'),
+        ),
+    ]
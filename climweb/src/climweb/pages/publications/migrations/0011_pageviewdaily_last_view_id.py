@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0010_pageviewdaily_unique_visitors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pageviewdaily',
+            name='last_view_id',
+            field=models.PositiveBigIntegerField(editable=False, null=True),
+        ),
+    ]
@@ -1,9 +1,12 @@
 from datetime import date, datetime
 
+from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
+from django.dispatch import receiver
 from django.forms.widgets import CheckboxSelectMultiple
 from django.template.defaultfilters import truncatechars
+from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -19,6 +22,7 @@ from wagtail.snippets.models import register_snippet
 from wagtailiconchooser.widgets import IconChooserWidget
 
 from climweb.base.mixins import MetadataPageMixin
+from climweb.base.models.custom import document_thumbnail_generated
 from climweb.base.models import ServiceCategory, AbstractBannerPage
 from climweb.base.utils import paginate, query_param_to_list, get_first_non_empty_p_string
 from climweb.config.settings.base import SUMMARY_RICHTEXT_FEATURES
@@ -32,7 +36,7 @@ class PageView(models.Model):
     
     ip_address = models.GenericIPAddressField(null=True, blank=True, verbose_name=_("IP Address"))
     user_agent = models.TextField(blank=True, null=True, verbose_name=_("User Agent"))
-    timestamp = models.DateTimeField(auto_now_add=True, verbose_name=_("View Timestamp"))
+    timestamp = models.DateTimeField(default=timezone.now, verbose_name=_("View Timestamp"))
     session_key = models.CharField(max_length=40, blank=True, null=True, verbose_name=_("Session Key"))
     
     class Meta:
@@ -57,6 +61,9 @@ class PageView(models.Model):
             ip_address: Manual IP address override
             user_agent: Manual user agent override  
             session_key: Manual session key override
+
+        With PAGE_VIEWS_BUFFERED, the view is queued in Redis and written later in
+        bulk by the flush_page_views task, and None is returned.
         """
         # Additional checks if request is provided
         if request:
@@ -91,6 +98,18 @@ class PageView(models.Model):
             if not session_key and hasattr(request, 'session'):
                 session_key = request.session.session_key
         
+        from climweb.pages.publications.analytics import buffer_page_view, count_unique_visitor
+
+        # the content type lookup is served from Django's in-process cache
+        content_type = ContentType.objects.get_for_model(content_object)
+
+        # buffering also counts the visitor, in the same Redis round trip
+        if settings.PAGE_VIEWS_BUFFERED and buffer_page_view(content_type.pk, content_object.pk, ip_address,
+                                                             user_agent, session_key):
+            return None
+
+        count_unique_visitor(content_type.pk, content_object.pk, ip_address, user_agent, session_key)
+
         # Create the view record
         return cls.objects.create(
             content_object=content_object,
@@ -99,6 +118,26 @@ class PageView(models.Model):
             session_key=session_key
         )
 
+    @classmethod
+    def get_unique_visitors(cls, content_object, days=1):
+        """Approximate number of distinct visitors of the given object over the last days"""
+        from climweb.pages.publications.analytics import get_unique_visitors
+
+        try:
+            return get_unique_visitors(content_object, days=days)
+        except Exception:
+            return 0
+
+    @classmethod
+    def get_view_count(cls, content_object):
+        """Total views of the given object, read from the daily rollups"""
+        from climweb.pages.publications.analytics import get_view_count
+
+        try:
+            return get_view_count(content_object)
+        except Exception:
+            return 0
+
     @classmethod
     def should_track_view(cls, request):
         """
@@ -137,6 +176,33 @@ class PageView(models.Model):
             return False
 
 
+class PageViewDaily(models.Model):
+    """Page views per object and day, rolled up from PageView by the rollup_page_views task"""
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    day = models.DateField(verbose_name=_("Day"))
+    views = models.PositiveIntegerField(default=0, verbose_name=_("Views"))
+    unique_sessions = models.PositiveIntegerField(default=0, verbose_name=_("Unique Sessions"))
+    unique_visitors = models.PositiveIntegerField(default=0, verbose_name=_("Unique Visitors"),
+                                                  help_text=_("Approximate, counted with a HyperLogLog sketch"))
+    # id of the last PageView included when the row was rolled up, the highest
+    # of which is where the next rollup starts
+    last_view_id = models.PositiveBigIntegerField(null=True, editable=False)
+
+    class Meta:
+        verbose_name = _("Daily Page Views")
+        verbose_name_plural = _("Daily Page Views")
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id', 'day'], name='unique_page_view_daily')
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"{self.views} view(s) of {self.content_type_id}:{self.object_id} on {self.day}"
+
+
 @register_snippet
 class PublicationType(models.Model):
     name = models.CharField(max_length=255, verbose_name=_("Name"))
@@ -164,6 +230,10 @@ class PublicationsIndexPage(AbstractBannerPage):
     subpage_types = ['publications.PublicationPage']
     max_count = 1
     show_in_menus_default = True
+    # snippets listed by query, whose changes purge this page from the cache
+    listed_snippet_models = (PublicationType, ServiceCategory)
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('publications.PublicationPage', 'projects.ProjectPage')
     
     earliest_publication_year = models.PositiveIntegerField(
         default=datetime.now().year,
@@ -263,6 +333,8 @@ class PublicationPage(MetadataPageMixin, Page):
     template = 'publication_page.html'
     parent_page_types = ['publications.PublicationsIndexPage']
     subpage_types = []
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('publications.PublicationPage',)
     
     publication_type = models.ForeignKey(PublicationType, on_delete=models.PROTECT, verbose_name=_("Publication Type"))
     categories = ParentalManyToManyField('base.ServiceCategory', verbose_name=_("Services related to this publication"))
@@ -352,7 +424,9 @@ class PublicationPage(MetadataPageMixin, Page):
     
     def save(self, *args, **kwargs):
         if self.document and self.auto_generate_thumbnail:
-            self.thumbnail = self.document.get_thumbnail()
+            # None until the thumbnail has been generated in the background,
+            # see update_publication_thumbnails below
+            self.thumbnail = self.document.request_thumbnail()
         
         super(PublicationPage, self).save(*args, **kwargs)
     
@@ -368,15 +442,10 @@ class PublicationPage(MetadataPageMixin, Page):
             return truncatechars(p, 160)
         return None
     
-    @property
+    @cached_property
     def view_count(self):
         """Get the total number of views for this publication"""
-        try:
-            from django.contrib.contenttypes.models import ContentType
-            content_type = ContentType.objects.get_for_model(self)
-            return PageView.objects.filter(content_type=content_type, object_id=self.pk).count()
-        except Exception:
-            return 0
+        return PageView.get_view_count(self)
     
     def record_view(self, request=None, **kwargs):
         """Record a view of this publication page"""
@@ -474,3 +543,14 @@ class PublicationPage(MetadataPageMixin, Page):
             meta_description = self.listing_summary
         
         return meta_description
+
+
+@receiver(document_thumbnail_generated)
+def update_publication_thumbnails(sender, document, thumbnail, **kwargs):
+    # publications that auto-generate their thumbnail were saved without one
+    # while it was being rendered, so fill it in now that it is ready
+    from climweb.base.cache import purge_object
+
+    PublicationPage.objects.filter(document=document, auto_generate_thumbnail=True).update(thumbnail=thumbnail)
+    # the update bypasses publishing, so purge the cached pages showing the document
+    purge_object(document)
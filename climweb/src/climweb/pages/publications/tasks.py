@@ -0,0 +1,43 @@
+from celery_singleton import Singleton
+from loguru import logger
+
+from climweb.config.celery import app
+
+
+@app.task(base=Singleton, bind=True)
+def flush_page_views(self):
+    """Write the page views buffered in Redis to the PageView table"""
+    from climweb.pages.publications.analytics import flush_buffered_page_views
+
+    flushed = flush_buffered_page_views()
+    if flushed:
+        logger.info(f"[PAGE_VIEWS] Flushed {flushed} buffered page view(s)")
+    return flushed
+
+
+@app.task(base=Singleton, bind=True)
+def rollup_page_views(self):
+    """Roll raw page views up into daily counts and prune old raw views"""
+    from climweb.pages.publications.analytics import rollup_page_views as rollup
+
+    rolled_up = rollup()
+    logger.info(f"[PAGE_VIEWS] Updated {rolled_up} daily page view count(s)")
+    return rolled_up
+
+
+@app.on_after_finalize.connect
+def setup_page_view_tasks(sender, **kwargs):
+    from django.conf import settings
+
+    # also runs when buffering has been switched off, to drain anything left over
+    sender.add_periodic_task(
+        settings.PAGE_VIEWS_FLUSH_INTERVAL,
+        flush_page_views.s(),
+        name='flush-page-views',
+    )
+
+    sender.add_periodic_task(
+        settings.PAGE_VIEWS_ROLLUP_INTERVAL,
+        rollup_page_views.s(),
+        name='rollup-page-views',
+    )
@@ -0,0 +1,167 @@
+import hashlib
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Max
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from climweb.pages.publications.analytics import (
+    buffer_page_view,
+    flush_buffered_page_views,
+    get_unique_visitors,
+    get_view_count,
+    rollup_page_views,
+)
+from climweb.pages.publications.models import PageView, PageViewDaily
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self.calls.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class FakeRedis:
+    """The handful of list and HyperLogLog commands used for page views, with exact counts"""
+
+    def __init__(self):
+        self.lists = {}
+        self.sets = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(v.encode() if isinstance(v, str) else v for v in values)
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        items = self.lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def ltrim(self, key, start, end):
+        items = self.lists.get(key, [])
+        self.lists[key] = items[start:] if end == -1 else items[start:end + 1]
+        return True
+
+    def pfadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(values)
+        return 1
+
+    def pfcount(self, *keys):
+        return len(set().union(*(self.sets.get(key, set()) for key in keys)))
+
+    def expire(self, key, seconds):
+        return True
+
+
+@override_settings(PAGE_VIEWS_BUFFER_MAX_LENGTH=3, PAGE_VIEWS_FLUSH_BATCH_SIZE=2)
+class TestPageViewBuffer(TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch("climweb.pages.publications.analytics.get_redis_connection", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_buffer_keeps_newest_views(self):
+        content_type = ContentType.objects.get_for_model(PageView)
+
+        for object_id in range(1, 6):
+            self.assertTrue(buffer_page_view(content_type.pk, object_id, "127.0.0.1", "Mozilla", None))
+
+        self.assertEqual(flush_buffered_page_views(), 3)
+        self.assertEqual(
+            sorted(PageView.objects.values_list("object_id", flat=True)),
+            [3, 4, 5],
+        )
+        # the buffer is empty once flushed
+        self.assertEqual(flush_buffered_page_views(), 0)
+
+    def test_unique_visitors(self):
+        content_type = ContentType.objects.get_for_model(PageView)
+        target = PageView(pk=1)
+
+        buffer_page_view(content_type.pk, target.pk, "10.0.0.1", "Mozilla", None)
+        buffer_page_view(content_type.pk, target.pk, "10.0.0.1", "Mozilla", None)
+        buffer_page_view(content_type.pk, target.pk, "10.0.0.2", "Mozilla", None)
+        buffer_page_view(content_type.pk, target.pk, None, None, "session")
+
+        self.assertEqual(get_unique_visitors(target), 3)
+        # no raw IP address is stored in the sketch
+        self.assertNotIn("10.0.0.1", str(self.redis.sets))
+        # nor a plain hash of it, which could be brute forced
+        plain_hash = hashlib.sha256(b"10.0.0.1|Mozilla").hexdigest()[:32]
+        self.assertNotIn(plain_hash, str(self.redis.sets))
+
+    def test_buffer_unavailable(self):
+        with mock.patch("climweb.pages.publications.analytics.get_redis_connection", side_effect=ConnectionError):
+            self.assertFalse(buffer_page_view(1, 1))
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    PAGE_VIEWS_RETENTION_DAYS=30,
+)
+class TestPageViewRollup(TestCase):
+    def setUp(self):
+        self.content_type = ContentType.objects.get_for_model(PageView)
+        self.target = PageView(pk=1)
+
+    def add_views(self, days_ago, count, session_key=None):
+        timestamp = timezone.now() - timedelta(days=days_ago)
+        PageView.objects.bulk_create([
+            PageView(content_type=self.content_type, object_id=self.target.pk, session_key=session_key,
+                     timestamp=timestamp)
+            for _ in range(count)
+        ])
+
+    def test_rollup_and_prune(self):
+        self.add_views(0, 2, session_key="a")
+        self.add_views(5, 3, session_key="b")
+        self.add_views(40, 4)
+
+        rollup_page_views()
+
+        five_days_ago = timezone.localdate() - timedelta(days=5)
+        daily = PageViewDaily.objects.get(day=five_days_ago)
+        self.assertEqual((daily.views, daily.unique_sessions), (3, 1))
+
+        # views older than the retention period are rolled up, then pruned
+        self.assertEqual(PageViewDaily.objects.filter(views=4).count(), 1)
+        self.assertEqual(PageView.objects.count(), 5)
+        self.assertEqual(get_view_count(self.target), 9)
+
+        # rolling up again does not double count
+        self.add_views(0, 1)
+        rollup_page_views()
+        self.assertEqual(get_view_count(self.target), 10)
+
+    def test_watermark_is_kept_in_the_database(self):
+        self.add_views(5, 3)
+        rollup_page_views()
+
+        watermark = PageViewDaily.objects.aggregate(watermark=Max("last_view_id"))["watermark"]
+        self.assertEqual(watermark, PageView.objects.aggregate(max_id=Max("id"))["max_id"])
+
+        # losing the cache does not make the next rollup start over: a day
+        # without new views is not recomputed
+        five_days_ago = timezone.localdate() - timedelta(days=5)
+        PageViewDaily.objects.filter(day=five_days_ago).update(views=100)
+        cache.clear()
+        self.add_views(0, 1)
+        rollup_page_views()
+
+        self.assertEqual(PageViewDaily.objects.get(day=five_days_ago).views, 100)
@@ -73,6 +73,8 @@ class ServicePage(AbstractBannerWithIntroPage):
     parent_page_types = ['services.ServiceIndexPage']
     subpage_types = ['flex_page.FlexPage', 'flexible_forms.FlexibleFormPage', ]
     show_in_menus_default = True
+    # pages listed by query, whose changes purge this page from the cache
+    listed_page_models = ('products.ProductPage', 'products.SubNationalProductPage', 'events.EventPage', 'news.NewsPage', 'publications.PublicationPage')
     
     service = models.OneToOneField(ServiceCategory, on_delete=models.PROTECT, verbose_name=_("Service"))
     
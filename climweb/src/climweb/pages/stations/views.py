@@ -13,8 +13,8 @@ from geomanager.utils.vector_utils import ogr_db_import
 from wagtail.admin import messages
 from wagtail.admin.auth import user_passes_test, user_has_any_page_permission
 from wagtail.api.v2.utils import get_full_url
-from wagtailcache.cache import clear_cache, cache_page
 
+from climweb.base.cache import cache_page, purge_all_pages
 from climweb.base.models import OrganisationSetting
 from .forms import StationsUploadForm, StationColumnsForm
 from .models import StationSettings
@@ -161,7 +161,7 @@ def load_stations(request):
             messages.success(request, _("Stations data loaded successfully"))
 
             # clear wagtail cache
-            clear_cache()
+            purge_all_pages()
 
             return redirect(reverse("preview_stations"))
         else:
@@ -209,7 +209,7 @@ def preview_stations(request):
                 stations_settings.name_column = name_column
                 stations_settings.save()
                 # clear wagtail cache
-                clear_cache()
+                purge_all_pages()
             messages.success(request, _("Stations columns updated successfully"))
 
             # redirect
@@ -270,7 +270,7 @@ def sync_stations_from_oscar(request):
         station_settings.bounds = bounds
     station_settings.save()
 
-    clear_cache()
+    purge_all_pages()
 
     messages.success(
         request,
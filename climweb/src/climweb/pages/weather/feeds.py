@@ -0,0 +1,138 @@
+"""
+The compact forecast feed of the home map.
+
+The feed lists every city once (name, slug and coordinates). It then lists
+each forecast period with one column per parameter, holding a value for each
+city in the same order. Weather conditions are listed once and referenced by
+index. The JSON is serialized and compressed once per forecast version, and
+served with validators, so browsers only download it again when it changes.
+"""
+import gzip
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from forecastmanager.forecast_settings import ForecastSetting
+from forecastmanager.models import City
+from wagtail.models import Site
+
+from climweb.base.cache import cache_get_or_set
+from .forecast_documents import CITY_FORECAST_DOCUMENT_TIMEOUT, get_city_forecast_documents, get_forecast_version
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+HOME_MAP_FORECAST_FEED_KEY = "weather:home_map_feed:{forecast_version}:{settings_version}:{date}"
+HOME_MAP_FORECAST_PAYLOAD_KEY = "weather:home_map_payload:{forecast_version}:{settings_version}:{date}"
+
+
+def _naive_isoformat(value):
+    # forecasts are listed in local time without an offset, as the home map expects
+    return timezone.localtime(value).replace(tzinfo=None).isoformat()
+
+
+def _feed_payload(site, today):
+    forecast_setting = ForecastSetting.for_site(site)
+    multi_period = forecast_setting.periods.count() > 1
+
+    cities = list(City.objects.order_by("name"))
+    documents = get_city_forecast_documents(cities)
+
+    conditions = []
+    condition_indexes = {}
+    parameters = []
+    periods = {}
+
+    for city_index, city in enumerate(cities):
+        for entry in documents[city.pk]:
+            # several periods of today only, or one period for each day from today on
+            if entry.forecast_date < today or (multi_period and entry.forecast_date != today):
+                continue
+
+            period_key = (entry.forecast_date, entry.effective_period.time)
+            period = periods.get(period_key)
+            if period is None:
+                period = periods[period_key] = {
+                    "date": entry.forecast_date,
+                    "datetime": _naive_isoformat(entry.datetime),
+                    "effective_period_time": entry.effective_period.time,
+                    "effective_period_label": entry.effective_period.label,
+                    "condition": [None] * len(cities),
+                    "values": {},
+                }
+
+            if entry.condition:
+                if entry.condition not in condition_indexes:
+                    condition_indexes[entry.condition] = len(conditions)
+                    conditions.append(entry.condition)
+                period["condition"][city_index] = condition_indexes[entry.condition]
+
+            for parameter, data_value in entry.data_values_dict.items():
+                if parameter not in period["values"]:
+                    period["values"][parameter] = [None] * len(cities)
+                    if parameter not in parameters:
+                        parameters.append(parameter)
+                period["values"][parameter][city_index] = data_value.get("value")
+
+    return {
+        "multi_period": multi_period,
+        "cities": {
+            "id": [city.pk for city in cities],
+            "name": [city.name for city in cities],
+            "slug": [city.slug for city in cities],
+            "coordinates": [city.coordinates for city in cities],
+        },
+        "conditions": {
+            "symbol": [condition.symbol for condition in conditions],
+            "label": [condition.label for condition in conditions],
+            "icon_url": [condition.icon_url for condition in conditions],
+        },
+        "parameters": parameters,
+        "periods": [periods[key] for key in sorted(periods)],
+    }
+
+
+def _feed_cache_key(key):
+    from climweb.base.site_settings_cache import get_site_settings_version
+
+    return key.format(
+        forecast_version=get_forecast_version(),
+        settings_version=get_site_settings_version(),
+        date=timezone.localdate().isoformat(),
+    )
+
+
+def build_home_map_forecast_payload():
+    site = Site.objects.filter(is_default_site=True).first()
+    return _feed_payload(site, timezone.localdate()) if site else {}
+
+
+def get_home_map_forecast_payload():
+    """The feed as a dict, for the views that serve parts of it, such as the forecast tiles"""
+    return cache_get_or_set(_feed_cache_key(HOME_MAP_FORECAST_PAYLOAD_KEY), build_home_map_forecast_payload,
+                            CITY_FORECAST_DOCUMENT_TIMEOUT)
+
+
+def build_home_map_forecast_feed():
+    """Serialize and compress the home map forecast feed"""
+    payload = get_home_map_forecast_payload()
+
+    body = json.dumps(payload, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
+    bodies = {"identity": body, "gzip": gzip.compress(body)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+
+    return {
+        "etag": hashlib.md5(body).hexdigest(),
+        "last_modified": timezone.now(),
+        "bodies": bodies,
+    }
+
+
+def get_home_map_forecast_feed():
+    """The current feed, rebuilt once per forecast version, settings version and day"""
+    return cache_get_or_set(_feed_cache_key(HOME_MAP_FORECAST_FEED_KEY), build_home_map_forecast_feed,
+                            CITY_FORECAST_DOCUMENT_TIMEOUT)
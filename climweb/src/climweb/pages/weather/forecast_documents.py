@@ -0,0 +1,172 @@
+"""
+Per-city forecast documents.
+
+Every time forecasts change, the forecasts of each city are flattened into a
+plain document (dates, periods, conditions and parameter values) and stored in
+the cache, so the weather pages and widgets render without querying
+CityForecast, its periods, conditions and data values.
+"""
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.core.cache import cache
+from django.utils import timezone
+from forecastmanager.models import City, CityForecast
+from loguru import logger
+
+from climweb.base.cache import bump_cache_version, get_cache_version
+
+FORECAST_VERSION_KEY = "weather:forecast_version"
+CITY_FORECAST_DOCUMENT_KEY = "weather:city_forecast:{city_id}"
+FORECAST_PARAMETERS_KEY = "weather:forecast_parameters:{site_id}:{version}"
+
+# forecasts are rebuilt on every change, this only bounds how long documents of
+# deleted cities, or missed rebuilds, linger
+CITY_FORECAST_DOCUMENT_TIMEOUT = 60 * 60 * 6
+
+
+class ForecastCondition(NamedTuple):
+    symbol: str
+    label: str
+    icon_url: str
+
+
+class ForecastPeriodInfo(NamedTuple):
+    label: str
+    time: object
+
+    def __str__(self):
+        return self.label
+
+
+class CityForecastEntry(NamedTuple):
+    """A city's forecast for one date and period, with the attributes the templates use"""
+    forecast_date: object
+    datetime: object
+    effective_period: ForecastPeriodInfo
+    condition: ForecastCondition
+    data_values_dict: dict
+
+
+class ForecastParameter(NamedTuple):
+    parameter: str
+    name: str
+    parameter_info: dict
+    show_on_home_widget: bool
+
+
+def get_forecast_version():
+    return get_cache_version(FORECAST_VERSION_KEY)
+
+
+def bump_forecast_version():
+    return bump_cache_version(FORECAST_VERSION_KEY)
+
+
+def _data_values_dict(city_forecast):
+    # same as CityForecast.data_values_dict, but tolerates values that do not
+    # parse as their parameter type, so one bad value cannot fail the build
+    data_values = {}
+    for data_value in city_forecast.data_values.all():
+        parameter = data_value.parameter
+        try:
+            value, value_with_units = data_value.parsed_value, data_value.value_with_units
+        except (TypeError, ValueError):
+            value = value_with_units = data_value.value
+
+        val = {
+            "value": value,
+            "name": parameter.name,
+            "label": parameter.name,
+            "units": parameter.units,
+            "value_with_units": value_with_units,
+        }
+        if parameter.parameter_info:
+            val["icon"] = parameter.parameter_info.get("icon")
+
+        data_values[parameter.parameter] = val
+
+    return data_values
+
+
+def _forecast_entry(city_forecast):
+    period = city_forecast.parent.effective_period
+    condition = city_forecast.condition
+
+    return CityForecastEntry(
+        forecast_date=city_forecast.parent.forecast_date,
+        datetime=city_forecast.datetime,
+        effective_period=ForecastPeriodInfo(label=period.label, time=period.forecast_effective_time),
+        condition=ForecastCondition(condition.symbol, condition.label, condition.icon_url) if condition else None,
+        data_values_dict=_data_values_dict(city_forecast),
+    )
+
+
+def _city_forecasts(**filters):
+    return (
+        CityForecast.objects.filter(parent__forecast_date__gte=timezone.localdate(), **filters)
+        .select_related("parent__effective_period", "condition")
+        .prefetch_related("data_values__parameter")
+    )
+
+
+def build_city_forecast_documents():
+    """Rebuild the forecast documents of every city, then bump the forecast version"""
+    forecasts_by_city = defaultdict(list)
+    for city_forecast in _city_forecasts().iterator(chunk_size=2000):
+        forecasts_by_city[city_forecast.city_id].append(_forecast_entry(city_forecast))
+
+    # cities without forecasts get an empty document, so they are not looked up again
+    documents = {
+        CITY_FORECAST_DOCUMENT_KEY.format(city_id=city_id): forecasts_by_city.get(city_id, [])
+        for city_id in City.objects.values_list("pk", flat=True)
+    }
+    cache.set_many(documents, timeout=CITY_FORECAST_DOCUMENT_TIMEOUT)
+
+    version = bump_forecast_version()
+    logger.info(f"[FORECAST] Built forecast documents for {len(documents)} cities (version {version})")
+    return len(documents)
+
+
+def get_city_forecast_document(city):
+    """The forecasts of a city from today on, ordered by date and period"""
+    cache_key = CITY_FORECAST_DOCUMENT_KEY.format(city_id=city.pk)
+    document = cache.get(cache_key)
+
+    if document is None:
+        document = [_forecast_entry(city_forecast) for city_forecast in _city_forecasts(city=city)]
+        cache.set(cache_key, document, timeout=CITY_FORECAST_DOCUMENT_TIMEOUT)
+
+    return document
+
+
+def get_city_forecast_documents(cities):
+    """{city id: document} for several cities, read from the cache in one go"""
+    keys = {CITY_FORECAST_DOCUMENT_KEY.format(city_id=city.pk): city for city in cities}
+    cached = cache.get_many(list(keys))
+
+    documents = {}
+    for key, city in keys.items():
+        document = cached.get(key)
+        documents[city.pk] = document if document is not None else get_city_forecast_document(city)
+
+    return documents
+
+
+def get_forecast_parameters(forecast_setting):
+    """The data parameters of the forecast setting, cached until any site setting is saved"""
+    from climweb.base.site_settings_cache import get_site_settings_version
+
+    cache_key = FORECAST_PARAMETERS_KEY.format(site_id=forecast_setting.site_id,
+                                               version=get_site_settings_version())
+    parameters = cache.get(cache_key)
+
+    if parameters is None:
+        parameters = [
+            ForecastParameter(parameter.parameter, parameter.name, parameter.parameter_info,
+                              parameter.show_on_home_widget)
+            for parameter in forecast_setting.data_parameters.all()
+        ]
+        cache.set(cache_key, parameters, timeout=CITY_FORECAST_DOCUMENT_TIMEOUT)
+
+    return parameters
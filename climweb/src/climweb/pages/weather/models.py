@@ -20,8 +20,7 @@ from climweb.base.utils import paginate, query_param_to_list, get_first_non_empt
 from .blocks import ExtremeWeatherBlock
 from .utils import (
     get_city_forecast_detail_data,
-    extract_forecast_metric_series,
-    series_is_plottable,
+    extract_forecast_series_batch,
 )
 
 
@@ -98,7 +97,25 @@ class WeatherDetailPage(MetadataPageMixin, RoutablePageMixin, Page):
         # prepare graph payloads for each day and parameter
         graph_payloads = {}
 
-        for day, forecasts in detail_data.get("city_forecasts_by_date", {}).items():
+        city_forecasts_by_date = detail_data.get("city_forecasts_by_date", {})
+        # the graph series of every parameter and day, extracted in one pass
+        series_batch = extract_forecast_series_batch(list(city_forecasts_by_date.values()), GRAPH_PARAMETER_SLUGS)
+
+        # A chart is only rendered when every parameter it draws is numeric
+        # throughout the day. Free text such as "25-60, Max 60" cannot be
+        # plotted, and charting the remaining slots would read as a
+        # complete forecast, so the chart is dropped instead. Wind and
+        # temperature list both of their series, since either one going
+        # non-numeric makes the whole chart misleading.
+        plottable_days = {
+            "has_temperature_data": series_batch.plottable_days(TEMPERATURE_MAX_SLUG, TEMPERATURE_MIN_SLUG),
+            "has_wind_data": series_batch.plottable_days(WIND_SPEED_SLUG, WIND_DIRECTION_SLUG),
+            "has_precipitation_data": series_batch.plottable_days(PRECIPITATION_SLUG),
+            "has_air_pressure_data": series_batch.plottable_days(AIR_PRESSURE_SLUG),
+            "has_humidity_data": series_batch.plottable_days(HUMIDITY_SLUG),
+        }
+
+        for day_index, (day, forecasts) in enumerate(city_forecasts_by_date.items()):
             day_key = day.strftime('%Y-%m-%d')
             
             time_data = []
@@ -109,38 +126,14 @@ class WeatherDetailPage(MetadataPageMixin, RoutablePageMixin, Page):
 
                 time_data.append(forecast.effective_period.label)
 
-            series_by_slug = {
-                param_slug: extract_forecast_metric_series(forecasts, param_slug)
-                for param_slug in GRAPH_PARAMETER_SLUGS
-            }
             graph_values = {
                 param_slug: series.values
-                for param_slug, series in series_by_slug.items()
+                for param_slug, series in series_batch.series_by_slug(day_index).items()
             }
 
-            # A chart is only rendered when every parameter it draws is numeric
-            # throughout the day. Free text such as "25-60, Max 60" cannot be
-            # plotted, and charting the remaining slots would read as a
-            # complete forecast, so the chart is dropped instead. Wind and
-            # temperature list both of their series, since either one going
-            # non-numeric makes the whole chart misleading.
-            day_has_temperature_data = series_is_plottable(
-                series_by_slug, TEMPERATURE_MAX_SLUG, TEMPERATURE_MIN_SLUG
-            )
-            day_has_wind_data = series_is_plottable(
-                series_by_slug, WIND_SPEED_SLUG, WIND_DIRECTION_SLUG
-            )
-            day_has_precipitation_data = series_is_plottable(series_by_slug, PRECIPITATION_SLUG)
-            day_has_air_pressure_data = series_is_plottable(series_by_slug, AIR_PRESSURE_SLUG)
-            day_has_humidity_data = series_is_plottable(series_by_slug, HUMIDITY_SLUG)
-
             graph_payloads[day_key] = {
                 "time_data": time_data,
-                "has_temperature_data": day_has_temperature_data,
-                "has_wind_data": day_has_wind_data,
-                "has_precipitation_data": day_has_precipitation_data,
-                "has_air_pressure_data": day_has_air_pressure_data,
-                "has_humidity_data": day_has_humidity_data,
+                **{flag: bool(days[day_index]) for flag, days in plottable_days.items()},
                 **graph_values
             }
 
@@ -0,0 +1,23 @@
+from celery_singleton import Singleton
+
+from climweb.config.celery import app
+
+
+@app.task(base=Singleton, bind=True)
+def build_city_forecast_documents(self):
+    """
+    Rebuild the per-city forecast documents the weather pages and widgets render
+    from, then purge the cached pages, in the same order as after_generate_forecast
+    """
+    from climweb.base.cache import purge_all_pages
+    from climweb.pages.weather.feeds import get_home_map_forecast_feed
+    from climweb.pages.weather.forecast_documents import build_city_forecast_documents as build
+    from climweb.pages.weather.widget_fragments import prerender_forecast_widgets
+
+    built = build()
+    # the home map feed of the new forecast version
+    get_home_map_forecast_feed()
+    purge_all_pages()
+    prerender_forecast_widgets()
+    return built
+
@@ -1,6 +1,16 @@
-from django.test import SimpleTestCase
+from datetime import timedelta
+from unittest import mock
 
-from ..utils import extract_forecast_metric_series, series_is_plottable
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import timezone
+
+from ..forecast_documents import CityForecastEntry, ForecastParameter, ForecastPeriodInfo
+from ..utils import (
+    extract_forecast_metric_series,
+    extract_forecast_series_batch,
+    get_city_forecast_detail_data,
+    series_is_plottable,
+)
 
 
 class FakeForecast:
@@ -107,3 +117,56 @@ class TestSeriesIsPlottable(SimpleTestCase):
         self.assertTrue(
             series_is_plottable(series_by_slug, "air_temperature_max", "air_temperature_min")
         )
+
+
+class TestExtractForecastSeriesBatch(SimpleTestCase):
+    def test_days_and_parameters_in_one_pass(self):
+        days = [
+            [FakeForecast({"wind_speed": {"value": "22"}, "relative_humidity": {"value": "80"}}),
+             FakeForecast({"wind_speed": {"value": "Max 60"}})],
+            [FakeForecast({"relative_humidity": {"value": ""}})],
+        ]
+        batch = extract_forecast_series_batch(days, ["wind_speed", "relative_humidity"])
+
+        self.assertEqual(batch.series(0, "wind_speed").values, [22.0, None])
+        self.assertEqual(batch.series(0, "relative_humidity").values, [80.0, None])
+        # the shorter day is not padded
+        self.assertEqual(batch.series(1, "relative_humidity").values, [None])
+
+        self.assertEqual(batch.plottable_days("wind_speed").tolist(), [False, False])
+        self.assertEqual(batch.plottable_days("relative_humidity").tolist(), [True, False])
+        for day_index in range(2):
+            for slug in ("wind_speed", "relative_humidity"):
+                self.assertEqual(
+                    bool(batch.plottable_days(slug)[day_index]),
+                    series_is_plottable(batch.series_by_slug(day_index), slug),
+                )
+
+
+class TestCityForecastDetailData(SimpleTestCase):
+    def entry(self, when):
+        return CityForecastEntry(
+            forecast_date=timezone.localtime(when).date(),
+            datetime=when,
+            effective_period=ForecastPeriodInfo(label="Period", time=timezone.localtime(when).time()),
+            condition=None,
+            data_values_dict={},
+        )
+
+    def test_document_grouped_by_date_without_past_forecasts(self):
+        now = timezone.localtime()
+        past, upcoming, tomorrow = now - timedelta(days=1), now + timedelta(minutes=1), now + timedelta(days=1)
+        document = [self.entry(past), self.entry(upcoming), self.entry(tomorrow)]
+        parameters = [
+            ForecastParameter("wind_speed", "Wind", None, True),
+            ForecastParameter("relative_humidity", "Humidity", None, False),
+        ]
+
+        with mock.patch("climweb.pages.weather.utils.get_city_forecast_document", return_value=document), \
+                mock.patch("climweb.pages.weather.utils.get_forecast_parameters", return_value=parameters), \
+                mock.patch("climweb.pages.weather.utils.ForecastSetting.for_request"):
+            data = get_city_forecast_detail_data(None, multi_period=True, request=RequestFactory().get("/"),
+                                                 for_home_widget=True)
+
+        self.assertEqual(list(data["city_forecasts_by_date"]), [upcoming.date(), tomorrow.date()])
+        self.assertEqual(data["weather_parameters"], parameters[:1])
@@ -0,0 +1,134 @@
+import gzip
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import timezone
+
+from .. import views, widget_fragments
+
+
+class TestHomeMapForecastFeedView(SimpleTestCase):
+    def setUp(self):
+        body = b'{"cities":{}}'
+        self.feed = {
+            "etag": "abc",
+            "last_modified": timezone.now(),
+            "bodies": {"identity": body, "gzip": gzip.compress(body)},
+        }
+        patcher = mock.patch.object(views, "get_home_map_forecast_feed", return_value=self.feed)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, **headers):
+        return views.get_home_map_forecast_feed_view(RequestFactory().get("/feed/", **headers))
+
+    def test_serves_accepted_encoding(self):
+        response = self.get(HTTP_ACCEPT_ENCODING="br;q=0, gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), self.feed["bodies"]["identity"])
+        self.assertEqual(response["ETag"], '"abc-gzip"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+        response = self.get()
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["ETag"], '"abc-identity"')
+
+    def test_unchanged_feed_is_not_modified(self):
+        response = self.get(HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH='"abc-gzip"')
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+
+class TestForecastTiles(SimpleTestCase):
+    payload = {
+        "cities": {"id": [1, 2], "name": ["Accra", "Kumasi"], "slug": ["accra", "kumasi"],
+                   "coordinates": [[-0.2, 5.6], [-1.6, 6.7]]},
+        "conditions": {"symbol": ["clearsky_day"], "label": ["Clear sky"], "icon_url": ["/clearsky_day.png"]},
+        "parameters": ["air_temperature_max"],
+        "periods": [
+            {"datetime": "2026-10-18T06:00:00", "condition": [0, None],
+             "values": {"air_temperature_max": [31, None]}},
+            {"datetime": "2026-10-19T06:00:00", "condition": [0, 0],
+             "values": {"air_temperature_max": [30, 29]}},
+        ],
+    }
+
+    def test_period_defaults_to_first(self):
+        self.assertIs(views._forecast_tile_period(self.payload, None), self.payload["periods"][0])
+        self.assertIs(views._forecast_tile_period(self.payload, "2026-10-19T06:00:00"), self.payload["periods"][1])
+        self.assertIsNone(views._forecast_tile_period(self.payload, "2026-10-20T06:00:00"))
+
+    def test_points_skip_cities_without_forecast(self):
+        points = views._forecast_tile_points(self.payload, self.payload["periods"][0])
+
+        self.assertEqual(len(points), 1)
+        self.assertEqual(points[0]["city_slug"], "accra")
+        self.assertEqual(points[0]["condition"], "clearsky_day")
+        self.assertEqual(points[0]["data_values"], {"air_temperature_max": 31})
+
+    def test_clustering_only_at_low_zooms(self):
+        map_settings = mock.Mock(forecast_cluster=True, forecast_cluster_radius=50, forecast_cluster_min_points=2)
+        request = RequestFactory().get("/")
+
+        with mock.patch.object(views.HomeMapSettings, "for_request", return_value=map_settings):
+            eps, min_points = views._forecast_tile_cluster_params(request, 4)
+            self.assertEqual(min_points, 2)
+            # the radius halves in meters with every zoom level
+            self.assertAlmostEqual(views._forecast_tile_cluster_params(request, 5)[0], eps / 2)
+            self.assertIsNone(views._forecast_tile_cluster_params(request, views.FORECAST_TILE_CLUSTER_MAX_ZOOM))
+
+            map_settings.forecast_cluster = False
+            self.assertIsNone(views._forecast_tile_cluster_params(request, 4))
+
+
+class TestHomeForecastWidgetView(SimpleTestCase):
+    def test_prerendered_widget_is_served_from_cache(self):
+        widget = {"html": "<div>Accra</div>", "has_data": True}
+        request = RequestFactory().get("/", {"city": "accra"})
+
+        with mock.patch.object(views.wagtailcache_settings, "WAGTAIL_CACHE", True), \
+                mock.patch.object(views, "get_cached_forecast_widget", return_value=widget) as get_cached, \
+                mock.patch.object(views.ForecastSetting, "for_request") as for_request:
+            response = views.get_home_forecast_widget(request)
+
+        get_cached.assert_called_once_with(request, "accra")
+        for_request.assert_not_called()
+        self.assertEqual(response.content, b"<div>Accra</div>")
+
+    def test_widget_key_depends_on_host(self):
+        with mock.patch.object(widget_fragments, "get_forecast_version", return_value=1), \
+                mock.patch("climweb.base.site_settings_cache.get_site_settings_version", return_value=1):
+            key = widget_fragments.forecast_widget_cache_key
+            # widgets hold absolute URLs to the site they were rendered for
+            self.assertNotEqual(key("example.org", "accra"), key("other.org", "accra"))
+            self.assertEqual(key("Example.org", "accra"), key("example.org", "accra"))
+
+    def test_prerendered_widgets_are_keyed_like_visitor_requests(self):
+        site = mock.Mock(is_default_site=True, hostname="localhost", port=80)
+        city = mock.Mock(slug="accra")
+        rendered_keys = []
+
+        def render(request, city, forecast_setting):
+            rendered_keys.append(widget_fragments.forecast_widget_cache_key(request.get_host(), city.slug))
+            return {"html": "", "has_data": True}
+
+        with self.settings(WAGTAILADMIN_BASE_URL="https://climweb.example.org", ALLOWED_HOSTS=["*"],
+                           LANGUAGES=[("en", "English"), ("fr", "French")]), \
+                mock.patch.object(widget_fragments, "get_forecast_version", return_value=1), \
+                mock.patch("climweb.base.site_settings_cache.get_site_settings_version", return_value=1), \
+                mock.patch.object(widget_fragments.City.objects, "all", return_value=[city]), \
+                mock.patch.object(widget_fragments.Site.objects, "all", return_value=[site]), \
+                mock.patch.object(widget_fragments.ForecastSetting, "for_site"), \
+                mock.patch.object(widget_fragments, "render_forecast_widget", side_effect=render), \
+                mock.patch.object(widget_fragments.wagcache, "set_many") as set_many:
+            widget_fragments.prerender_forecast_widgets()
+
+            # a visitor behind the proxy reads the same key, in either language
+            request = RequestFactory().get("/", HTTP_HOST="climweb.example.org")
+            with widget_fragments.translation.override("fr"):
+                visitor_key = widget_fragments.forecast_widget_cache_key(request.get_host(), "accra")
+
+        self.assertEqual(len(rendered_keys), 2)
+        self.assertIn(visitor_key, set_many.call_args[0][0])
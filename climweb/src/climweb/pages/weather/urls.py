@@ -1,9 +1,19 @@
 from django.urls import path
 
-from .views import get_home_forecast_widget, get_home_map_forecast
+from .views import (
+    ForecastTileView,
+    get_forecast_tilejson,
+    get_home_forecast_widget,
+    get_home_map_forecast,
+    get_home_map_forecast_feed_view,
+)
 
 urlpatterns = [
     path('home-weather-widget/', get_home_forecast_widget, name="home-weather-widget"),
     path('home-weather-forecast/', get_home_map_forecast, name="home-weather-forecast"),
+    path('home-weather-forecast/feed/', get_home_map_forecast_feed_view, name="home-weather-forecast-feed"),
+    path('home-weather-forecast/tiles.json', get_forecast_tilejson, name="home-weather-forecast-tilejson"),
+    path('home-weather-forecast/tiles/<int:z>/<int:x>/<int:y>', ForecastTileView.as_view(),
+         name="home-weather-forecast-tiles"),
 
 ]
@@ -1,24 +1,27 @@
 from typing import NamedTuple
 
+import numpy as np
+import pandas as pd
 from django.utils import timezone
 from forecastmanager.forecast_settings import ForecastSetting
-from forecastmanager.models import CityForecast
 from wagtail.models import Site
 
+from .forecast_documents import get_city_forecast_document, get_forecast_parameters
+
 
 def get_city_forecast_detail_data(city, multi_period=False, request=None, for_home_widget=False):
     localtime = timezone.localtime()
-    city_forecasts = CityForecast.objects.filter(
-        city=city, parent__forecast_date__gte=localtime.date()
-    ).select_related('parent', 'condition').prefetch_related('data_values__parameter')
-
     city_forecasts_by_date = {}
 
-    for forecast in city_forecasts:
+    # the document may have been built yesterday, so past dates and periods are
+    # skipped here
+    for forecast in get_city_forecast_document(city):
+        if forecast.forecast_date < localtime.date():
+            continue
         if multi_period and forecast.datetime < localtime:
             continue
 
-        forecast_date = forecast.parent.forecast_date
+        forecast_date = forecast.forecast_date
         if forecast_date not in city_forecasts_by_date:
             city_forecasts_by_date[forecast_date] = []
         city_forecasts_by_date[forecast_date].append(forecast)
@@ -28,10 +31,9 @@ def get_city_forecast_detail_data(city, multi_period=False, request=None, for_ho
         site = Site.objects.get(is_default_site=True)
         forecast_setting = ForecastSetting.for_site(site)
 
+    weather_parameters = get_forecast_parameters(forecast_setting)
     if for_home_widget:
-        weather_parameters = forecast_setting.data_parameters.filter(show_on_home_widget=True)[:4]
-    else:
-        weather_parameters = forecast_setting.data_parameters.all()
+        weather_parameters = [parameter for parameter in weather_parameters if parameter.show_on_home_widget][:4]
 
     return {
         "city_forecasts_by_date": city_forecasts_by_date,
@@ -51,34 +53,94 @@ class ForecastSeries(NamedTuple):
     has_text: bool
 
 
-def extract_forecast_metric_series(forecasts, param_slug):
+class ForecastSeriesBatch(NamedTuple):
     """
-    Collect one parameter's values across a day's forecasts, in order.
+    Several parameters' values across several days of forecasts.
 
-    Empty and missing values become None (nothing was entered). Non-numeric
-    values also become None, but are reported separately via ``has_text`` so
+    ``values`` holds one days × periods array per parameter, with NaN where a
+    slot has no plottable number. ``numeric`` and ``text`` are masks of the
+    same shape, marking the slots that held a number and those that held free
+    text. ``period_counts`` is the number of forecasts of each day, as days
+    can have fewer periods than the array has columns.
+    """
+    values: dict
+    numeric: dict
+    text: dict
+    period_counts: list
+
+    def series(self, day_index, param_slug):
+        """The ForecastSeries of one parameter for one day"""
+        period_count = self.period_counts[day_index]
+        values = self.values[param_slug][day_index, :period_count]
+        numeric = self.numeric[param_slug][day_index, :period_count]
+
+        return ForecastSeries(
+            values=[float(value) if is_numeric else None for value, is_numeric in zip(values, numeric)],
+            has_numeric=bool(numeric.any()),
+            has_text=bool(self.text[param_slug][day_index, :period_count].any()),
+        )
+
+    def series_by_slug(self, day_index):
+        return {param_slug: self.series(day_index, param_slug) for param_slug in self.values}
+
+    def plottable_days(self, *param_slugs):
+        """
+        For each day, whether a chart drawing ``param_slugs`` should be
+        rendered, following the same rule as series_is_plottable.
+        """
+        has_numeric = np.logical_or.reduce([self.numeric[slug].any(axis=1) for slug in param_slugs])
+        has_text = np.logical_or.reduce([self.text[slug].any(axis=1) for slug in param_slugs])
+
+        return has_numeric & ~has_text
+
+
+def extract_forecast_series_batch(forecasts_by_day, param_slugs):
+    """
+    Collect the values of all ``param_slugs`` across all days' forecasts in a
+    single pass over the forecasts, parsing them all at once.
+
+    Empty and missing values are NaN and in neither mask (nothing was entered).
+    Non-numeric values are NaN too, but are marked in the ``text`` mask so
     callers can tell "the editor entered nothing" apart from "the editor
     entered something we cannot plot".
     """
-    values = []
-    has_numeric = False
-    has_text = False
+    period_counts = [len(forecasts) for forecasts in forecasts_by_day]
+    shape = (len(forecasts_by_day), max(period_counts, default=0), len(param_slugs))
 
-    for forecast in forecasts:
-        raw_value = (forecast.data_values_dict.get(param_slug) or {}).get("value")
+    # one raw value per day × period × parameter slot, with None padding the
+    # days that have fewer periods
+    raw_values = pd.Series([
+        (data_values.get(param_slug) or {}).get("value")
+        for forecasts in forecasts_by_day
+        for data_values in [forecast.data_values_dict for forecast in forecasts] + [{}] * (shape[1] - len(forecasts))
+        for param_slug in param_slugs
+    ], dtype=object)
 
-        if raw_value in (None, ''):
-            values.append(None)
-            continue
+    entered = (raw_values.notna() & (raw_values != "")).to_numpy(dtype=bool)
+    parsed = pd.to_numeric(raw_values.astype(str).str.strip(), errors="coerce").to_numpy(dtype=float)
+
+    numeric = (entered & ~np.isnan(parsed)).reshape(shape)
+    text = (entered & np.isnan(parsed)).reshape(shape)
+    values = np.where(numeric, parsed.reshape(shape), np.nan)
+
+    return ForecastSeriesBatch(
+        values={param_slug: values[:, :, index] for index, param_slug in enumerate(param_slugs)},
+        numeric={param_slug: numeric[:, :, index] for index, param_slug in enumerate(param_slugs)},
+        text={param_slug: text[:, :, index] for index, param_slug in enumerate(param_slugs)},
+        period_counts=period_counts,
+    )
 
-        try:
-            values.append(float(raw_value))
-            has_numeric = True
-        except (TypeError, ValueError):
-            values.append(None)
-            has_text = True
 
-    return ForecastSeries(values=values, has_numeric=has_numeric, has_text=has_text)
+def extract_forecast_metric_series(forecasts, param_slug):
+    """
+    Collect one parameter's values across a day's forecasts, in order.
+
+    Empty and missing values become None (nothing was entered). Non-numeric
+    values also become None, but are reported separately via ``has_text``.
+    See extract_forecast_series_batch to extract several parameters and days
+    at once.
+    """
+    return extract_forecast_series_batch([forecasts], [param_slug]).series(0, param_slug)
 
 
 def series_is_plottable(series_by_slug, *param_slugs):
@@ -1,19 +1,34 @@
-from django.http import JsonResponse
+import json
+import re
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, close_old_connections
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, urlencode
 from django.utils.translation import gettext as _
+from django.views import View
 from django.views.decorators.http import require_GET
-from django.template.loader import render_to_string
 from forecastmanager.forecast_settings import ForecastSetting
 from forecastmanager.models import City, Forecast
 from forecastmanager.serializers import ForecastSerializer
 from wagtail.api.v2.utils import get_full_url
 from wagtailcache.settings import wagtailcache_settings
 
-from climweb.base.cache import wagcache
+from climweb.base.cache import cache_get_or_set
+from climweb.base.site_settings_cache import get_site_settings_version
 from climweb.pages.home.models import HomeMapSettings
-from climweb.pages.weather.utils import get_city_forecast_detail_data
+from climweb.pages.weather.feeds import get_home_map_forecast_feed, get_home_map_forecast_payload
+from climweb.pages.weather.forecast_documents import CITY_FORECAST_DOCUMENT_TIMEOUT, get_forecast_version
+from climweb.pages.weather.widget_fragments import (
+    get_cached_forecast_widget,
+    get_forecast_widget,
+    render_forecast_widget,
+)
+
 
 @require_GET
 def get_home_forecast_widget(request):
@@ -21,25 +36,11 @@ def get_home_forecast_widget(request):
 
     # Early cache check for slug-based requests — skips all DB queries on a hit.
     if city_slug and wagtailcache_settings.WAGTAIL_CACHE:
-        cached = wagcache.get(f"city_forecast_widget_data_{city_slug}")
-        if cached is not None:
-            return cached
+        widget = get_cached_forecast_widget(request, city_slug)
+        if widget is not None:
+            return HttpResponse(widget["html"])
 
     forecast_setting = ForecastSetting.for_request(request)
-    context = {}
-
-    home_settings = HomeMapSettings.for_request(request)
-    show_forecast_attribution = home_settings.show_forecast_attribution
-    external_source = forecast_setting.enable_auto_forecast
-    if external_source and show_forecast_attribution:
-        source_name = "Yr.no"
-        source_url = "https://www.yr.no"
-        context.update({
-            "external_source_attribution": _(
-                "Forecast Data Source: %(forecast_source)s"
-            ) % {"forecast_source": source_name},
-            "external_source_url": source_url,
-        })
 
     if city_slug:
         city = City.objects.filter(slug=city_slug).first()
@@ -57,65 +58,20 @@ def get_home_forecast_widget(request):
             city = City.objects.first()
 
     if city is None:
-        context.update({
+        context = {
             "error": True,
             "error_message": _("No location set in the system. Please contact the administrator."),
-        })
+        }
         return render(request, 'weather/widgets/location_forecast_single_slider.html', context)
 
-    # Cache check for default-city requests (slug wasn't in the query string).
-    if not city_slug and wagtailcache_settings.WAGTAIL_CACHE:
-        cached = wagcache.get(f"city_forecast_widget_data_{city.slug}")
-        if cached is not None:
-            return cached
-
-    city_detail_page = forecast_setting.weather_detail_page
-
-    if city_detail_page:
-        # Try getting the city detail page URL. If it fails, ignore it.
-        # this is here because a different page than what is expected might be set
-        try:
-            city_detail_page = city_detail_page.specific
-            city_detail_page_url = city_detail_page.get_full_url(request) + city_detail_page.reverse_subpage(
-                "daily_table_for_city", kwargs={"city_slug": city.slug})
-            context.update({
-                "city_detail_page_url": city_detail_page_url,
-            })
-        except Exception:
-            pass
-
-    city_search_url = get_full_url(request, reverse("cities-list"))
-    context.update({
-        "city_search_url": city_search_url,
-    })
-
-    if forecast_setting.weather_reports_page:
-        context.update({
-            "weather_reports_page_url": forecast_setting.weather_reports_page.get_full_url(request)
-        })
-
-    forecast_periods_count = forecast_setting.periods.count()
-    multi_period = forecast_periods_count > 1
-
-    data = get_city_forecast_detail_data(city, multi_period=multi_period, request=request,
-                                         for_home_widget=True)
-
-    context.update({
-        "city": city,
-        "show_condition_label": forecast_setting.show_conditions_label_on_widget,
-        "use_period_labels": forecast_setting.use_period_labels,
-        **data,
-    })
-
-    if multi_period:
-        response = render(request, 'weather/widgets/location_forecast_multiple_slider.html', context)
-    else:
-        response = render(request, 'weather/widgets/location_forecast_single_slider.html', context)
-
     if wagtailcache_settings.WAGTAIL_CACHE:
-        wagcache.set(f"city_forecast_widget_data_{city.slug}", response, 60 * 20)
+        # widgets are pre-rendered after each forecast update, this only renders
+        # the ones that are missing, one request at a time
+        widget = get_forecast_widget(request, city, forecast_setting)
+    else:
+        widget = render_forecast_widget(request, city, forecast_setting)
 
-    return response
+    return HttpResponse(widget["html"])
 
 
 def get_home_map_forecast(request):
@@ -136,4 +92,281 @@ def get_home_map_forecast(request):
         "multi_period": multi_period
     }
     
-    return JsonResponse(res_data, safe=False)
\ No newline at end of file
+    return JsonResponse(res_data, safe=False)
+
+
+# preferred first, when the client accepts several
+FEED_ENCODINGS = ("br", "gzip")
+# browsers revalidate the feed after this many seconds, which is cheap with the validators
+HOME_MAP_FORECAST_FEED_MAX_AGE = 60
+
+
+def _accepted_encodings(request):
+    accepted = set()
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, __, params = part.strip().partition(";")
+        if not re.search(r"q=0(\.0*)?\s*$", params.strip()):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+@require_GET
+def get_home_map_forecast_feed_view(request):
+    """
+    The home map forecast feed, see climweb.pages.weather.feeds. It is served
+    pre-compressed with Brotli or gzip when the client accepts it, with an ETag
+    and Last-Modified so unchanged feeds are answered with 304 Not Modified.
+    """
+    feed = get_home_map_forecast_feed()
+
+    accepted = _accepted_encodings(request)
+    encoding = next((e for e in FEED_ENCODINGS if e in accepted and e in feed["bodies"]), "identity")
+
+    # each encoding is a different representation, so it gets its own ETag
+    etag = f'"{feed["etag"]}-{encoding}"'
+    last_modified = int(feed["last_modified"].timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(feed["bodies"][encoding], content_type="application/json")
+        if encoding != "identity":
+            response["Content-Encoding"] = encoding
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ["Accept-Encoding"])
+    patch_cache_control(response, public=True, max_age=HOME_MAP_FORECAST_FEED_MAX_AGE)
+
+    return response
+
+
+FORECAST_TILE_KEY = "weather:forecast_tile:{forecast_version}:{settings_version}:{period}:{z}:{x}:{y}"
+# features of all the tiles of one zoom, or of every zoom when they are not clustered
+FORECAST_TILE_FEATURES_KEY = "weather:forecast_tile_features:{forecast_version}:{settings_version}:{period}:{zoom}"
+# points are clustered below this zoom, if clustering is enabled in the home map settings
+FORECAST_TILE_CLUSTER_MAX_ZOOM = 10
+# tile URLs carry the forecast version, so browsers can keep them for long
+FORECAST_TILE_MAX_AGE = 60 * 60 * 24
+# width of the world in EPSG:3857 meters
+WEB_MERCATOR_WORLD_WIDTH = 40075016.686
+
+
+def _forecast_tile_period(payload, period_datetime):
+    """The forecast period shown by a tile, the first one if none is given"""
+    periods = payload.get("periods") or []
+    if not period_datetime:
+        return periods[0] if periods else None
+    return next((period for period in periods if period["datetime"] == period_datetime), None)
+
+
+def _forecast_tile_points(payload, period):
+    cities, conditions = payload["cities"], payload["conditions"]
+
+    points = []
+    for city_index, city_id in enumerate(cities["id"]):
+        condition_index = period["condition"][city_index]
+        if condition_index is None:
+            continue
+
+        points.append({
+            "city_id": city_id,
+            "city": cities["name"][city_index],
+            "city_slug": cities["slug"][city_index],
+            "condition": conditions["symbol"][condition_index],
+            "condition_label": conditions["label"][condition_index],
+            "condition_icon_url": conditions["icon_url"][condition_index],
+            "data_values": {
+                parameter: values[city_index]
+                for parameter, values in period["values"].items() if values[city_index] is not None
+            },
+        })
+
+    return points
+
+
+def _forecast_tile_cluster_params(request, z):
+    """(eps in meters, min points) of the clustering at zoom z, or None to not cluster"""
+    map_settings = HomeMapSettings.for_request(request)
+    if not map_settings.forecast_cluster or z >= FORECAST_TILE_CLUSTER_MAX_ZOOM:
+        return None
+
+    # the radius is in pixels of a 512 pixel tile, as with MapLibre's clusterRadius
+    radius = map_settings.forecast_cluster_radius or 50
+    eps = radius * WEB_MERCATOR_WORLD_WIDTH / (2 ** z) / 512
+    return eps, map_settings.forecast_cluster_min_points or 2
+
+
+def _forecast_tile_features(points, cluster_params):
+    """
+    The features drawn on the tiles of one zoom, with their EPSG:3857 x and y.
+    Points are clustered once over the whole map rather than per tile, so a
+    cluster near a tile edge is the same feature in the tiles on both sides.
+    """
+    city_table = connection.ops.quote_name(City._meta.db_table)
+
+    if cluster_params:
+        eps, min_points = cluster_params
+        features_sql = f"""
+            clustered AS (
+              SELECT *, ST_ClusterDBSCAN(geom, eps := {eps}, minpoints := {min_points}) OVER () AS cluster_id
+              FROM points
+            ),
+            features AS (
+              SELECT ST_Centroid(ST_Collect(geom)) AS geom, count(*)::int AS point_count,
+                NULL AS city, NULL AS city_slug,
+                mode() WITHIN GROUP (ORDER BY condition) AS condition,
+                mode() WITHIN GROUP (ORDER BY condition_label) AS condition_label,
+                mode() WITHIN GROUP (ORDER BY condition_icon_url) AS condition_icon_url,
+                NULL::jsonb AS data_values
+              FROM clustered WHERE cluster_id IS NOT NULL GROUP BY cluster_id
+              UNION ALL
+              SELECT geom, 1, city, city_slug, condition, condition_label, condition_icon_url, data_values
+              FROM clustered WHERE cluster_id IS NULL
+            )"""
+    else:
+        features_sql = """
+            features AS (
+              SELECT geom, 1 AS point_count, city, city_slug, condition, condition_label, condition_icon_url,
+                data_values
+              FROM points
+            )"""
+
+    sql = f"""WITH
+        forecast AS (
+          SELECT * FROM jsonb_to_recordset(%s::jsonb) AS f(
+            city_id int, city text, city_slug text, condition text, condition_label text,
+            condition_icon_url text, data_values jsonb
+          )
+        ),
+        points AS (
+          SELECT ST_Transform(c.location, 3857) AS geom, f.*
+          FROM {city_table} c JOIN forecast f ON f.city_id = c.id
+        ),
+        {features_sql}
+        SELECT ST_X(geom) AS x, ST_Y(geom) AS y, point_count, city, city_slug, condition, condition_label,
+          condition_icon_url, data_values
+        FROM features;
+        """
+
+    close_old_connections()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [json.dumps(points, cls=DjangoJSONEncoder)])
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _render_forecast_tile(z, x, y, features):
+    # ST_AsMVTGeom keeps the features within the tile buffer, so a feature near
+    # an edge is drawn at the same place in both tiles. The parameter values of
+    # data_values become feature properties, named as the home map popup reads them.
+    sql = f"""WITH
+        bounds AS (
+          SELECT ST_TileEnvelope({z}, {x}, {y}) AS geom
+        ),
+        features AS (
+          SELECT ST_SetSRID(ST_MakePoint(f.x, f.y), 3857) AS geom, f.point_count, f.city, f.city_slug,
+            f.condition, f.condition_label, f.condition_icon_url, f.data_values
+          FROM jsonb_to_recordset(%s::jsonb) AS f(
+            x float8, y float8, point_count int, city text, city_slug text, condition text,
+            condition_label text, condition_icon_url text, data_values jsonb
+          )
+        ),
+        mvtgeom AS (
+          SELECT ST_AsMVTGeom(features.geom, bounds.geom) AS geom, point_count, city, city_slug, condition,
+            condition_label, condition_icon_url AS condition_symbol_url, data_values
+          FROM features, bounds
+        )
+        SELECT ST_AsMVT(mvtgeom, 'default') FROM mvtgeom WHERE geom IS NOT NULL;
+        """
+
+    close_old_connections()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [json.dumps(features, cls=DjangoJSONEncoder)])
+        return bytes(cursor.fetchone()[0] or b"")
+
+
+class ForecastTileView(View):
+    """
+    Vector tiles of the home map forecast points of one period, with their
+    condition, icon and parameter values. At low zooms points are clustered on
+    the server, and each cluster carries its point_count and most common condition.
+    Tiles are rendered from the cached home map feed and cached per forecast version.
+    """
+
+    def get(self, request, z, x, y):
+        payload = get_home_map_forecast_payload()
+        period = _forecast_tile_period(payload, request.GET.get("period"))
+        if period is None:
+            raise Http404()
+
+        version = get_forecast_version()
+        settings_version = get_site_settings_version()
+        cache_key = FORECAST_TILE_KEY.format(
+            forecast_version=version,
+            settings_version=settings_version,
+            period=period["datetime"],
+            z=z, x=x, y=y,
+        )
+
+        def render_tile():
+            cluster_params = _forecast_tile_cluster_params(request, z)
+            features_key = FORECAST_TILE_FEATURES_KEY.format(
+                forecast_version=version,
+                settings_version=settings_version,
+                period=period["datetime"],
+                zoom=z if cluster_params else "all",
+            )
+            features = cache_get_or_set(
+                features_key,
+                lambda: _forecast_tile_features(_forecast_tile_points(payload, period), cluster_params),
+                CITY_FORECAST_DOCUMENT_TIMEOUT,
+            )
+            return _render_forecast_tile(z, x, y, features)
+
+        tile = cache_get_or_set(cache_key, render_tile, CITY_FORECAST_DOCUMENT_TIMEOUT)
+        if not len(tile):
+            raise Http404()
+
+        response = HttpResponse(tile, content_type="application/x-protobuf")
+        if request.GET.get("v") == str(version):
+            patch_cache_control(response, public=True, max_age=FORECAST_TILE_MAX_AGE)
+        else:
+            patch_cache_control(response, public=True, max_age=HOME_MAP_FORECAST_FEED_MAX_AGE)
+
+        return response
+
+
+@require_GET
+def get_forecast_tilejson(request):
+    """
+    TileJSON of the forecast tiles, with a tiles URL for each forecast period.
+    The URLs include the forecast version, so they change with every update.
+    """
+    payload = get_home_map_forecast_payload()
+    version = get_forecast_version()
+
+    base_url = get_full_url(request, reverse("home-weather-forecast-tiles", args=(0, 0, 0)))
+    base_url = base_url.replace("/0/0/0", "/{z}/{x}/{y}")
+
+    periods = [
+        {
+            "date": period["date"],
+            "datetime": period["datetime"],
+            "label": period["effective_period_label"],
+            "tiles": [f"{base_url}?{urlencode({'v': version, 'period': period['datetime']})}"],
+        }
+        for period in payload.get("periods") or []
+    ]
+
+    return JsonResponse({
+        "tilejson": "3.0.0",
+        "name": "forecast",
+        "version": str(version),
+        "multi_period": payload.get("multi_period", False),
+        "tiles": periods[0]["tiles"] if periods else [],
+        "vector_layers": [{"id": "default", "fields": {
+            "point_count": "Number", "city": "String", "city_slug": "String", "condition": "String",
+            "condition_label": "String", "condition_symbol_url": "String",
+        }}],
+        "periods": periods,
+    })
@@ -1,61 +1,77 @@
 import logging
 
-from django.test import RequestFactory
-from forecastmanager.forecast_settings import ForecastSetting
-from forecastmanager.models import City
+from django.db import transaction
+from forecastmanager.models import Forecast
 from wagtail import hooks
-from wagtail.models import Site
-from wagtailcache.cache import clear_cache
-from wagtailcache.settings import wagtailcache_settings
+
+from climweb.base.cache import purge_all_pages
+from .feeds import get_home_map_forecast_feed
+from .forecast_documents import build_city_forecast_documents
+from .widget_fragments import prerender_forecast_widgets
 
 logger = logging.getLogger(__name__)
 
 
-def _warm_forecast_widget_cache():
-    """Re-render and cache the widget for the default city after a forecast update.
+def _prerender_forecast_widgets():
+    try:
+        prerender_forecast_widgets()
+    except Exception:
+        # Never let the widgets crash the hook or the forecast generation process.
+        logger.exception("Failed to pre-render forecast widgets")
 
-    This prevents the first real user request after a forecast change from hitting
-    a cold cache and suffering the full DB + render cost.
-    """
-    if not wagtailcache_settings.WAGTAIL_CACHE:
-        return
 
+def _rebuild_city_forecast_documents():
     try:
-        site = Site.objects.get(is_default_site=True)
-        forecast_setting = ForecastSetting.for_site(site)
-        city = forecast_setting.default_city or City.objects.first()
-        if city is None:
-            return
-
-        # Build a synthetic request so the view can resolve site-aware settings
-        # and construct absolute URLs correctly.
-        host = site.hostname
-        if site.port not in (80, 443):
-            host = f"{site.hostname}:{site.port}"
+        build_city_forecast_documents()
+        # the home map feed of the new forecast version
+        get_home_map_forecast_feed()
+    except Exception:
+        logger.exception("Failed to build city forecast documents")
 
-        request = RequestFactory().get(f"/?city={city.slug}", HTTP_HOST=host)
 
-        from climweb.pages.weather.views import get_home_forecast_widget
-        get_home_forecast_widget(request)
+def _schedule_city_forecast_documents_rebuild():
+    # outside of the forecast download, rebuild in the background once the
+    # changes are committed, rather than in the admin request
+    def schedule():
+        from .tasks import build_city_forecast_documents as build_task
+        try:
+            build_task.delay()
+        except Exception:
+            logger.exception("Failed to schedule city forecast documents rebuild")
 
-        logger.debug("Forecast widget cache warmed for city: %s", city.slug)
-    except Exception:
-        # Never let cache warming crash the hook or the forecast generation process.
-        logger.exception("Failed to warm forecast widget cache")
+    transaction.on_commit(schedule)
 
 
 @hooks.register("after_generate_forecast")
 def after_generate_forecast(created_forecast_pks):
-    clear_cache()
-    _warm_forecast_widget_cache()
+    # runs in the download_forecast task, so the documents are rebuilt right away
+    _rebuild_city_forecast_documents()
+    purge_all_pages()
+    _prerender_forecast_widgets()
 
 
 @hooks.register("after_clear_old_forecasts")
 def after_clear_old_forecasts():
-    clear_cache()
+    # pages are purged by the task once the documents are rebuilt, so no request
+    # caches them again from the old forecast in the meantime
+    _schedule_city_forecast_documents_rebuild()
 
 
 @hooks.register("after_forecast_add_from_form")
 def after_forecast_add_from_form():
-    clear_cache()
-    _warm_forecast_widget_cache()
+    # in the admin request, so the documents, feed, pages and widgets are
+    # rebuilt and purged in the background
+    _schedule_city_forecast_documents_rebuild()
+
+
+@hooks.register("after_create_snippet")
+@hooks.register("after_edit_snippet")
+def rebuild_city_forecast_documents_after_edit(request, snippet):
+    if isinstance(snippet, Forecast):
+        _schedule_city_forecast_documents_rebuild()
+
+
+@hooks.register("after_delete_snippet")
+def rebuild_city_forecast_documents_after_delete(request, instances):
+    if any(isinstance(instance, Forecast) for instance in instances):
+        _schedule_city_forecast_documents_rebuild()
@@ -0,0 +1,157 @@
+"""
+Pre-rendered home forecast widgets.
+
+Right after forecasts are updated, the widget of every city is rendered for
+each site and language and stored under the forecast version, so the widget
+endpoint and the home page only read the cache, and a widget rendered before an
+update is never served. The host is part of the key, as widgets hold absolute
+URLs, so widgets are rendered for the host visitors use (see
+get_site_public_host).
+"""
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone, translation
+from django.utils.translation import gettext as _
+from forecastmanager.forecast_settings import ForecastSetting
+from forecastmanager.models import City
+from loguru import logger
+from wagtail.api.v2.utils import get_full_url
+from wagtail.models import Site
+
+from climweb.base.cache import cache_get_or_set, wagcache
+from climweb.base.cache_warmer import get_site_public_host
+from .forecast_documents import CITY_FORECAST_DOCUMENT_TIMEOUT, get_forecast_version
+from .utils import get_city_forecast_detail_data
+
+FORECAST_WIDGET_KEY = "weather:forecast_widget:{forecast_version}:{settings_version}:{date}:{language}:{host}:{city_slug}"
+
+
+def _request_host(request):
+    return request.get_host().lower()
+
+
+def forecast_widget_cache_key(host, city_slug):
+    # the date is part of the key, as the widget labels today's forecast
+    from climweb.base.site_settings_cache import get_site_settings_version
+
+    return FORECAST_WIDGET_KEY.format(
+        forecast_version=get_forecast_version(),
+        settings_version=get_site_settings_version(),
+        date=timezone.localdate().isoformat(),
+        language=translation.get_language(),
+        host=host.lower(),
+        city_slug=city_slug,
+    )
+
+
+def _widget_context(request, city, forecast_setting, multi_period):
+    from climweb.pages.home.models import HomeMapSettings
+
+    context = {}
+
+    home_settings = HomeMapSettings.for_request(request)
+    if forecast_setting.enable_auto_forecast and home_settings.show_forecast_attribution:
+        context.update({
+            "external_source_attribution": _(
+                "Forecast Data Source: %(forecast_source)s"
+            ) % {"forecast_source": "Yr.no"},
+            "external_source_url": "https://www.yr.no",
+        })
+
+    city_detail_page = forecast_setting.weather_detail_page
+    if city_detail_page:
+        # Try getting the city detail page URL. If it fails, ignore it.
+        # this is here because a different page than what is expected might be set
+        try:
+            city_detail_page = city_detail_page.specific
+            context["city_detail_page_url"] = city_detail_page.get_full_url(request) + city_detail_page.reverse_subpage(
+                "daily_table_for_city", kwargs={"city_slug": city.slug})
+        except Exception:
+            pass
+
+    context["city_search_url"] = get_full_url(request, reverse("cities-list"))
+
+    if forecast_setting.weather_reports_page:
+        context["weather_reports_page_url"] = forecast_setting.weather_reports_page.get_full_url(request)
+
+    data = get_city_forecast_detail_data(city, multi_period=multi_period, request=request, for_home_widget=True)
+
+    context.update({
+        "city": city,
+        "show_condition_label": forecast_setting.show_conditions_label_on_widget,
+        "use_period_labels": forecast_setting.use_period_labels,
+        **data,
+    })
+
+    return context
+
+
+def render_forecast_widget(request, city, forecast_setting):
+    """
+    The widget of a city, as {"html", "has_data"}, rendered with the single or
+    multiple period slider depending on the forecast periods.
+    """
+    multi_period = forecast_setting.periods.count() > 1
+    context = _widget_context(request, city, forecast_setting, multi_period)
+
+    if multi_period:
+        template_name = 'weather/widgets/location_forecast_multiple_slider.html'
+    else:
+        template_name = 'weather/widgets/location_forecast_single_slider.html'
+
+    return {
+        "html": render_to_string(template_name, context, request=request),
+        "has_data": bool(context.get("city_forecasts_by_date")),
+    }
+
+
+def get_forecast_widget(request, city, forecast_setting):
+    """The pre-rendered widget of a city, rendered now if it is missing"""
+    return cache_get_or_set(
+        forecast_widget_cache_key(_request_host(request), city.slug),
+        lambda: render_forecast_widget(request, city, forecast_setting),
+        CITY_FORECAST_DOCUMENT_TIMEOUT,
+    )
+
+
+def get_cached_forecast_widget(request, city_slug):
+    """The pre-rendered widget of a city, or None, without any database query"""
+    return wagcache.get(forecast_widget_cache_key(_request_host(request), city_slug))
+
+
+def _site_request(host, secure):
+    # widgets are rendered as for a visitor's request to the site, so their
+    # absolute URLs point to it
+    extra = {"HTTP_X_FORWARDED_PROTO": "https"} if secure else {}
+    return RequestFactory().get("/", HTTP_HOST=host, secure=secure, **extra)
+
+
+def prerender_forecast_widgets():
+    """
+    Render and store the widget of every city on every site, in every language,
+    for the current forecast version
+    """
+    cities = list(City.objects.all())
+
+    widgets = {}
+    for site in Site.objects.all():
+        host, secure = get_site_public_host(site)
+        request = _site_request(host, secure)
+        forecast_setting = ForecastSetting.for_site(site)
+
+        for language_code, _language_name in settings.LANGUAGES:
+            with translation.override(language_code):
+                request.LANGUAGE_CODE = language_code
+                for city in cities:
+                    try:
+                        widgets[forecast_widget_cache_key(host, city.slug)] = render_forecast_widget(
+                            request, city, forecast_setting)
+                    except Exception as e:
+                        logger.warning(f"[FORECAST] Could not render the forecast widget of {city.slug} "
+                                       f"on {host} ({language_code}): {e}")
+
+    wagcache.set_many(widgets, timeout=CITY_FORECAST_DOCUMENT_TIMEOUT)
+    logger.info(f"[FORECAST] Pre-rendered {len(widgets)} forecast widget(s)")
+    return len(widgets)